@@ -1,5 +1,5 @@
 from pydantic import BaseModel, conint
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import date
 
 class Watched(BaseModel):
@@ -36,6 +36,7 @@ class WantToWatch(BaseModel):
     tmdb_id: Optional[int] = None
     tmdb_rating: Optional[float] = None
     poster_url: Optional[str] = None
+    priority: Optional[float] = None
 
 class BlogPost(BaseModel):
     id: int
@@ -44,3 +45,11 @@ class BlogPost(BaseModel):
     slug: str
     body: str
     created_at: str
+
+class ItemRef(BaseModel):
+    table: Literal["watched", "want_to_watch"]
+    id: int
+
+class MergeRequest(BaseModel):
+    keep: ItemRef
+    duplicates: List[ItemRef]
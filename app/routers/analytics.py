@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+from app.services import analytics
+
+router = APIRouter()
+
+@router.get("/analytics/summary")
+def analytics_summary(year: Optional[int] = Query(None, ge=1900, le=2999)):
+    return analytics.summary(year)
+
+@router.get("/analytics/years")
+def analytics_years():
+    return analytics.years()
+
+@router.get("/analytics/monthly")
+def analytics_monthly(year: Optional[int] = Query(None, ge=1900, le=2999)):
+    return analytics.monthly(year)
+
+@router.get("/analytics/scores")
+def analytics_scores(by: str = "genre", year: Optional[int] = Query(None, ge=1900, le=2999)):
+    if by not in ("genre", "type"):
+        raise HTTPException(status_code=400, detail="by must be 'genre' or 'type'")
+    return analytics.score_distribution(by, year)
+
+@router.get("/analytics/year/{year}")
+def analytics_year(year: int):
+    review = analytics.year_in_review(year)
+    if review is None:
+        raise HTTPException(status_code=404, detail="Nothing watched that year")
+    return review
@@ -1,58 +1,79 @@
 import secrets
 import logging
-from fastapi import Depends, HTTPException, status
+import time
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from dotenv import load_dotenv, find_dotenv
-import os
+from app.services import sessions
+from app.services.logs import configure_logging
+from app.services.settings import settings
 
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-# Explicitly load the .env file from the app directory
-dotenv_path = find_dotenv(filename="app/.env", usecwd=True)
-if dotenv_path:
-    load_dotenv(dotenv_path=dotenv_path)
-    logger.info(f"Loaded .env file from: {dotenv_path}")
-    # Debug: Log what credentials are loaded (remove this in production)
-    loaded_username = os.getenv("BASIC_AUTH_USERNAME")
-    loaded_password = os.getenv("BASIC_AUTH_PASSWORD")
-    logger.info(f"DEBUG - Loaded BASIC_AUTH_USERNAME: '{loaded_username}'")
-    logger.info(f"DEBUG - Loaded BASIC_AUTH_PASSWORD: '{loaded_password}'")
-else:
-    logger.warning("WARNING: .env file not found or not loaded correctly.")
-
-security = HTTPBasic()
-
-def get_current_username(credentials: HTTPBasicCredentials = Depends(security)):
-    username = os.getenv("BASIC_AUTH_USERNAME")
-    password = os.getenv("BASIC_AUTH_PASSWORD")
-
-    # Debug logging (remove in production)
-    logger.info(f"DEBUG - Auth attempt - Provided username: '{credentials.username}'")
-    logger.info(f"DEBUG - Auth attempt - Expected username: '{username}'")
-    logger.info(f"DEBUG - Auth attempt - Provided password: '{credentials.password}'")
-    logger.info(f"DEBUG - Auth attempt - Expected password: '{password}'")
-
-    if not (username and password):
+# BASIC_AUTH_PASSWORD_HASH (see `manage.py hash-password`) takes precedence
+# over the plaintext BASIC_AUTH_PASSWORD.
+USERNAME = settings.basic_auth_username
+PASSWORD = sessions.PasswordChecker(
+    password=settings.basic_auth_password,
+    password_hash=settings.basic_auth_password_hash,
+)
+
+router = APIRouter()
+security = HTTPBasic(auto_error=False)
+
+def unauthorized() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Incorrect email or password",
+        headers={"WWW-Authenticate": "Basic"},
+    )
+
+def session_token(request: Request) -> Optional[str]:
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        return token.strip()
+    return request.cookies.get(sessions.COOKIE_NAME)
+
+def get_current_username(request: Request, credentials: Optional[HTTPBasicCredentials] = Depends(security)):
+    token = session_token(request)
+    session = sessions.verify(token) if token else None
+    if session is not None:
+        username, expires_at = session
+        # Sliding expiry: re-issue once half the lifetime has passed.
+        if expires_at - time.time() < sessions.SESSION_TTL / 2:
+            request.state.session_token = sessions.issue(username)
+        return username
+
+    if not (USERNAME and PASSWORD.configured):
         logger.error("BASIC_AUTH_USERNAME and BASIC_AUTH_PASSWORD environment variables not set!")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error: BASIC_AUTH_USERNAME and BASIC_AUTH_PASSWORD environment variables not set.",
         )
+    if credentials is None:
+        raise unauthorized()
 
-    correct_username = secrets.compare_digest(credentials.username, username)
-    correct_password = secrets.compare_digest(credentials.password, password)
-
-    logger.info(f"DEBUG - Username match: {correct_username}")
-    logger.info(f"DEBUG - Password match: {correct_password}")
+    correct_username = secrets.compare_digest(credentials.username.encode("utf-8"), USERNAME.encode("utf-8"))
+    correct_password = PASSWORD.check(credentials.password)
 
     if not (correct_username and correct_password):
-        logger.warning(f"Auth failed for user: '{credentials.username}'")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Basic"},
-        )
+        logger.warning("Auth failed", extra={"user": credentials.username})
+        raise unauthorized()
 
-    logger.info(f"Auth successful for user: '{credentials.username}'")
+    logger.debug("Auth successful", extra={"user": credentials.username})
+    request.state.session_token = sessions.issue(credentials.username)
     return credentials.username
+
+@router.post("/session")
+def create_session(request: Request, username: str = Depends(get_current_username)):
+    """Exchange Basic credentials (or a live session) for a fresh session token."""
+    token = sessions.issue(username)
+    request.state.session_token = token
+    return {"token": token, "token_type": "bearer", "expires_in": sessions.SESSION_TTL}
+
+@router.delete("/session")
+def delete_session(request: Request):
+    request.state.session_token = ""
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.models.models import MergeRequest
+from app.routers.auth import get_current_username
+from app.services import dedupe
+
+router = APIRouter(dependencies=[Depends(get_current_username)])
+
+@router.get("/dedupe/clusters")
+def duplicate_clusters(threshold: float = Query(dedupe.THRESHOLD, ge=0.5, le=1.0)):
+    return dedupe.scan(threshold)
+
+@router.post("/dedupe/merge")
+def merge_duplicates(request: MergeRequest):
+    try:
+        return dedupe.merge(
+            (request.keep.table, request.keep.id),
+            [(item.table, item.id) for item in request.duplicates],
+        )
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except dedupe.MergeError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
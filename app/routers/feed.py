@@ -0,0 +1,63 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.routers.auth import get_current_username
+from app.services import changes
+
+router = APIRouter(dependencies=[Depends(get_current_username)])
+
+POLL_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 15.0
+# Milliseconds the browser waits before reconnecting a dropped stream.
+RETRY_MS = 3000
+
+@router.get("/changes")
+def list_changes(since: Optional[int] = Query(None, ge=0), limit: int = Query(500, ge=1, le=5000)):
+    """Changes after ``since``; without it, just the current cursor to start from."""
+    return changes.feed(since, limit)
+
+@router.get("/changes/stream")
+async def stream_changes(request: Request, since: Optional[int] = Query(None, ge=0)):
+    # EventSource resends the last id it saw when it reconnects.
+    last_event_id = request.headers.get("last-event-id", "")
+    cursor = int(last_event_id) if last_event_id.isdigit() else since
+    return StreamingResponse(
+        change_events(request, cursor),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def event(name: str, data: dict, event_id: Optional[int] = None) -> str:
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines += [f"event: {name}", f"data: {json.dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+async def change_events(request: Request, cursor: Optional[int]):
+    batch = await run_in_threadpool(changes.feed, cursor)
+    yield f"retry: {RETRY_MS}\n\n"
+    yield event("ready", {"cursor": batch["cursor"]}, batch["cursor"])
+    idle = 0.0
+    while True:
+        if batch["reset"]:
+            yield event("reset", {"cursor": batch["cursor"]}, batch["cursor"])
+        for change in batch["changes"]:
+            yield event("change", change, change["id"])
+        cursor = batch["cursor"]
+        if batch["changes"] or batch["reset"]:
+            idle = 0.0
+        while not batch["more"]:
+            if await request.is_disconnected():
+                return
+            # ``sync`` is a single pragma while nothing was committed anywhere.
+            await run_in_threadpool(changes.sync)
+            if changes.bus.last_id > cursor:
+                break
+            await asyncio.sleep(POLL_INTERVAL)
+            idle += POLL_INTERVAL
+            if idle >= HEARTBEAT_INTERVAL:
+                yield ": keepalive\n\n"
+                idle = 0.0
+        batch = await run_in_threadpool(changes.feed, cursor)
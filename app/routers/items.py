@@ -1,44 +1,85 @@
 from fastapi import APIRouter, HTTPException, Depends, File, UploadFile, Form
 from app.models.models import Watched, WantToWatch, BlogPost
 from app.routers.auth import get_current_username
-from typing import List, Optional
+from app.services import metrics, textstore, title_index
+from app.services.logs import configure_logging
+from app.services.settings import settings
+from typing import Dict, List, Optional
 import shutil
-from PIL import Image
 from datetime import date, datetime
 import sqlite3
 from pathlib import Path
 from uuid import uuid4
 import re
-import os
 import json
+import unicodedata
 import logging
-from urllib.request import urlopen, Request
+from time import perf_counter
 from urllib.parse import urlencode, quote_plus
-from dotenv import load_dotenv, find_dotenv
 
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-DB_PATH = "app/data/app.db"
+DB_PATH = settings.db_path
 IMAGES_DIR = "app/static/images"
+TMDB_API_BASE = settings.tmdb_api_base
+# Bump when init_db changes; databases already at this version skip the DDL on startup.
+SCHEMA_VERSION = 9
+# Listing pages and feeds only need the start of each body, kept in blog_posts.excerpt.
+BLOG_EXCERPT_CHARS = 480
 
-dotenv_path = find_dotenv(filename="app/.env", usecwd=True)
-if dotenv_path:
-    load_dotenv(dotenv_path=dotenv_path)
-    logger.info(f"Loaded .env file from: {dotenv_path}")
-else:
-    logger.warning("WARNING: .env file not found or not loaded correctly.")
+# Row writes are journaled into `changes` by triggers so every process sees them
+# (see app/services/changes.py). want_to_watch.priority is derived data that each
+# worker recomputes itself, so updates touching only it are not journaled; neither
+# are title_key backfills or row_version bumps.
+JOURNALED_COLUMNS = {
+    "watched": (
+        "title, comment, score, image_url, watch_date, content_type, season, synopsis, release_year, "
+        "release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank"
+    ),
+    "want_to_watch": (
+        "title, image_url, launch_date, excitement, content_type, season, synopsis, "
+        "release_year, runtime, genres, tmdb_id, tmdb_rating, poster_url"
+    ),
+    "blog_posts": None,
+}
+
+_change_listeners = []
+
+def on_change(listener):
+    """Register ``listener(table, action, item_id)`` to run after a row is written."""
+    _change_listeners.append(listener)
+    return listener
+
+def notify_change(table: str, action: str, item_id: int):
+    for listener in _change_listeners:
+        try:
+            listener(table, action, item_id)
+        except Exception:
+            logger.exception("Change listener failed for %s %s id=%s", table, action, item_id)
 
 def get_connection():
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, factory=metrics.connection_factory())
     conn.row_factory = sqlite3.Row
+    textstore.register(conn)
     return conn
 
 def init_db():
-    Path("app/data").mkdir(parents=True, exist_ok=True)
+    Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
     with get_connection() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
+        # Only takes effect on a new file; `manage.py maintenance compact` converts old ones.
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        # WAL lets worker processes read while another one writes.
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Migrations below rewrite existing rows; journaling each one would only
+        # flood `changes`. create_change_journal puts the triggers back.
+        for table in JOURNALED_COLUMNS:
+            for action in ("insert", "update", "delete"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {table}_journal_{action}")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS watched (
@@ -87,12 +128,33 @@ def init_db():
                 watched_id INTEGER NOT NULL,
                 title TEXT NOT NULL,
                 slug TEXT NOT NULL UNIQUE,
-                body TEXT NOT NULL,
+                excerpt TEXT NOT NULL DEFAULT '',
                 created_at TEXT NOT NULL,
                 FOREIGN KEY (watched_id) REFERENCES watched(id) ON DELETE CASCADE
             )
             """
         )
+        # Full bodies are only read by the post page and the CRM, so they live
+        # compressed in their own table and list scans never touch them.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blog_bodies (
+                post_id INTEGER PRIMARY KEY,
+                codec TEXT NOT NULL,
+                data BLOB NOT NULL,
+                FOREIGN KEY (post_id) REFERENCES blog_posts(id) ON DELETE CASCADE
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS blog_posts_drop_body AFTER DELETE ON blog_posts BEGIN
+                DELETE FROM blog_bodies WHERE post_id = old.id;
+            END
+            """
+        )
+        move_blog_bodies(conn)
+        refresh_blog_excerpts(conn)
         ensure_column(conn, "watched", "season", "INTEGER")
         ensure_column(conn, "want_to_watch", "season", "INTEGER")
         ensure_column(conn, "watched", "synopsis", "TEXT")
@@ -111,9 +173,307 @@ def init_db():
         ensure_column(conn, "want_to_watch", "tmdb_id", "INTEGER")
         ensure_column(conn, "want_to_watch", "tmdb_rating", "REAL")
         ensure_column(conn, "want_to_watch", "poster_url", "TEXT")
+        ensure_column(conn, "want_to_watch", "priority", "REAL")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_want_to_watch_priority ON want_to_watch(priority DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_blog_posts_created_at ON blog_posts(created_at)")
+        for table in DEDUPE_TABLES:
+            ensure_column(conn, table, "title_key", "TEXT")
+            backfill_title_keys(conn, table)
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_title_key ON {table}(title_key)")
+        ensure_unique_indexes(conn)
+        create_change_journal(conn)
+        create_row_versions(conn)
+        create_watch_rollups(conn)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS maintenance_tasks (
+                task TEXT PRIMARY KEY,
+                next_run_at REAL NOT NULL,
+                last_started_at TEXT,
+                last_seconds REAL,
+                last_status TEXT,
+                last_detail TEXT
+            )
+            """
+        )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
 
+def move_blog_bodies(conn: sqlite3.Connection):
+    """Move bodies stored inline in ``blog_posts`` (schema 4 and older) into ``blog_bodies``."""
+    if "body" not in {row["name"] for row in conn.execute("PRAGMA table_info(blog_posts)")}:
+        return
+    ensure_column(conn, "blog_posts", "excerpt", "TEXT NOT NULL DEFAULT ''")
+    posts = conn.execute("SELECT id, body FROM blog_posts").fetchall()
+    conn.executemany(
+        "INSERT OR REPLACE INTO blog_bodies (post_id, codec, data) VALUES (?, ?, ?)",
+        [(post["id"], *textstore.pack(post["body"])) for post in posts],
+    )
+    conn.execute("ALTER TABLE blog_posts DROP COLUMN body")
+    logger.info("Moved %d blog bodies into blog_bodies", len(posts))
+
+def refresh_blog_excerpts(conn: sqlite3.Connection) -> int:
+    """Rebuild every excerpt from its body; before schema 9 they were raw 480-character cuts."""
+    posts = conn.execute("SELECT post_id, unpack_text(codec, data) AS body FROM blog_bodies").fetchall()
+    conn.executemany(
+        "UPDATE blog_posts SET excerpt = ? WHERE id = ?",
+        [(blog_excerpt(post["body"]), post["post_id"]) for post in posts],
+    )
+    return len(posts)
+
+def save_blog_body(conn: sqlite3.Connection, post_id: int, body: str):
+    codec, data = textstore.pack(body)
+    conn.execute(
+        """
+        INSERT INTO blog_bodies (post_id, codec, data) VALUES (?, ?, ?)
+        ON CONFLICT(post_id) DO UPDATE SET codec = excluded.codec, data = excluded.data
+        """,
+        (post_id, codec, data),
+    )
+
+# Markdown that would dangle if an excerpt ended inside it, reduced to its text.
+MARKDOWN_INLINE = [
+    (re.compile(r"^(```|~~~).*?(^\1[^\n]*$|\Z)", re.S | re.M), ""),
+    (re.compile(r"!?\[([^\]]*)\](\([^)]*\)|\[[^\]]*\])"), r"\1"),
+    (re.compile(r"<(https?://[^>\s]+)>"), r"\1"),
+    (re.compile(r"</?[A-Za-z][^>]*>"), ""),
+    (re.compile(r"^\s{0,3}(#{1,6}\s+|>\s?|[-*+]\s+|\d+[.)]\s+)", re.M), ""),
+    (re.compile(r"(\*\*|__|~~|\*|`|\b_|_\b)"), ""),
+]
+
+def blog_excerpt(body: str, limit: int = BLOG_EXCERPT_CHARS) -> str:
+    """Plain-text start of a markdown ``body``, at most ``limit`` characters.
+
+    Markup is stripped first so the cut can never leave a link, emphasis or
+    code fence open; the text then ends at the last paragraph break, or failing
+    that the last space, before ``limit``.
+    """
+    text = body.replace("\r\n", "\n")
+    for pattern, replacement in MARKDOWN_INLINE:
+        text = pattern.sub(replacement, text)
+    paragraphs = [" ".join(block.split()) for block in re.split(r"\n\s*\n", text)]
+    text = "\n\n".join(paragraph for paragraph in paragraphs if paragraph)
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 1]
+    boundary = cut.rfind("\n\n")
+    if boundary < limit // 2:
+        boundary = cut.rfind(" ")
+    if boundary > 0:
+        cut = cut[:boundary]
+    return cut.rstrip() + "…"
+
+# Tables guarded against duplicate titles, with a label for error messages.
+DEDUPE_TABLES = {"watched": "watched", "want_to_watch": "want to watch"}
+
+def normalize_title(title: str) -> str:
+    """Comparison key for duplicate checks: no accents, case, punctuation or leading article."""
+    text = unicodedata.normalize("NFKD", title)
+    text = "".join(char for char in text if not unicodedata.combining(char)).lower().replace("&", " and ")
+    words = re.findall(r"[^\W_]+", text)
+    if len(words) > 1 and words[0] in ("the", "a", "an"):
+        words = words[1:]
+    return " ".join(words)
+
+def backfill_title_keys(conn: sqlite3.Connection, table: str) -> int:
+    rows = conn.execute(f"SELECT id, title FROM {table} WHERE title_key IS NULL").fetchall()
+    conn.executemany(
+        f"UPDATE {table} SET title_key = ? WHERE id = ?",
+        [(normalize_title(row["title"]), row["id"]) for row in rows],
+    )
+    return len(rows)
+
+def ensure_unique_indexes(conn: sqlite3.Connection) -> Dict[str, bool]:
+    """Add the unique (tmdb_id, season) index to each table that has no duplicates left.
+
+    Returns whether each table has the index; tables still holding duplicates
+    keep relying on ``find_duplicates`` until the dedupe merge cleans them up.
+    """
+    present = {}
+    for table in DEDUPE_TABLES:
+        index = f"idx_{table}_tmdb_season"
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index,)).fetchone():
+            present[table] = True
+            continue
+        duplicated = conn.execute(
+            f"""
+            SELECT 1 FROM {table} WHERE tmdb_id IS NOT NULL
+            GROUP BY tmdb_id, IFNULL(season, 0) HAVING COUNT(*) > 1 LIMIT 1
+            """
+        ).fetchone()
+        if duplicated:
+            logger.warning("%s has duplicate tmdb_id/season rows; see /api/dedupe/clusters", table)
+            present[table] = False
+            continue
+        conn.execute(
+            f"CREATE UNIQUE INDEX {index} ON {table}(tmdb_id, IFNULL(season, 0)) WHERE tmdb_id IS NOT NULL"
+        )
+        present[table] = True
+    return present
+
+def find_duplicates(conn: sqlite3.Connection, table: str, title: str, season: Optional[int],
+                    tmdb_id: Optional[int], release_year: Optional[int],
+                    exclude_id: Optional[int] = None) -> List[sqlite3.Row]:
+    """Rows of ``table`` that are the same title: same TMDB id and season, or the
+    same normalised title and season where at most one side has a TMDB id and the
+    release years do not disagree."""
+    return conn.execute(
+        f"""
+        SELECT id, title FROM {table}
+        WHERE ((tmdb_id = :tmdb_id AND IFNULL(season, 0) = :season)
+               OR (title_key = :title_key AND IFNULL(season, 0) = :season
+                   AND (tmdb_id IS NULL OR :tmdb_id IS NULL)
+                   AND (release_year IS NULL OR :release_year IS NULL OR release_year = :release_year)))
+          AND id != :exclude_id
+        """,
+        {
+            "tmdb_id": tmdb_id,
+            "season": season or 0,
+            "title_key": normalize_title(title),
+            "release_year": release_year,
+            "exclude_id": exclude_id or 0,
+        },
+    ).fetchall()
+
+def reject_duplicate(conn: sqlite3.Connection, table: str, title: str, season: Optional[int],
+                     tmdb_id: Optional[int], release_year: Optional[int], exclude_id: Optional[int] = None):
+    duplicates = find_duplicates(conn, table, title, season, tmdb_id, release_year, exclude_id)
+    if duplicates:
+        duplicate = duplicates[0]
+        logger.warning("Duplicate of %s id=%s rejected: %r", table, duplicate["id"], title)
+        raise HTTPException(
+            status_code=409,
+            detail=f"Already in {DEDUPE_TABLES[table]} as #{duplicate['id']} ({duplicate['title']})",
+        )
+
+def create_change_journal(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            action TEXT NOT NULL,
+            item_id INTEGER NOT NULL,
+            changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+        )
+        """
+    )
+    for table, columns in JOURNALED_COLUMNS.items():
+        update_of = f"UPDATE OF {columns}" if columns else "UPDATE"
+        for action, event, row in (("insert", "INSERT", "new"), ("update", update_of, "new"), ("delete", "DELETE", "old")):
+            conn.execute(f"DROP TRIGGER IF EXISTS {table}_journal_{action}")
+            conn.execute(
+                f"""
+                CREATE TRIGGER {table}_journal_{action} AFTER {event} ON {table} BEGIN
+                    INSERT INTO changes (table_name, action, item_id) VALUES ('{table}', '{action}', {row}.id);
+                END
+                """
+            )
+# Page templates cache each rendered card under its row_version (see
+# app/services/fragments.py), bumped whenever a journaled column changes.
+ROW_VERSIONED = ("watched", "want_to_watch")
+
+def create_row_versions(conn: sqlite3.Connection):
+    for table in ROW_VERSIONED:
+        ensure_column(conn, table, "row_version", "INTEGER NOT NULL DEFAULT 0")
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_row_version")
+        conn.execute(
+            f"""
+            CREATE TRIGGER {table}_row_version AFTER UPDATE OF {JOURNALED_COLUMNS[table]} ON {table} BEGIN
+                UPDATE {table} SET row_version = old.row_version + 1 WHERE id = new.id;
+            END
+            """
+        )
+
+# Analytics rollups of `watched` (see app/services/analytics.py). One row per
+# dimension, year, bucket and score, kept current by triggers so dashboards
+# never scan the history. Updates that touch none of these columns skip them.
+ROLLUP_COLUMNS = "watch_date, score, runtime, content_type, genres, season"
+
+def rollup_select(row: str, source: str = "") -> str:
+    """(item_id, dimension, period, bucket, score, minutes, seasons) rows contributed by ``row``.
+
+    ``row`` is ``new``/``old`` inside a trigger, or an alias of ``source`` for a full scan.
+    """
+    # "Drama, Crime" -> ["Drama"," Crime"], with quotes and backslashes escaped so any name is valid JSON.
+    genres = rf"""'["' || replace(replace(replace({row}.genres, '\', '\\'), '"', '\"'), ',', '","') || '"]'"""
+    parts = [
+        ("'month'", f"substr({row}.watch_date, 1, 7)", source),
+        ("'type'", f"{row}.content_type", source),
+        ("'genre'", "trim(genre.value)", ", ".join(filter(None, [
+            source, f"json_each(CASE WHEN json_valid({genres}) THEN {genres} ELSE '[]' END) AS genre"
+        ]))),
+    ]
+    return " UNION ALL ".join(
+        f"SELECT DISTINCT {row}.id AS item_id, {dimension} AS dimension, substr({row}.watch_date, 1, 4) AS period, "
+        f"{bucket} AS bucket, {row}.score AS score, COALESCE({row}.runtime, 0) AS minutes, "
+        f"{row}.season IS NOT NULL AS seasons"
+        + (f" FROM {tables}" if tables else "")
+        + (" WHERE trim(genre.value) != ''" if dimension == "'genre'" else "")
+        for dimension, bucket, tables in parts
+    )
+
+def rollup_upsert(row: str, sign: int) -> str:
+    return f"""
+        INSERT INTO watch_rollups (dimension, period, bucket, score, titles, minutes, seasons)
+        SELECT dimension, period, bucket, score, {sign}, {sign} * minutes, {sign} * seasons
+        FROM ({rollup_select(row)}) WHERE true
+        ON CONFLICT (dimension, period, bucket, score) DO UPDATE SET
+            titles = titles + excluded.titles,
+            minutes = minutes + excluded.minutes,
+            seasons = seasons + excluded.seasons;
+    """
+
+def create_watch_rollups(conn: sqlite3.Connection):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS watch_rollups (
+            dimension TEXT NOT NULL,
+            period TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            titles INTEGER NOT NULL,
+            minutes INTEGER NOT NULL,
+            seasons INTEGER NOT NULL,
+            PRIMARY KEY (dimension, period, bucket, score)
+        ) WITHOUT ROWID
+        """
+    )
+    triggers = {
+        "insert": ("INSERT", rollup_upsert("new", 1)),
+        "update": (f"UPDATE OF {ROLLUP_COLUMNS}", rollup_upsert("old", -1) + rollup_upsert("new", 1)),
+        "delete": ("DELETE", rollup_upsert("old", -1)),
+    }
+    for action, (event, body) in triggers.items():
+        conn.execute(f"DROP TRIGGER IF EXISTS watched_rollup_{action}")
+        conn.execute(f"CREATE TRIGGER watched_rollup_{action} AFTER {event} ON watched BEGIN {body} END")
+    rebuild_watch_rollups(conn)
+
+def computed_watch_rollups(conn: sqlite3.Connection) -> List[tuple]:
+    """Rollup rows computed from scratch with a full scan of ``watched``."""
+    return conn.execute(
+        f"""
+        SELECT dimension, period, bucket, score, COUNT(*), SUM(minutes), SUM(seasons)
+        FROM ({rollup_select("w", "watched w")})
+        GROUP BY dimension, period, bucket, score
+        ORDER BY dimension, period, bucket, score
+        """
+    ).fetchall()
+
+def rebuild_watch_rollups(conn: sqlite3.Connection) -> int:
+    rows = computed_watch_rollups(conn)
+    conn.execute("DELETE FROM watch_rollups")
+    conn.executemany("INSERT INTO watch_rollups VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
 def save_and_resize_image(image_file: UploadFile, output_path: str):
+    with metrics.timer(metrics.IMAGE_RESIZE_DURATION, timing="image"):
+        crop_image(image_file, output_path)
+
+def crop_image(image_file: UploadFile, output_path: str):
+    # Pillow is only needed for uploads, so keep it out of application startup.
+    from PIL import Image
+
     with open(output_path, "wb") as buffer:
         shutil.copyfileobj(image_file.file, buffer)
     
@@ -146,13 +506,16 @@ def ensure_column(conn: sqlite3.Connection, table: str, column: str, column_type
         conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
 
 def get_tmdb_key() -> str:
-    api_key = os.getenv("TMDB_API_KEY")
+    api_key = settings.tmdb_api_key
     if not api_key:
         logger.error("TMDB_API_KEY is missing. Check app/.env.")
         raise HTTPException(status_code=500, detail="TMDB API key is not configured")
     return api_key
 
 def tmdb_request(endpoint: str, params: dict) -> dict:
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+
     api_key = get_tmdb_key()
 
     # Check if this is a JWT token (Read Access Token) or v3 API key
@@ -160,7 +523,7 @@ def tmdb_request(endpoint: str, params: dict) -> dict:
 
     if is_bearer_token:
         # Use Bearer token authentication (for Read Access Tokens)
-        url = f"https://api.themoviedb.org/3{endpoint}"
+        url = f"{TMDB_API_BASE}{endpoint}"
         if params:
             query = urlencode(params, quote_via=quote_plus)
             url = f"{url}?{query}"
@@ -168,18 +531,27 @@ def tmdb_request(endpoint: str, params: dict) -> dict:
             "Accept": "application/json",
             "Authorization": f"Bearer {api_key}"
         }
-        logger.info(f"Using Bearer token authentication for TMDB request to {endpoint}")
+        logger.debug("TMDB request to %s with bearer token", endpoint)
     else:
         # Use API key in query parameter (for v3 API keys)
         params["api_key"] = api_key
         query = urlencode(params, quote_via=quote_plus)
-        url = f"https://api.themoviedb.org/3{endpoint}?{query}"
+        url = f"{TMDB_API_BASE}{endpoint}?{query}"
         headers = {"Accept": "application/json"}
-        logger.info(f"Using API key authentication for TMDB request to {endpoint}")
+        logger.debug("TMDB request to %s with API key", endpoint)
 
     request = Request(url, headers=headers)
-    with urlopen(request, timeout=10) as response:
-        return json.loads(response.read().decode("utf-8"))
+    start = perf_counter()
+    status = "error"
+    try:
+        with urlopen(request, timeout=10) as response:
+            status = str(response.status)
+            return json.loads(response.read().decode("utf-8"))
+    except HTTPError as exc:
+        status = str(exc.code)
+        raise
+    finally:
+        metrics.record_tmdb_request(endpoint, status, perf_counter() - start)
 
 def tmdb_poster_url(path: Optional[str]) -> Optional[str]:
     if not path:
@@ -218,14 +590,88 @@ def get_blog_slug_map(watched_ids: List[int]) -> dict:
     return {row["watched_id"]: row["slug"] for row in rows}
 
 def get_blog_posts() -> List[dict]:
+    """Every post with its full body, for the CRM; public pages use ``get_blog_page``."""
     with get_connection() as conn:
         rows = conn.execute(
             """
-            SELECT b.id, b.watched_id, b.title, b.slug, b.body, b.created_at,
+            SELECT b.id, b.watched_id, b.title, b.slug, unpack_text(t.codec, t.data) AS body, b.created_at,
+                   w.poster_url, w.image_url, w.score, w.release_year, w.genres, w.tmdb_rating, w.content_type
+            FROM blog_posts b
+            JOIN watched w ON b.watched_id = w.id
+            LEFT JOIN blog_bodies t ON t.post_id = b.id
+            ORDER BY b.created_at DESC
+            """
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+def get_blog_slugs() -> List[str]:
+    with get_connection() as conn:
+        return [row["slug"] for row in conn.execute("SELECT slug FROM blog_posts ORDER BY created_at DESC")]
+
+def blog_filters(month: Optional[str] = None, content_type: Optional[str] = None,
+                 genre: Optional[str] = None) -> tuple:
+    clauses, params = [], []
+    if month:
+        # A range rather than substr() so idx_blog_posts_created_at applies.
+        year, month_number = (int(part) for part in month.split("-"))
+        following = f"{year + 1}-01" if month_number == 12 else f"{year}-{month_number + 1:02d}"
+        clauses.append("b.created_at >= ? AND b.created_at < ?")
+        params.extend([month, following])
+    if content_type:
+        clauses.append("w.content_type = ?")
+        params.append(content_type)
+    if genre:
+        # genres is stored as "Drama, Crime"; match whole names only.
+        clauses.append("(',' || replace(w.genres, ', ', ',') || ',') LIKE ?")
+        params.append(f"%,{genre},%")
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+def get_blog_page(limit: int, offset: int = 0, month: Optional[str] = None, content_type: Optional[str] = None,
+                  genre: Optional[str] = None) -> List[dict]:
+    where, params = blog_filters(month, content_type, genre)
+    with get_connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT b.id, b.watched_id, b.title, b.slug, b.excerpt, b.created_at,
                    w.poster_url, w.image_url, w.score, w.release_year, w.genres, w.tmdb_rating, w.content_type
             FROM blog_posts b
             JOIN watched w ON b.watched_id = w.id
+            {where}
             ORDER BY b.created_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            [*params, limit, offset],
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+def count_blog_posts(month: Optional[str] = None) -> int:
+    where, params = blog_filters(month)
+    with get_connection() as conn:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM blog_posts b JOIN watched w ON b.watched_id = w.id{where}", params
+        ).fetchone()[0]
+
+def get_blog_months() -> List[dict]:
+    with get_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT substr(b.created_at, 1, 7) AS month, COUNT(*) AS posts
+            FROM blog_posts b
+            JOIN watched w ON b.watched_id = w.id
+            GROUP BY month
+            ORDER BY month DESC
+            """
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+def get_blog_tags() -> List[dict]:
+    """Distinct (content_type, genres) pairs of posts, for building feed variants."""
+    with get_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT DISTINCT w.content_type, w.genres
+            FROM blog_posts b
+            JOIN watched w ON b.watched_id = w.id
             """
         ).fetchall()
     return [dict(row) for row in rows]
@@ -234,11 +680,12 @@ def get_blog_post_by_slug(slug: str) -> Optional[dict]:
     with get_connection() as conn:
         row = conn.execute(
             """
-            SELECT b.id, b.watched_id, b.title, b.slug, b.body, b.created_at,
+            SELECT b.id, b.watched_id, b.title, b.slug, unpack_text(t.codec, t.data) AS body, b.created_at,
                    w.title as movie_title, w.image_url, w.score, w.release_year, w.poster_url,
                    w.content_type, w.season, w.synopsis, w.runtime, w.genres, w.tmdb_rating, w.watch_date
             FROM blog_posts b
             JOIN watched w ON b.watched_id = w.id
+            LEFT JOIN blog_bodies t ON t.post_id = b.id
             WHERE b.slug = ?
             """,
             (slug,),
@@ -252,7 +699,8 @@ def get_top_list():
         rows = conn.execute(
             """
             SELECT id, title, comment, score, image_url, watch_date, content_type, season,
-                   synopsis, release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank
+                   synopsis, release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank,
+                   row_version
             FROM watched
             WHERE top_rank IS NOT NULL
             ORDER BY top_rank ASC
@@ -266,7 +714,8 @@ def get_watched_list():
         rows = conn.execute(
             """
             SELECT id, title, comment, score, image_url, watch_date, content_type, season,
-                   synopsis, release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank
+                   synopsis, release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank,
+                   row_version
             FROM watched
             WHERE top_rank IS NULL
             ORDER BY watch_date DESC
@@ -302,6 +751,9 @@ def add_to_watched_list(
     has_image_file = image_file is not None and bool(image_file.filename)
     if not has_image_url and not has_image_file:
         raise HTTPException(status_code=400, detail="Either image_url or image_file must be provided")
+    # Checked before the upload is saved so a rejected duplicate leaves no file behind.
+    with get_connection() as conn:
+        reject_duplicate(conn, "watched", title, season, tmdb_id, release_year)
 
     if has_image_file:
         image_filename = f"{uuid4().hex}_{image_file.filename}"
@@ -313,35 +765,46 @@ def add_to_watched_list(
         poster_url = poster_url or image_url
 
     with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            INSERT INTO watched (
-                title, comment, score, image_url, watch_date, content_type, season,
-                synopsis, release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank
+        try:
+            cursor = conn.execute(
+                """
+                INSERT INTO watched (
+                    title, comment, score, image_url, watch_date, content_type, season, synopsis,
+                    release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank, title_key
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    title,
+                    comment,
+                    score,
+                    image_url,
+                    str(watch_date),
+                    content_type,
+                    season,
+                    synopsis,
+                    release_year,
+                    str(release_date) if release_date else None,
+                    runtime,
+                    genres,
+                    tmdb_id,
+                    tmdb_rating,
+                    poster_url,
+                    top_rank,
+                    normalize_title(title),
+                ),
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                title,
-                comment,
-                score,
-                image_url,
-                str(watch_date),
-                content_type,
-                season,
-                synopsis,
-                release_year,
-                str(release_date) if release_date else None,
-                runtime,
-                genres,
-                tmdb_id,
-                tmdb_rating,
-                poster_url,
-                top_rank,
-            ),
-        )
-        conn.commit()
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=409, detail="Already in watched")
         item_id = cursor.lastrowid
+        # A title moves off the queue once it has been watched.
+        moved = [row["id"] for row in find_duplicates(conn, "want_to_watch", title, season, tmdb_id, release_year)]
+        conn.executemany("DELETE FROM want_to_watch WHERE id = ?", [(queued_id,) for queued_id in moved])
+        conn.commit()
+    notify_change("watched", "insert", item_id)
+    for queued_id in moved:
+        logger.info("Removed want_to_watch id=%s now that it is watched", queued_id, extra={"watched_id": item_id})
+        notify_change("want_to_watch", "delete", queued_id)
     return Watched(
         id=item_id,
         title=title,
@@ -364,37 +827,49 @@ def add_to_watched_list(
 
 @router.put("/watched/{item_id}", response_model=Watched, dependencies=[Depends(get_current_username)])
 def update_watched_item(item_id: int, updated_item: Watched):
+    if updated_item.content_type != "TV Series":
+        updated_item.season = None
     with get_connection() as conn:
-        result = conn.execute(
-            """
-            UPDATE watched
-            SET title = ?, comment = ?, score = ?, image_url = ?, watch_date = ?, content_type = ?, season = ?,
-                synopsis = ?, release_year = ?, release_date = ?, runtime = ?, genres = ?, tmdb_id = ?, tmdb_rating = ?, poster_url = ?, top_rank = ?
-            WHERE id = ?
-            """,
-            (
-                updated_item.title,
-                updated_item.comment,
-                updated_item.score,
-                updated_item.image_url,
-                str(updated_item.watch_date),
-                updated_item.content_type,
-                updated_item.season,
-                updated_item.synopsis,
-                updated_item.release_year,
-                str(updated_item.release_date) if updated_item.release_date else None,
-                updated_item.runtime,
-                updated_item.genres,
-                updated_item.tmdb_id,
-                updated_item.tmdb_rating,
-                updated_item.poster_url,
-                updated_item.top_rank,
-                item_id,
-            ),
+        reject_duplicate(
+            conn, "watched", updated_item.title, updated_item.season, updated_item.tmdb_id,
+            updated_item.release_year, exclude_id=item_id,
         )
+        try:
+            result = conn.execute(
+                """
+                UPDATE watched
+                SET title = ?, comment = ?, score = ?, image_url = ?, watch_date = ?, content_type = ?, season = ?,
+                    synopsis = ?, release_year = ?, release_date = ?, runtime = ?, genres = ?, tmdb_id = ?, tmdb_rating = ?, poster_url = ?, top_rank = ?,
+                    title_key = ?
+                WHERE id = ?
+                """,
+                (
+                    updated_item.title,
+                    updated_item.comment,
+                    updated_item.score,
+                    updated_item.image_url,
+                    str(updated_item.watch_date),
+                    updated_item.content_type,
+                    updated_item.season,
+                    updated_item.synopsis,
+                    updated_item.release_year,
+                    str(updated_item.release_date) if updated_item.release_date else None,
+                    updated_item.runtime,
+                    updated_item.genres,
+                    updated_item.tmdb_id,
+                    updated_item.tmdb_rating,
+                    updated_item.poster_url,
+                    updated_item.top_rank,
+                    normalize_title(updated_item.title),
+                    item_id,
+                ),
+            )
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=409, detail="Already in watched")
         conn.commit()
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Item not found")
+    notify_change("watched", "update", item_id)
     updated_item.id = item_id
     return updated_item
 
@@ -405,17 +880,25 @@ def delete_watched_item(item_id: int):
         conn.commit()
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Item not found")
+    notify_change("watched", "delete", item_id)
     return {"message": "Item deleted successfully"}
 
+WANT_TO_WATCH_ORDER = {
+    "launch_date": "launch_date DESC",
+    "priority": "priority DESC NULLS LAST, launch_date DESC",
+}
+
 @router.get("/want-to-watch", response_model=List[WantToWatch])
-def get_want_to_watch_list():
+def get_want_to_watch_list(order: str = "launch_date"):
+    if order not in WANT_TO_WATCH_ORDER:
+        raise HTTPException(status_code=400, detail="Unsupported order")
     with get_connection() as conn:
         rows = conn.execute(
-            """
+            f"""
             SELECT id, title, image_url, launch_date, excitement, content_type, season,
-                   synopsis, release_year, runtime, genres, tmdb_id, tmdb_rating, poster_url
+                   synopsis, release_year, runtime, genres, tmdb_id, tmdb_rating, poster_url, priority, row_version
             FROM want_to_watch
-            ORDER BY launch_date DESC
+            ORDER BY {WANT_TO_WATCH_ORDER[order]}
             """
         ).fetchall()
     return [dict(row) for row in rows]
@@ -445,6 +928,9 @@ def add_to_want_to_watch_list(
     has_image_file = image_file is not None and bool(image_file.filename)
     if not has_image_url and not has_image_file:
         raise HTTPException(status_code=400, detail="Either image_url or image_file must be provided")
+    with get_connection() as conn:
+        for table in DEDUPE_TABLES:
+            reject_duplicate(conn, table, title, season, tmdb_id, release_year)
 
     if has_image_file:
         image_filename = f"{uuid4().hex}_{image_file.filename}"
@@ -456,32 +942,37 @@ def add_to_want_to_watch_list(
         poster_url = poster_url or image_url
 
     with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            INSERT INTO want_to_watch (
-                title, image_url, launch_date, excitement, content_type, season,
-                synopsis, release_year, runtime, genres, tmdb_id, tmdb_rating, poster_url
+        try:
+            cursor = conn.execute(
+                """
+                INSERT INTO want_to_watch (
+                    title, image_url, launch_date, excitement, content_type, season,
+                    synopsis, release_year, runtime, genres, tmdb_id, tmdb_rating, poster_url, title_key
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    title,
+                    image_url,
+                    str(launch_date),
+                    excitement,
+                    content_type,
+                    season,
+                    synopsis,
+                    release_year,
+                    runtime,
+                    genres,
+                    tmdb_id,
+                    tmdb_rating,
+                    poster_url,
+                    normalize_title(title),
+                ),
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                title,
-                image_url,
-                str(launch_date),
-                excitement,
-                content_type,
-                season,
-                synopsis,
-                release_year,
-                runtime,
-                genres,
-                tmdb_id,
-                tmdb_rating,
-                poster_url,
-            ),
-        )
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=409, detail="Already in want to watch")
         conn.commit()
         item_id = cursor.lastrowid
+    notify_change("want_to_watch", "insert", item_id)
     return WantToWatch(
         id=item_id,
         title=title,
@@ -501,34 +992,46 @@ def add_to_want_to_watch_list(
 
 @router.put("/want-to-watch/{item_id}", response_model=WantToWatch, dependencies=[Depends(get_current_username)])
 def update_want_to_watch_item(item_id: int, updated_item: WantToWatch):
+    if updated_item.content_type != "TV Series":
+        updated_item.season = None
     with get_connection() as conn:
-        result = conn.execute(
-            """
-            UPDATE want_to_watch
-            SET title = ?, image_url = ?, launch_date = ?, excitement = ?, content_type = ?, season = ?,
-                synopsis = ?, release_year = ?, runtime = ?, genres = ?, tmdb_id = ?, tmdb_rating = ?, poster_url = ?
-            WHERE id = ?
-            """,
-            (
-                updated_item.title,
-                updated_item.image_url,
-                str(updated_item.launch_date),
-                updated_item.excitement,
-                updated_item.content_type,
-                updated_item.season,
-                updated_item.synopsis,
-                updated_item.release_year,
-                updated_item.runtime,
-                updated_item.genres,
-                updated_item.tmdb_id,
-                updated_item.tmdb_rating,
-                updated_item.poster_url,
-                item_id,
-            ),
+        reject_duplicate(
+            conn, "want_to_watch", updated_item.title, updated_item.season, updated_item.tmdb_id,
+            updated_item.release_year, exclude_id=item_id,
         )
+        try:
+            result = conn.execute(
+                """
+                UPDATE want_to_watch
+                SET title = ?, image_url = ?, launch_date = ?, excitement = ?, content_type = ?, season = ?,
+                    synopsis = ?, release_year = ?, runtime = ?, genres = ?, tmdb_id = ?, tmdb_rating = ?, poster_url = ?,
+                    title_key = ?
+                WHERE id = ?
+                """,
+                (
+                    updated_item.title,
+                    updated_item.image_url,
+                    str(updated_item.launch_date),
+                    updated_item.excitement,
+                    updated_item.content_type,
+                    updated_item.season,
+                    updated_item.synopsis,
+                    updated_item.release_year,
+                    updated_item.runtime,
+                    updated_item.genres,
+                    updated_item.tmdb_id,
+                    updated_item.tmdb_rating,
+                    updated_item.poster_url,
+                    normalize_title(updated_item.title),
+                    item_id,
+                ),
+            )
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=409, detail="Already in want to watch")
         conn.commit()
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Item not found")
+    notify_change("want_to_watch", "update", item_id)
     updated_item.id = item_id
     return updated_item
 
@@ -539,29 +1042,38 @@ def delete_want_to_watch_item(item_id: int):
         conn.commit()
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Item not found")
+    notify_change("want_to_watch", "delete", item_id)
     return {"message": "Item deleted successfully"}
 
 @router.get("/tmdb/search")
 def tmdb_search(query: str, media_type: Optional[str] = None):
-    logger.info(f"TMDB search requested: query='{query}', media_type='{media_type}'")
     if not query.strip():
-        logger.warning("TMDB search aborted: empty query")
         return []
+    # Only a query TMDB itself answered recently is served locally: a local
+    # title match alone cannot tell whether TMDB knows other titles for it.
+    local_results = title_index.cached_search(query, media_type)
+    if local_results is not None:
+        metrics.record_tmdb_lookup("local")
+        logger.info("TMDB search answered", extra={"source": "local", "results": len(local_results), "sample": 100})
+        return local_results
     try:
         response = tmdb_request(
             "/search/multi",
             {"query": query, "include_adult": "false"},
         )
     except Exception as exc:
-        logger.error(f"TMDB search failed: {exc}", exc_info=True)
+        offline_results = title_index.search(query, media_type)
+        if offline_results:
+            metrics.record_tmdb_lookup("offline")
+            logger.warning("TMDB search failed, serving local index instead: %s", exc)
+            return offline_results
+        logger.error("TMDB search failed: %s", exc, exc_info=True)
         raise HTTPException(status_code=502, detail=f"TMDB search failed: {str(exc)}")
     results = []
     for item in response.get("results", []):
         item_type = item.get("media_type")
         if item_type not in {"movie", "tv"}:
             continue
-        if media_type and item_type != media_type:
-            continue
         title = item.get("title") or item.get("name")
         release_date = item.get("release_date") or item.get("first_air_date")
         results.append(
@@ -576,12 +1088,19 @@ def tmdb_search(query: str, media_type: Optional[str] = None):
                 "rating": item.get("vote_average"),
             }
         )
-    logger.info(f"TMDB search returned {len(results)} results")
+    title_index.record_results(results)
+    title_index.record_search(query, results)
+    results = [result for result in results if not media_type or result["media_type"] == media_type]
+    metrics.record_tmdb_lookup("remote")
+    logger.info("TMDB search answered", extra={"source": "remote", "results": len(results), "sample": 10})
     return results
 
+@router.get("/tmdb/autocomplete")
+def tmdb_autocomplete(query: str, media_type: Optional[str] = None, limit: int = 10):
+    return title_index.search(query, media_type, limit=max(1, min(limit, 50)))
+
 @router.get("/tmdb/details/{media_type}/{tmdb_id}")
 def tmdb_details(media_type: str, tmdb_id: int):
-    logger.info(f"TMDB details requested: media_type='{media_type}', id={tmdb_id}")
     if media_type not in {"movie", "tv"}:
         raise HTTPException(status_code=400, detail="Unsupported media type")
     try:
@@ -590,7 +1109,7 @@ def tmdb_details(media_type: str, tmdb_id: int):
             {},
         )
     except Exception as exc:
-        logger.error(f"TMDB details failed: {exc}", exc_info=True)
+        logger.error("TMDB details failed for %s %s: %s", media_type, tmdb_id, exc, exc_info=True)
         raise HTTPException(status_code=502, detail=f"TMDB details failed: {str(exc)}")
     title = response.get("title") or response.get("name")
     release_date = response.get("release_date") or response.get("first_air_date")
@@ -601,6 +1120,19 @@ def tmdb_details(media_type: str, tmdb_id: int):
     else:
         runtimes = response.get("episode_run_time") or []
         runtime = runtimes[0] if runtimes else None
+    title_index.record_results([
+        {
+            "id": response.get("id"),
+            "media_type": media_type,
+            "title": title,
+            "release_date": release_date,
+            "year": tmdb_year(release_date),
+            "overview": response.get("overview"),
+            "poster_url": tmdb_poster_url(response.get("poster_path")),
+            "rating": response.get("vote_average"),
+            "popularity": response.get("popularity"),
+        }
+    ])
     return {
         "tmdb_id": response.get("id"),
         "title": title,
@@ -625,34 +1157,35 @@ def add_blog_post(
     slug: str = Form(...),
     body: str = Form(...)
 ):
-    logger.info(f"Blog post creation requested: watched_id={watched_id}, title='{title}', slug='{slug}'")
     slug_value = normalize_slug(slug)
     if not slug_value:
-        logger.error(f"Invalid slug provided: '{slug}'")
+        logger.warning("Invalid blog slug %r", slug)
         raise HTTPException(status_code=400, detail="Slug must be provided")
 
     with get_connection() as conn:
         watched_row = conn.execute("SELECT id FROM watched WHERE id = ?", (watched_id,)).fetchone()
         if not watched_row:
-            logger.error(f"Watched item not found: id={watched_id}")
+            logger.warning("Blog post for unknown watched id=%s", watched_id)
             raise HTTPException(status_code=400, detail="Watched item not found")
 
         created_at = datetime.utcnow().isoformat()
         try:
             cursor = conn.execute(
                 """
-                INSERT INTO blog_posts (watched_id, title, slug, body, created_at)
+                INSERT INTO blog_posts (watched_id, title, slug, excerpt, created_at)
                 VALUES (?, ?, ?, ?, ?)
                 """,
-                (watched_id, title, slug_value, body, created_at),
+                (watched_id, title, slug_value, blog_excerpt(body), created_at),
             )
-            conn.commit()
             post_id = cursor.lastrowid
-            logger.info(f"Blog post created successfully: id={post_id}, slug='{slug_value}'")
-        except sqlite3.IntegrityError as e:
-            logger.error(f"Slug already exists: '{slug_value}' - {e}")
+            save_blog_body(conn, post_id, body)
+            conn.commit()
+            logger.info("Blog post created", extra={"post_id": post_id, "slug": slug_value})
+        except sqlite3.IntegrityError:
+            logger.warning("Blog slug already exists: %s", slug_value)
             raise HTTPException(status_code=400, detail="Slug already exists")
 
+    notify_change("blog_posts", "insert", post_id)
     return BlogPost(
         id=post_id,
         watched_id=watched_id,
@@ -673,24 +1206,26 @@ def update_blog_post(post_id: int, updated_post: BlogPost):
             result = conn.execute(
                 """
                 UPDATE blog_posts
-                SET watched_id = ?, title = ?, slug = ?, body = ?, created_at = ?
+                SET watched_id = ?, title = ?, slug = ?, excerpt = ?, created_at = ?
                 WHERE id = ?
                 """,
                 (
                     updated_post.watched_id,
                     updated_post.title,
                     slug_value,
-                    updated_post.body,
+                    blog_excerpt(updated_post.body),
                     updated_post.created_at,
                     post_id,
                 ),
             )
-            conn.commit()
         except sqlite3.IntegrityError:
             raise HTTPException(status_code=400, detail="Slug already exists")
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Post not found")
+        save_blog_body(conn, post_id, updated_post.body)
+        conn.commit()
 
+    notify_change("blog_posts", "update", post_id)
     updated_post.id = post_id
     updated_post.slug = slug_value
     return updated_post
@@ -702,4 +1237,5 @@ def delete_blog_post(post_id: int):
         conn.commit()
         if result.rowcount == 0:
             raise HTTPException(status_code=404, detail="Post not found")
+    notify_change("blog_posts", "delete", post_id)
     return {"message": "Post deleted successfully"}
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+from app.services import recommender
+
+router = APIRouter()
+
+@router.get("/watched/{item_id}/similar")
+def similar_to_watched(item_id: int, limit: int = Query(5, ge=1, le=50), source: Optional[str] = None):
+    return similar_response("watched", item_id, limit, source)
+
+@router.get("/want-to-watch/{item_id}/similar")
+def similar_to_want_to_watch(item_id: int, limit: int = Query(5, ge=1, le=50), source: Optional[str] = None):
+    return similar_response("want_to_watch", item_id, limit, source)
+
+def similar_response(table: str, item_id: int, limit: int, source: Optional[str]):
+    if source is not None and source not in recommender.SOURCES:
+        raise HTTPException(status_code=400, detail="Unsupported source")
+    results = recommender.similar_titles(table, item_id, limit=limit, only=source)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return results
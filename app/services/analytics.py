@@ -0,0 +1,100 @@
+from typing import Dict, Iterable, List, Optional
+from app.routers import items
+
+# Rows come from `watch_rollups`, so every query below reads a few rows per
+# year, month, type and genre no matter how many titles have been watched.
+SCORES = range(0, 11)
+
+def read_rollups(dimension: str, year: Optional[int] = None) -> List[dict]:
+    clauses, params = ["dimension = ?", "titles != 0"], [dimension]
+    if year is not None:
+        clauses.append("period = ?")
+        params.append(f"{year:04d}")
+    with items.get_connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT period, bucket, score, titles, minutes, seasons
+            FROM watch_rollups
+            WHERE {" AND ".join(clauses)}
+            """,
+            params,
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+def totals(rows: Iterable[dict]) -> dict:
+    rows = list(rows)
+    titles = sum(row["titles"] for row in rows)
+    minutes = sum(row["minutes"] for row in rows)
+    scores = {score: 0 for score in SCORES}
+    for row in rows:
+        scores[row["score"]] = scores.get(row["score"], 0) + row["titles"]
+    return {
+        "titles": titles,
+        "hours": round(minutes / 60, 1),
+        "seasons": sum(row["seasons"] for row in rows),
+        "average_score": round(sum(score * count for score, count in scores.items()) / titles, 2) if titles else None,
+        "scores": scores,
+    }
+
+def grouped(rows: List[dict], key: str) -> Dict[str, dict]:
+    groups: Dict[str, List[dict]] = {}
+    for row in rows:
+        groups.setdefault(row[key], []).append(row)
+    return {name: totals(members) for name, members in groups.items()}
+
+def years() -> List[dict]:
+    """Totals per year, newest first."""
+    by_year = grouped(read_rollups("type"), "period")
+    return [{"year": int(year), **by_year[year]} for year in sorted(by_year, reverse=True)]
+
+def monthly(year: Optional[int] = None) -> List[dict]:
+    by_month = grouped(read_rollups("month", year), "bucket")
+    return [{"month": month, **by_month[month]} for month in sorted(by_month)]
+
+def ranked(rows: List[dict], by: str) -> List[dict]:
+    by_bucket = grouped(rows, "bucket")
+    names = sorted(by_bucket, key=lambda name: (-by_bucket[name]["titles"], name))
+    return [{by: name, **by_bucket[name]} for name in names]
+
+def score_distribution(by: str, year: Optional[int] = None) -> List[dict]:
+    """Titles and score histogram per content type (``by="type"``) or genre, most watched first."""
+    return ranked(read_rollups(by, year), by)
+
+def summary(year: Optional[int] = None) -> dict:
+    """Headline numbers (all time, or for one year) plus the per-type breakdown."""
+    rows = read_rollups("type", year)
+    return {"year": year, **totals(rows), "types": ranked(rows, "type")}
+
+def year_in_review(year: int) -> Optional[dict]:
+    overview = summary(year)
+    if not overview["titles"]:
+        return None
+    months = monthly(year)
+    genres = score_distribution("genre", year)
+    return {
+        **overview,
+        "months": months,
+        "busiest_month": max(months, key=lambda month: month["titles"])["month"],
+        "genres": genres,
+        "top_genres": [genre["genre"] for genre in genres[:5]],
+    }
+
+def check() -> List[tuple]:
+    """Rollup rows that differ from a full recompute; empty when the triggers kept up."""
+    with items.get_connection() as conn:
+        expected = {tuple(row[:4]): tuple(row[4:]) for row in items.computed_watch_rollups(conn)}
+        stored = {
+            tuple(row[:4]): tuple(row[4:])
+            for row in conn.execute("SELECT * FROM watch_rollups WHERE titles != 0").fetchall()
+        }
+    return [
+        (key, stored.get(key), expected.get(key))
+        for key in sorted(set(expected) | set(stored))
+        if stored.get(key) != expected.get(key)
+    ]
+
+def rebuild() -> int:
+    with items.get_connection() as conn:
+        count = items.rebuild_watch_rollups(conn)
+        conn.commit()
+    return count
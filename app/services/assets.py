@@ -0,0 +1,66 @@
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from starlette.staticfiles import StaticFiles
+
+STATIC_DIR = Path("app/static")
+STATIC_URL = "/static/"
+# Stylesheets and scripts the templates link with static_url().
+ASSET_SUFFIXES = {".css", ".js"}
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+_fingerprints: Dict[str, Tuple[int, str]] = {}
+_lock = threading.Lock()
+
+def fingerprint(path: str) -> str:
+    """First 12 hex digits of the SHA-256 of ``app/static/<path>``, cached until the file changes."""
+    file = STATIC_DIR / path
+    mtime = file.stat().st_mtime_ns
+    cached = _fingerprints.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    digest = hashlib.sha256(file.read_bytes()).hexdigest()[:12]
+    with _lock:
+        _fingerprints[path] = (mtime, digest)
+    return digest
+
+def static_url(path: str) -> str:
+    """``/static/<path>?v=<fingerprint>``: a new URL whenever the file's content changes."""
+    return f"{STATIC_URL}{path}?v={fingerprint(path)}"
+
+def assets_digest() -> str:
+    """One digest over every stylesheet and script, for callers caching whole pages."""
+    digest = hashlib.sha256()
+    for file in sorted(STATIC_DIR.rglob("*")):
+        if file.suffix in ASSET_SUFFIXES:
+            path = file.relative_to(STATIC_DIR).as_posix()
+            digest.update(f"{path}={fingerprint(path)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+class StaticAssets(StaticFiles):
+    """StaticFiles that lets browsers keep fingerprinted URLs forever.
+
+    A ``?v=`` URL changes with the file, so when ``v`` is the file's current
+    fingerprint the response is marked immutable and repeat visits skip even
+    the revalidation request.
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and requested_version(scope) == current_version(path):
+            response.headers["Cache-Control"] = IMMUTABLE
+        return response
+
+def requested_version(scope) -> Optional[str]:
+    for part in scope.get("query_string", b"").decode("latin-1").split("&"):
+        if part.startswith("v="):
+            return part[2:]
+    return None
+
+def current_version(path: str) -> Optional[str]:
+    # Anything else (a stale or made-up ``v``) keeps the default revalidating headers.
+    try:
+        return fingerprint(Path(path).as_posix())
+    except OSError:
+        return None
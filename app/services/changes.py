@@ -0,0 +1,231 @@
+import functools
+import logging
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional
+from app.routers import items
+
+logger = logging.getLogger(__name__)
+
+# Journal rows kept when pruning; a worker (or feed client) further behind than
+# this gets a "reset" instead of individual changes.
+RETENTION = 10_000
+
+_invalidate_listeners: List[Callable[[str, str, Optional[int]], None]] = []
+
+def on_invalidate(listener):
+    """Register ``listener(table, action, item_id)`` for every journaled change, local or not.
+
+    Listeners must only drop or refresh in-process state: they run once per
+    worker. ``action`` is ``"reset"`` with ``item_id`` None when the journal was
+    pruned past this worker's position and everything must be assumed stale.
+    """
+    _invalidate_listeners.append(listener)
+    return listener
+
+def dispatch(table: str, action: str, item_id: Optional[int]):
+    for listener in _invalidate_listeners:
+        try:
+            listener(table, action, item_id)
+        except Exception:
+            logger.exception("Invalidation listener failed for %s %s id=%s", table, action, item_id)
+
+class ChangeBus:
+    """Replays the ``changes`` journal into this process's caches.
+
+    ``PRAGMA data_version`` on a connection that never writes changes only when
+    another connection (any thread or process) has committed, so ``sync`` is a
+    single cheap pragma while nothing happened.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.conn: Optional[sqlite3.Connection] = None
+        self.data_version: Optional[int] = None
+        self.last_id = 0
+
+    def connect(self) -> sqlite3.Connection:
+        if self.conn is None:
+            conn = sqlite3.connect(items.DB_PATH, check_same_thread=False)
+            try:
+                self.data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                self.last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM changes").fetchone()[0]
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self.conn = conn
+        return self.conn
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+            self.conn = None
+
+    def sync(self) -> int:
+        """Dispatch journal entries committed since the last call; returns how many."""
+        with self.lock:
+            try:
+                conn = self.connect()
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == self.data_version:
+                    return 0
+                self.data_version = data_version
+                first_id = conn.execute("SELECT MIN(id) FROM changes").fetchone()[0]
+                rows = conn.execute(
+                    "SELECT id, table_name, action, item_id FROM changes WHERE id > ? ORDER BY id",
+                    (self.last_id,),
+                ).fetchall()
+            except sqlite3.Error as exc:
+                logger.warning("Change journal unavailable: %s", exc)
+                return 0
+            pruned = first_id is not None and first_id > self.last_id + 1 and self.last_id > 0
+            if rows:
+                self.last_id = rows[-1][0]
+        if pruned:
+            for table in items.JOURNALED_COLUMNS:
+                dispatch(table, "reset", None)
+            return len(rows)
+        for _, table, action, item_id in rows:
+            dispatch(table, action, item_id)
+        return len(rows)
+
+bus = ChangeBus()
+
+def sync() -> int:
+    return bus.sync()
+
+@items.on_change
+def sync_local_write(table: str, action: str, item_id: int):
+    # Apply this worker's own write right away so it reads its own writes.
+    bus.sync()
+
+# Row shapes match the corresponding list endpoints so clients can splice them in.
+FEED_QUERIES = {
+    "watched": """
+        SELECT id, title, comment, score, image_url, watch_date, content_type, season,
+               synopsis, release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank
+        FROM watched WHERE id IN ({placeholders})
+    """,
+    "want_to_watch": """
+        SELECT id, title, image_url, launch_date, excitement, content_type, season,
+               synopsis, release_year, runtime, genres, tmdb_id, tmdb_rating, poster_url, priority
+        FROM want_to_watch WHERE id IN ({placeholders})
+    """,
+    "blog_posts": """
+        SELECT b.id, b.watched_id, b.title, b.slug, unpack_text(t.codec, t.data) AS body, b.created_at,
+               w.poster_url, w.image_url, w.score, w.release_year, w.genres, w.tmdb_rating, w.content_type
+        FROM blog_posts b
+        JOIN watched w ON b.watched_id = w.id
+        LEFT JOIN blog_bodies t ON t.post_id = b.id
+        WHERE b.id IN ({placeholders})
+    """,
+}
+
+def feed(since: Optional[int], limit: int = 500) -> dict:
+    """Journal entries after ``since`` with the current row for each changed item.
+
+    Several changes to one item collapse into the latest. ``reset`` means the
+    client is behind the pruned journal (or ahead of it) and must reload.
+    """
+    with items.get_connection() as conn:
+        head, first = conn.execute("SELECT COALESCE(MAX(id), 0), MIN(id) FROM changes").fetchone()
+        if since is None:
+            return {"cursor": head, "reset": False, "more": False, "changes": []}
+        if since > head or (first is not None and since < first - 1):
+            return {"cursor": head, "reset": True, "more": False, "changes": []}
+        rows = conn.execute(
+            "SELECT id, table_name, action, item_id, changed_at FROM changes WHERE id > ? ORDER BY id LIMIT ?",
+            (since, limit),
+        ).fetchall()
+        latest = {}
+        for row in rows:
+            latest.pop((row["table_name"], row["item_id"]), None)
+            latest[(row["table_name"], row["item_id"])] = row
+        current: Dict[tuple, dict] = {}
+        for table, query in FEED_QUERIES.items():
+            ids = [item_id for (name, item_id) in latest if name == table]
+            if ids:
+                placeholders = ",".join("?" for _ in ids)
+                for item in conn.execute(query.format(placeholders=placeholders), ids).fetchall():
+                    current[(table, item["id"])] = dict(item)
+    return {
+        "cursor": rows[-1]["id"] if rows else since,
+        "reset": False,
+        "more": len(rows) == limit,
+        "changes": [
+            {
+                "id": row["id"],
+                "table": row["table_name"],
+                # A row gone by now reads as deleted, whatever the entry said.
+                "action": row["action"] if (row["table_name"], row["item_id"]) in current else "delete",
+                "item_id": row["item_id"],
+                "changed_at": row["changed_at"],
+                "item": current.get((row["table_name"], row["item_id"])),
+            }
+            for row in latest.values()
+        ],
+    }
+
+def last_changed(*tables: str) -> Optional[str]:
+    """``changed_at`` of the newest journal entry for ``tables``; None if there is none left."""
+    placeholders = ",".join("?" for _ in tables)
+    with items.get_connection() as conn:
+        row = conn.execute(
+            f"SELECT changed_at FROM changes WHERE table_name IN ({placeholders}) ORDER BY id DESC LIMIT 1",
+            tables,
+        ).fetchone()
+    return row[0] if row else None
+
+def prune(keep: int = RETENTION) -> int:
+    with items.get_connection() as conn:
+        cursor = conn.execute(
+            "DELETE FROM changes WHERE id <= (SELECT MAX(id) FROM changes) - ?",
+            (keep,),
+        )
+        conn.commit()
+    return cursor.rowcount
+
+def copy(value):
+    return dict(value) if isinstance(value, dict) else value
+
+def cached(*tables: str, maxsize: int = 128):
+    """Memoise a function's result until a journaled change touches one of ``tables``.
+
+    Cached values are shared between requests. Dict results are returned as a
+    shallow copy so callers can add keys (TemplateResponse adds ``request``),
+    but nested lists and rows must be treated as read-only.
+    """
+    depends_on = set(tables)
+
+    def decorator(func):
+        entries: Dict[tuple, object] = {}
+        state = {"generation": 0}
+        lock = threading.Lock()
+
+        @on_invalidate
+        def invalidate(table: str, action: str, item_id: Optional[int]):
+            if table in depends_on:
+                with lock:
+                    entries.clear()
+                    state["generation"] += 1
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            bus.sync()
+            with lock:
+                if args in entries:
+                    return copy(entries[args])
+                generation = state["generation"]
+            value = func(*args)
+            with lock:
+                # Drop results computed across an invalidation; they may be stale.
+                if state["generation"] == generation:
+                    if len(entries) >= maxsize:
+                        entries.pop(next(iter(entries)))
+                    entries[args] = value
+            return copy(value)
+
+        return wrapper
+
+    return decorator
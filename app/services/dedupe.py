@@ -0,0 +1,279 @@
+import logging
+import re
+import sqlite3
+import time
+import zlib
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+import numpy as np
+from app.routers import items
+
+logger = logging.getLogger(__name__)
+
+# Near-duplicate titles are found with MinHash over character trigrams of the
+# normalised title plus LSH banding: titles that agree on every value of at
+# least one band become candidate pairs and only those are compared exactly.
+# 8 bands of 4 rows surface ~98% of pairs at Jaccard 0.8.
+NUM_HASHES = 32
+BANDS = 8
+THRESHOLD = 0.8
+# Larger buckets are shared boilerplate rather than one title entered twice.
+MAX_BUCKET = 50
+# Smallest prime above 2**32, so (a * x + b) % PRIME stays inside uint64.
+PRIME = 4294967311
+_rng = np.random.default_rng(41)
+HASH_A = _rng.integers(1, 2**32, NUM_HASHES, dtype=np.uint64)
+HASH_B = _rng.integers(0, 2**32, NUM_HASHES, dtype=np.uint64)
+NUMBERS = re.compile(r"\d+")
+
+# Nullable details a kept row takes over from the rows merged into it.
+MERGE_COLUMNS = {
+    "watched": ["synopsis", "release_year", "release_date", "runtime", "genres", "tmdb_id", "tmdb_rating", "poster_url"],
+    "want_to_watch": ["synopsis", "release_year", "runtime", "genres", "tmdb_id", "tmdb_rating", "poster_url"],
+}
+IMAGES_URL = "/static/images/"
+
+class MergeError(ValueError):
+    pass
+
+def trigrams(title_key: str) -> Set[str]:
+    padded = f" {title_key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def signatures(shingles: List[Set[str]]) -> np.ndarray:
+    """One row of NUM_HASHES minimum hash values per (non-empty) shingle set."""
+    ids = np.fromiter((zlib.crc32(gram.encode("utf-8")) for grams in shingles for gram in grams), dtype=np.uint64)
+    lengths = np.fromiter((len(grams) for grams in shingles), dtype=np.int64, count=len(shingles))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    result = np.empty((len(shingles), NUM_HASHES), dtype=np.uint64)
+    # One hash function at a time keeps memory at a single pass over the trigrams.
+    for k in range(NUM_HASHES):
+        result[:, k] = np.minimum.reduceat((HASH_A[k] * ids + HASH_B[k]) % PRIME, starts)
+    return result
+
+def lsh_candidates(signature: np.ndarray) -> Set[Tuple[int, int]]:
+    rows = NUM_HASHES // BANDS
+    pairs: Set[Tuple[int, int]] = set()
+    for band in range(BANDS):
+        block = np.ascontiguousarray(signature[:, band * rows:(band + 1) * rows])
+        _, inverse, counts = np.unique(block, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+        shared = np.flatnonzero(counts[inverse] > 1)
+        order = shared[np.argsort(inverse[shared], kind="stable")]
+        for group in np.split(order, np.flatnonzero(np.diff(inverse[order])) + 1):
+            if 2 <= len(group) <= MAX_BUCKET:
+                pairs.update(combinations(group.tolist(), 2))
+    return pairs
+
+def compatible(a: dict, b: dict) -> bool:
+    """Titles that look alike but are known to differ: other season, TMDB id, year or sequel number."""
+    if (a["season"] or 0) != (b["season"] or 0):
+        return False
+    if a["tmdb_id"] and b["tmdb_id"] and a["tmdb_id"] != b["tmdb_id"]:
+        return False
+    if a["release_year"] and b["release_year"] and a["release_year"] != b["release_year"]:
+        return False
+    return a["numbers"] == b["numbers"]
+
+def load_titles(conn: sqlite3.Connection) -> List[dict]:
+    titles = []
+    for table in items.DEDUPE_TABLES:
+        # Rows written before title_key existed, or by tools that skip it.
+        items.backfill_title_keys(conn, table)
+        titles.extend(
+            {**dict(row), "table": table, "numbers": NUMBERS.findall(row["title_key"])}
+            for row in conn.execute(f"SELECT id, title, title_key, season, tmdb_id, release_year FROM {table}")
+        )
+    return titles
+
+def scan(threshold: float = THRESHOLD) -> dict:
+    """Clusters of rows across watched and want_to_watch that are probably the same title.
+
+    Exact matches on TMDB id and season, or on normalised title and season, are
+    always reported; near matches need a trigram Jaccard similarity of at least
+    ``threshold``.
+    """
+    start = time.perf_counter()
+    with items.get_connection() as conn:
+        titles = load_titles(conn)
+        conn.commit()
+    edges: Dict[Tuple[int, int], Tuple[str, float]] = {}
+
+    groups: Dict[tuple, List[int]] = {}
+    for index, title in enumerate(titles):
+        season = title["season"] or 0
+        if title["tmdb_id"]:
+            groups.setdefault(("tmdb", title["tmdb_id"], season), []).append(index)
+        groups.setdefault(("title", title["title_key"], season), []).append(index)
+    for key, members in groups.items():
+        for i, j in combinations(members, 2):
+            if key[0] == "tmdb" or compatible(titles[i], titles[j]):
+                edges.setdefault((i, j), (key[0], 1.0))
+
+    shingled = [(index, trigrams(title["title_key"])) for index, title in enumerate(titles) if title["title_key"]]
+    candidates = lsh_candidates(signatures([grams for _, grams in shingled])) if shingled else set()
+    for a, b in candidates:
+        (i, grams_i), (j, grams_j) = shingled[a], shingled[b]
+        if (i, j) in edges or not compatible(titles[i], titles[j]):
+            continue
+        similarity = len(grams_i & grams_j) / len(grams_i | grams_j)
+        if similarity >= threshold:
+            edges[(i, j)] = ("similar", round(similarity, 3))
+
+    parent = list(range(len(titles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in edges:
+        parent[find(i)] = find(j)
+    members: Dict[int, List[int]] = {}
+    reasons: Dict[int, Dict[str, float]] = {}
+    for (i, j), (reason, similarity) in edges.items():
+        root = find(i)
+        found = reasons.setdefault(root, {})
+        found[reason] = min(found.get(reason, 1.0), similarity)
+    for index in range(len(titles)):
+        if find(index) in reasons:
+            members.setdefault(find(index), []).append(index)
+
+    watched_ids = [titles[i]["id"] for group in members.values() for i in group if titles[i]["table"] == "watched"]
+    posts = blog_post_counts(watched_ids)
+    clusters = []
+    for root, group in members.items():
+        rows = [
+            {**titles[i], "blog_posts": posts.get(titles[i]["id"], 0) if titles[i]["table"] == "watched" else 0}
+            for i in group
+        ]
+        rows.sort(key=keep_order)
+        clusters.append({
+            "keep": {"table": rows[0]["table"], "id": rows[0]["id"]},
+            "reasons": reasons[root],
+            "items": [{key: value for key, value in row.items() if key not in ("title_key", "numbers")} for row in rows],
+        })
+    clusters.sort(key=lambda cluster: (-len(cluster["items"]), cluster["keep"]["table"], cluster["keep"]["id"]))
+    return {
+        "titles": len(titles),
+        "candidates": len(candidates),
+        "clusters": clusters,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+def keep_order(row: dict) -> tuple:
+    # Suggested survivor first: watched over queued, then the one with blog posts,
+    # then TMDB-linked, then the oldest.
+    return (row["table"] != "watched", -row["blog_posts"], row["tmdb_id"] is None, row["id"])
+
+def blog_post_counts(watched_ids: List[int]) -> Dict[int, int]:
+    if not watched_ids:
+        return {}
+    placeholders = ",".join("?" for _ in watched_ids)
+    with items.get_connection() as conn:
+        rows = conn.execute(
+            f"SELECT watched_id, COUNT(*) FROM blog_posts WHERE watched_id IN ({placeholders}) GROUP BY watched_id",
+            watched_ids,
+        ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+def merge(keep: Tuple[str, int], duplicates: Iterable[Tuple[str, int]]) -> dict:
+    """Fold ``duplicates`` into ``keep`` in one transaction.
+
+    Blog posts of merged watched rows move to the kept row, which also takes over
+    any details (poster, synopsis, TMDB id, ...) it is missing. The merged rows
+    are deleted, and uploaded images nothing refers to any more are removed.
+    """
+    keep_table, keep_id = keep
+    duplicates = list(dict.fromkeys(duplicates))
+    if not duplicates or keep in duplicates:
+        raise MergeError("Pick at least one duplicate other than the kept item")
+    if keep_table != "watched" and any(table == "watched" for table, _ in duplicates):
+        raise MergeError("Watched titles can only be merged into a watched title")
+
+    with items.get_connection() as conn:
+        kept = conn.execute(f"SELECT * FROM {keep_table} WHERE id = ?", (keep_id,)).fetchone()
+        if kept is None:
+            raise LookupError(f"{keep_table} #{keep_id} not found")
+        rows = []
+        for table, item_id in duplicates:
+            row = conn.execute(f"SELECT * FROM {table} WHERE id = ?", (item_id,)).fetchone()
+            if row is None:
+                raise LookupError(f"{table} #{item_id} not found")
+            rows.append((table, row))
+
+        merged_watched = [row["id"] for table, row in rows if table == "watched"]
+        moved_posts: List[int] = []
+        if merged_watched:
+            placeholders = ",".join("?" for _ in merged_watched)
+            moved_posts = [
+                row["id"]
+                for row in conn.execute(f"SELECT id FROM blog_posts WHERE watched_id IN ({placeholders})", merged_watched)
+            ]
+            conn.execute(
+                f"UPDATE blog_posts SET watched_id = ? WHERE watched_id IN ({placeholders})", [keep_id, *merged_watched]
+            )
+        for table, row in rows:
+            conn.execute(f"DELETE FROM {table} WHERE id = ?", (row["id"],))
+
+        filled = {}
+        for column in MERGE_COLUMNS[keep_table]:
+            if kept[column] is None:
+                value = next((row[column] for _, row in rows if column in row.keys() and row[column] is not None), None)
+                if value is not None:
+                    filled[column] = value
+        if filled:
+            try:
+                conn.execute(
+                    f"UPDATE {keep_table} SET {', '.join(f'{column} = ?' for column in filled)} WHERE id = ?",
+                    [*filled.values(), keep_id],
+                )
+            except sqlite3.IntegrityError:
+                conn.rollback()
+                raise MergeError("Another item already has the TMDB id and season this merge would give the kept item")
+        conn.commit()
+        unique_indexes = items.ensure_unique_indexes(conn)
+        conn.commit()
+
+    for table, row in rows:
+        items.notify_change(table, "delete", row["id"])
+    for post_id in moved_posts:
+        items.notify_change("blog_posts", "update", post_id)
+    items.notify_change(keep_table, "update", keep_id)
+    images = {row[column] for _, row in rows for column in ("image_url", "poster_url") if row[column]}
+    removed_images = remove_unused_images(images)
+    logger.info(
+        "Merged %d item(s) into %s id=%s", len(rows), keep_table, keep_id,
+        extra={"blog_posts": len(moved_posts), "filled": sorted(filled)},
+    )
+    return {
+        "keep": {"table": keep_table, "id": keep_id},
+        "merged": [{"table": table, "id": row["id"]} for table, row in rows],
+        "blog_posts": moved_posts,
+        "filled": sorted(filled),
+        "removed_images": removed_images,
+        "unique_indexes": unique_indexes,
+    }
+
+def remove_unused_images(urls: Iterable[str]) -> List[str]:
+    """Delete uploaded images under ``IMAGES_DIR`` that no row refers to any more."""
+    images_dir = Path(items.IMAGES_DIR).resolve()
+    removed = []
+    with items.get_connection() as conn:
+        for url in sorted(urls):
+            if not url.startswith(IMAGES_URL):
+                continue
+            path = (images_dir / url[len(IMAGES_URL):]).resolve()
+            if images_dir not in path.parents:
+                continue
+            in_use = any(
+                conn.execute(f"SELECT 1 FROM {table} WHERE image_url = ? OR poster_url = ? LIMIT 1", (url, url)).fetchone()
+                for table in items.DEDUPE_TABLES
+            )
+            if not in_use and path.exists():
+                path.unlink()
+                removed.append(url)
+    return removed
+
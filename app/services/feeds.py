@@ -0,0 +1,120 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+from app.routers import items
+from app.services import changes
+from app.services.pages import templates
+from app.services.recommender import split_genres
+from app.services.settings import settings
+
+FEED_SIZE = 20
+FEED_TITLE = "Movie Ranker Blog"
+# Feed file name -> (template, media type).
+FORMATS = {
+    "rss.xml": ("blog_rss.xml", "application/rss+xml; charset=utf-8"),
+    "atom.xml": ("blog_atom.xml", "application/atom+xml; charset=utf-8"),
+}
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def parse_created(value: str) -> datetime:
+    # created_at is stored as naive UTC ISO text.
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def feed_path(name: str, kind: Optional[str] = None, slug: Optional[str] = None) -> str:
+    return f"/blog/{kind}/{slug}/{name}" if kind else f"/blog/{name}"
+
+@changes.cached("watched", "blog_posts")
+def feed_tags() -> Dict[str, Dict[str, str]]:
+    """Slug -> name for every content type (``type``) and genre (``genre``) that has posts."""
+    tags: Dict[str, Dict[str, str]] = {"type": {}, "genre": {}}
+    for row in items.get_blog_tags():
+        if row["content_type"]:
+            tags["type"][items.normalize_slug(row["content_type"])] = row["content_type"]
+        for genre in split_genres(row["genres"]):
+            tags["genre"][items.normalize_slug(genre)] = genre
+    return tags
+
+def feed_variants() -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """(name, kind, slug) for the main feeds and every per-type and per-genre feed."""
+    tags = feed_tags()
+    variants = [(name, None, None) for name in FORMATS]
+    for kind in ("type", "genre"):
+        for slug in sorted(tags[kind]):
+            variants.extend((name, kind, slug) for name in FORMATS)
+    return variants
+
+def feed_context(name: str, kind: Optional[str] = None, slug: Optional[str] = None,
+                 base_url: Optional[str] = None) -> Optional[dict]:
+    """Feed entries with absolute links under ``base_url`` (default: ``SITE_URL``)."""
+    title = FEED_TITLE
+    filters = {}
+    if kind is not None:
+        value = feed_tags().get(kind, {}).get(slug)
+        if value is None:
+            return None
+        title = f"{FEED_TITLE}: {value}"
+        filters = {"content_type": value} if kind == "type" else {"genre": value}
+    site = (base_url or settings.site_url).rstrip("/")
+    posts = items.get_blog_page(FEED_SIZE, **filters)
+    entries = []
+    for post in posts:
+        published = parse_created(post["created_at"])
+        entries.append({
+            "title": post["title"],
+            "url": f"{site}/blog/{post['slug']}",
+            "summary": post["excerpt"],
+            "categories": [tag for tag in [post["content_type"], *split_genres(post["genres"])] if tag],
+            "published": published.isoformat(),
+            "published_rfc822": format_datetime(published, usegmt=True),
+        })
+    updated = parse_created(posts[0]["created_at"]) if posts else EPOCH
+    return {
+        "title": title,
+        "site_url": site,
+        "blog_url": f"{site}/blog",
+        "self_url": site + feed_path(name, kind, slug),
+        "updated": updated.isoformat(),
+        "updated_rfc822": format_datetime(updated, usegmt=True),
+        "entries": entries,
+    }
+
+@changes.cached("watched", "blog_posts", maxsize=256)
+def render_feed(name: str, kind: Optional[str] = None, slug: Optional[str] = None,
+                base_url: Optional[str] = None) -> Optional[dict]:
+    """Rendered feed bytes plus validators; rebuilt only after a blog or watched change."""
+    if name not in FORMATS:
+        return None
+    context = feed_context(name, kind, slug, base_url)
+    if context is None:
+        return None
+    template, media_type = FORMATS[name]
+    body = templates.get_template(template).render(context).encode("utf-8")
+    # The newest post's date misses edits and deletions; the journal entry behind
+    # this rebuild does not, and reads the same in every worker.
+    modified = parse_created(context["updated"])
+    changed_at = changes.last_changed("watched", "blog_posts")
+    if changed_at:
+        modified = max(modified, parse_created(changed_at.removesuffix("Z")))
+    return {
+        "body": body,
+        "media_type": media_type,
+        # Derived from the content, so every worker hands out the same validator.
+        "etag": '"%s"' % hashlib.sha256(body).hexdigest()[:32],
+        "last_modified": format_datetime(modified, usegmt=True),
+    }
+
+def not_modified(headers, feed: dict) -> bool:
+    """Conditional GET: If-None-Match wins over If-Modified-Since when both are sent."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or feed["etag"] in tags
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(feed["last_modified"])
+        except (TypeError, ValueError):
+            return False
+    return False
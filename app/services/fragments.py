@@ -0,0 +1,83 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from jinja2 import nodes
+from jinja2.ext import Extension
+
+# Enough for every card of a large library on both the home and top pages.
+MAX_FRAGMENTS = 25_000
+
+class FragmentCache:
+    """Rendered template fragments by key, least recently used dropped first."""
+
+    def __init__(self, maxsize: int = MAX_FRAGMENTS):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+class FragmentCacheExtension(Extension):
+    """``{% cache "watched", item.id, item.row_version %}...{% endcache %}``
+
+    Renders the body once per key and reuses the output afterwards. Keys only
+    need to change when what the body shows does, so a row's id and
+    ``row_version`` (plus anything joined in, like a blog slug) are enough;
+    stale entries are never read again and age out of the cache. The template
+    name, line and a digest of its source are part of every key, so editing a
+    template never serves fragments rendered from the old one.
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=FragmentCache())
+        self._sources = {}
+
+    def preprocess(self, source, name, filename=None):
+        self._sources[name] = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+        return source
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        parts = [nodes.Const(parser.name), nodes.Const(lineno), nodes.Const(self._sources.get(parser.name))]
+        parts.append(parser.parse_expression())
+        while parser.stream.skip_if("comma"):
+            parts.append(parser.parse_expression())
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        key = nodes.Tuple(parts, "load", lineno=lineno)
+        return nodes.CallBlock(self.call_method("_render", [key]), [], [], body).set_lineno(lineno)
+
+    def _render(self, key, caller):
+        cache = self.environment.fragment_cache
+        output = cache.get(key)
+        if output is None:
+            output = caller()
+            cache.set(key, output)
+        return output
@@ -0,0 +1,132 @@
+import atexit
+import json
+import logging
+import queue
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from app.services.settings import settings
+
+# Attributes every LogRecord has; anything else was passed through ``extra=``.
+RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sample"}
+SECRET_KEYS = re.compile(r"pass(word)?|secret|token|api_?key|authorization|credential", re.IGNORECASE)
+SECRET_VALUES = re.compile(r"(api_key=|Bearer\s+|Basic\s+)[^\s&'\"]+", re.IGNORECASE)
+
+_listener: Optional[QueueListener] = None
+_configure_lock = threading.Lock()
+
+def redact(text: str) -> str:
+    return SECRET_VALUES.sub(r"\1[redacted]", text)
+
+def record_fields(record: logging.LogRecord) -> dict:
+    return {
+        key: "[redacted]" if SECRET_KEYS.search(key) else value
+        for key, value in vars(record).items()
+        if key not in RESERVED_ATTRS and not key.startswith("_")
+    }
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message and any ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": redact(record.getMessage()),
+        }
+        entry.update(record_fields(record))
+        if record.exc_info:
+            entry["exc"] = redact(self.formatException(record.exc_info))
+        return json.dumps(entry, default=str)
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = redact(super().format(record))
+        fields = record_fields(record)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+class SamplingFilter(logging.Filter):
+    """Keep one in ``sample`` records per message for records logged with ``extra={"sample": n}``.
+
+    Warnings and errors are never dropped.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.counts = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = record.__dict__.get("sample")
+        if not rate or rate <= 1 or record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, record.msg)
+        count = self.counts.get(key, 0)
+        self.counts[key] = count + 1
+        if count % rate:
+            return False
+        record.sampled = rate
+        return True
+
+class LazyQueueHandler(QueueHandler):
+    """Enqueue records untouched; formatting happens on the listener thread.
+
+    The stock ``prepare`` renders the message on the caller's thread, which is
+    exactly the per-request cost this handler exists to avoid.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None):
+    """Route the root logger through a background queue listener. Safe to call repeatedly.
+
+    ``LOG_LEVEL`` (default INFO) and ``LOG_FORMAT`` (``json`` or ``text``, default json)
+    come from settings when not passed explicitly.
+    """
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            return
+        level = (level or settings.log_level).upper()
+        fmt = (fmt or settings.log_format or "json").lower()
+        # Skip per-record lookups nothing here reports on.
+        logging.logThreads = False
+        logging.logMultiprocessing = False
+        logging.logAsyncioTasks = False
+
+        stream = logging.StreamHandler(sys.stderr)
+        stream.setFormatter(TextFormatter() if fmt == "text" else JsonFormatter())
+        records = queue.SimpleQueue()
+        handler = LazyQueueHandler(records)
+        handler.addFilter(SamplingFilter())
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(level)
+
+        _listener = QueueListener(records, stream, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+    if settings.env_file:
+        logging.getLogger(__name__).info("Loaded settings from %s", settings.env_file)
+    else:
+        logging.getLogger(__name__).warning(".env file not found or not loaded correctly")
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
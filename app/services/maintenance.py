@@ -0,0 +1,320 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from app.routers import items
+from app.services import changes, metrics
+from app.services.settings import settings
+
+logger = logging.getLogger(__name__)
+
+BACKUP_DIR = settings.backup_dir
+# Work is split into small steps with pauses in between so live requests
+# never queue behind maintenance for more than a few milliseconds.
+BACKUP_PAGES = 256
+VACUUM_PAGES = 128
+STEP_PAUSE = 0.05
+# Each write from another connection restarts a backup in progress; after this
+# many restarts the copy is finished in a single step instead.
+BACKUP_MAX_RESTARTS = 3
+# Give up on a lock quickly instead of making request writers wait.
+BUSY_TIMEOUT = 0.05
+ANALYSIS_LIMIT = 400
+
+# Seconds between scheduled runs of each task.
+SCHEDULE = {
+    "checkpoint": 5 * 60,
+    "prune-changes": 60 * 60,
+    "vacuum": 60 * 60,
+    "optimize": 6 * 60 * 60,
+    "integrity": 24 * 60 * 60,
+}
+TICK_SECONDS = 30
+STARTUP_DELAY = 60
+
+def connect(timeout: float = BUSY_TIMEOUT) -> sqlite3.Connection:
+    # Autocommit, so every pragma is its own short transaction.
+    conn = sqlite3.connect(items.DB_PATH, timeout=timeout, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def pragma(conn: sqlite3.Connection, name: str):
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+class BackupRestarted(Exception):
+    pass
+
+def backup(dest: Optional[str] = None, keep: Optional[int] = None, pages: int = BACKUP_PAGES,
+           pause: float = STEP_PAUSE) -> dict:
+    """Copy the live database to ``dest`` (default: a timestamped file in ``BACKUP_DIR``).
+
+    Uses SQLite's online backup API ``pages`` at a time with a pause between
+    steps. Under WAL the copy only holds a read transaction, so writers are never
+    blocked, but each write from another connection restarts it; if that keeps
+    happening the copy is redone in one step. The result is checked with
+    ``quick_check`` and renamed into place only if it passes. ``keep`` prunes
+    older timestamped backups.
+    """
+    if dest:
+        target = Path(dest)
+    else:
+        target = Path(BACKUP_DIR) / f"app-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.db"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(target.name + ".partial")
+    partial.unlink(missing_ok=True)
+    progress = {"steps": 0, "restarts": 0, "remaining": None, "total": 0}
+
+    def step(status, remaining, total):
+        if progress["remaining"] is not None and remaining > progress["remaining"]:
+            progress["restarts"] += 1
+            if progress["restarts"] > BACKUP_MAX_RESTARTS:
+                raise BackupRestarted()
+        progress.update(steps=progress["steps"] + 1, remaining=remaining, total=total)
+        if remaining:
+            time.sleep(pause)
+
+    try:
+        with closing(connect()) as source, closing(sqlite3.connect(partial)) as copy:
+            try:
+                source.backup(copy, pages=pages, progress=step)
+            except BackupRestarted:
+                logger.info("Backup kept restarting under writes; copying in one step")
+                source.backup(copy, pages=-1)
+            # A standalone file: no -wal sidecar to forget when copying it around.
+            copy.execute("PRAGMA journal_mode=DELETE")
+            check = pragma(copy, "quick_check")
+        if check != "ok":
+            raise sqlite3.DatabaseError(f"Backup failed quick_check: {check}")
+        os.replace(partial, target)
+    finally:
+        partial.unlink(missing_ok=True)
+    removed = rotate_backups(keep) if keep and not dest else []
+    return {
+        "path": str(target),
+        "bytes": target.stat().st_size,
+        "pages": progress["total"],
+        "steps": progress["steps"],
+        "restarts": progress["restarts"],
+        "removed": removed,
+    }
+
+def rotate_backups(keep: int) -> List[str]:
+    backups = sorted(Path(BACKUP_DIR).glob("app-*.db"))
+    stale = backups[:-keep] if keep > 0 else []
+    for path in stale:
+        path.unlink()
+    return [str(path) for path in stale]
+
+def checkpoint(thorough: bool = False) -> dict:
+    """Copy WAL frames back into the database; ``thorough`` also truncates the WAL file.
+
+    PASSIVE never waits for readers or writers. TRUNCATE waits up to the busy
+    timeout and reports ``busy`` if it could not finish.
+    """
+    mode = "TRUNCATE" if thorough else "PASSIVE"
+    with closing(connect()) as conn:
+        busy, wal_pages, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+    return {"mode": mode, "busy": bool(busy), "wal_pages": wal_pages, "checkpointed": checkpointed}
+
+def incremental_vacuum(thorough: bool = False, pages: int = VACUUM_PAGES, pause: float = STEP_PAUSE,
+                       max_steps: int = 64) -> dict:
+    """Return free pages to the filesystem ``pages`` at a time.
+
+    Needs ``auto_vacuum=INCREMENTAL``, which new databases get from ``init_db``;
+    older files report their free pages and are left alone until
+    ``compact`` rewrites them. ``thorough`` removes the step limit.
+    """
+    with closing(connect()) as conn:
+        free_pages = pragma(conn, "freelist_count")
+        if pragma(conn, "auto_vacuum") != 2:
+            return {"skipped": "auto_vacuum is not incremental", "free_pages": free_pages}
+        released = steps = 0
+        while free_pages and (thorough or steps < max_steps):
+            if steps:
+                time.sleep(pause)
+            try:
+                # execute() steps a statement without result columns only once,
+                # which frees a single page; executescript runs it to completion.
+                conn.executescript(f"PRAGMA incremental_vacuum({pages})")
+            except sqlite3.OperationalError as exc:
+                # Someone else is writing; the rest waits for the next run.
+                logger.info("Incremental vacuum paused: %s", exc)
+                break
+            remaining = pragma(conn, "freelist_count")
+            released += free_pages - remaining
+            free_pages = remaining
+            steps += 1
+    return {"released_pages": released, "free_pages": free_pages, "steps": steps}
+
+def optimize(thorough: bool = False) -> dict:
+    """Refresh planner statistics with ``PRAGMA optimize``.
+
+    ``analysis_limit`` keeps each ANALYZE to a sample of rows. A database that
+    was never analyzed (or ``thorough``) gets a full ``ANALYZE`` first.
+    """
+    with closing(connect()) as conn:
+        analyzed = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() is not None
+        if thorough:
+            conn.execute("PRAGMA analysis_limit = 0")
+            conn.execute("ANALYZE")
+        else:
+            conn.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+            if not analyzed:
+                conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
+    return {"analyzed": thorough or not analyzed}
+
+def integrity_check(thorough: bool = False) -> dict:
+    """``quick_check`` (or the slower ``integrity_check``) plus a count of foreign key violations.
+
+    The app never enables ``PRAGMA foreign_keys``, so orphaned rows are possible
+    and only reported; ``ok`` reflects file corruption alone.
+    """
+    check = "integrity_check" if thorough else "quick_check"
+    with closing(connect()) as conn:
+        problems = [row[0] for row in conn.execute(f"PRAGMA {check}").fetchall() if row[0] != "ok"]
+        orphans = conn.execute("PRAGMA foreign_key_check").fetchall()
+    return {
+        "ok": not problems,
+        "check": check,
+        "problems": problems[:20],
+        "foreign_key_violations": len(orphans),
+    }
+
+def prune_changes(thorough: bool = False) -> dict:
+    return {"deleted": changes.prune()}
+
+def compact() -> dict:
+    """Rewrite the whole file with ``VACUUM`` and switch it to incremental auto-vacuum.
+
+    This blocks writers for as long as the rewrite takes, so it is only run by
+    hand, never by the scheduler.
+    """
+    with closing(connect(timeout=30)) as conn:
+        before = pragma(conn, "page_count")
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        after = pragma(conn, "page_count")
+    return {"pages_before": before, "pages_after": after}
+
+TASKS: Dict[str, Callable[..., dict]] = {
+    "checkpoint": checkpoint,
+    "prune-changes": prune_changes,
+    "vacuum": incremental_vacuum,
+    "optimize": optimize,
+    "integrity": integrity_check,
+}
+
+def run_task(name: str, thorough: bool = False) -> dict:
+    """Run one task, time it, log it and record the outcome in ``maintenance_tasks``."""
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        detail = TASKS[name](thorough=thorough)
+    except sqlite3.Error as exc:
+        status, detail = "error", {"error": str(exc)}
+    else:
+        if detail.get("ok") is False:
+            status = "failed"
+    seconds = time.perf_counter() - start
+    if metrics.ENABLED:
+        metrics.MAINTENANCE_DURATION.observe((name, status), seconds)
+    level = logging.INFO if status == "ok" else logging.ERROR
+    logger.log(level, "Maintenance %s %s in %.3fs", name, status, seconds, extra={"task": name, **detail})
+    try:
+        with closing(connect()) as conn:
+            conn.execute(
+                """
+                INSERT INTO maintenance_tasks (task, next_run_at, last_started_at, last_seconds, last_status, last_detail)
+                VALUES (?, 0, ?, ?, ?, ?)
+                ON CONFLICT(task) DO UPDATE SET
+                    last_started_at = excluded.last_started_at,
+                    last_seconds = excluded.last_seconds,
+                    last_status = excluded.last_status,
+                    last_detail = excluded.last_detail
+                """,
+                (name, started_at, seconds, status, json.dumps(detail)),
+            )
+    except sqlite3.Error as exc:
+        logger.warning("Could not record maintenance run for %s: %s", name, exc)
+    return {"task": name, "status": status, "seconds": seconds, **detail}
+
+def claim(conn: sqlite3.Connection, task: str, interval: float, now: float) -> bool:
+    """Atomically take the next run of ``task`` if it is due; one worker wins."""
+    cursor = conn.execute(
+        """
+        INSERT INTO maintenance_tasks (task, next_run_at) VALUES (?, ?)
+        ON CONFLICT(task) DO UPDATE SET next_run_at = excluded.next_run_at
+        WHERE maintenance_tasks.next_run_at <= ?
+        """,
+        (task, now + interval, now),
+    )
+    return cursor.rowcount == 1
+
+def report() -> dict:
+    with closing(connect()) as conn:
+        stats = {
+            name: pragma(conn, name)
+            for name in ("page_size", "page_count", "freelist_count", "auto_vacuum", "journal_mode")
+        }
+        tasks = [dict(row) for row in conn.execute("SELECT * FROM maintenance_tasks ORDER BY task")]
+    wal = Path(items.DB_PATH + "-wal")
+    stats["wal_bytes"] = wal.stat().st_size if wal.exists() else 0
+    return {"database": stats, "tasks": tasks}
+
+class Scheduler:
+    """Background thread that runs at most one due task per tick.
+
+    Every worker runs one; ``claim`` makes sure each scheduled run happens in
+    only one of them.
+    """
+
+    def __init__(self, schedule: Dict[str, float] = SCHEDULE, tick: float = TICK_SECONDS,
+                 delay: float = STARTUP_DELAY):
+        self.schedule = schedule
+        self.tick = tick
+        self.delay = delay
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="maintenance", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+
+    def run(self):
+        if self.stopped.wait(self.delay):
+            return
+        while not self.stopped.is_set():
+            try:
+                self.run_due()
+            except Exception:
+                logger.exception("Maintenance tick failed")
+            self.stopped.wait(self.tick)
+
+    def run_due(self) -> Optional[dict]:
+        now = time.time()
+        with closing(connect()) as conn:
+            for task, interval in self.schedule.items():
+                try:
+                    if claim(conn, task, interval, now):
+                        break
+                except sqlite3.OperationalError:
+                    # Database busy; try again next tick.
+                    return None
+            else:
+                return None
+        return run_task(task)
+
+scheduler = Scheduler()
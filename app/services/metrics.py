@@ -0,0 +1,259 @@
+import hashlib
+import re
+import sqlite3
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.services.settings import settings
+
+ENABLED = settings.metrics_enabled
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{escape_label(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.values: Dict[Labels, float] = {}
+        self.lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1.0):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self.lock:
+            values = dict(self.values)
+        return [f"{self.name}{format_labels(self.label_names, labels)} {value}" for labels, value in sorted(values.items())]
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series: Dict[Labels, list] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, labels: Labels, value: float):
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self) -> List[str]:
+        with self.lock:
+            snapshot = {labels: (list(counts), total, count) for labels, (counts, total, count) in self.series.items()}
+        lines = []
+        for labels, (counts, total, count) in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = format_labels(self.label_names, labels, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            bucket_labels = format_labels(self.label_names, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{bucket_labels} {count}")
+            lines.append(f"{self.name}_sum{format_labels(self.label_names, labels)} {total}")
+            lines.append(f"{self.name}_count{format_labels(self.label_names, labels)} {count}")
+        return lines
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route", "status")
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "SQLite statement execution time by query hash.", ("query",)
+)
+DB_QUERY_ROWS = Counter("db_query_rows_total", "Rows returned or changed by query hash.", ("query",))
+TMDB_REQUEST_DURATION = Histogram(
+    "tmdb_request_duration_seconds", "TMDB API round trip time.", ("endpoint", "status")
+)
+TMDB_LOOKUPS = Counter("tmdb_lookups_total", "TMDB searches by where they were answered.", ("source",))
+IMAGE_RESIZE_DURATION = Histogram("image_resize_duration_seconds", "Upload save and crop time.")
+MAINTENANCE_DURATION = Histogram(
+    "maintenance_task_duration_seconds", "Database maintenance task run time.", ("task", "status"),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+REGISTRY = [
+    HTTP_REQUEST_DURATION,
+    DB_QUERY_DURATION,
+    DB_QUERY_ROWS,
+    TMDB_REQUEST_DURATION,
+    TMDB_LOOKUPS,
+    IMAGE_RESIZE_DURATION,
+    MAINTENANCE_DURATION,
+]
+
+_query_texts: Dict[str, str] = {}
+
+# Per-request totals that end up in the Server-Timing header.
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("server_timings", default=None)
+
+def add_timing(name: str, elapsed: float):
+    timings = _timings.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + elapsed
+
+@contextmanager
+def timer(histogram: Histogram, labels: Labels = (), timing: Optional[str] = None):
+    if not ENABLED:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        histogram.observe(labels, elapsed)
+        if timing:
+            add_timing(timing, elapsed)
+
+def record_tmdb_request(endpoint: str, status: str, elapsed: float):
+    if ENABLED:
+        TMDB_REQUEST_DURATION.observe((re.sub(r"/\d+", "/{id}", endpoint), status), elapsed)
+        add_timing("tmdb", elapsed)
+
+def record_tmdb_lookup(source: str):
+    if ENABLED:
+        TMDB_LOOKUPS.inc((source,))
+
+@lru_cache(maxsize=512)
+def query_key(sql: str) -> str:
+    normalized = " ".join(sql.split())
+    key = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+    _query_texts[key] = normalized[:300]
+    return key
+
+class TimedCursor(sqlite3.Cursor):
+    query: Optional[str] = None
+
+    def execute(self, sql, parameters=()):
+        self.query = query_key(sql)
+        start = perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.record(perf_counter() - start, max(self.rowcount, 0))
+
+    def executemany(self, sql, seq_of_parameters):
+        self.query = query_key(sql)
+        start = perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self.record(perf_counter() - start, max(self.rowcount, 0))
+
+    def fetchone(self):
+        start = perf_counter()
+        row = super().fetchone()
+        add_timing("db", perf_counter() - start)
+        if row is not None and self.query:
+            DB_QUERY_ROWS.inc((self.query,))
+        return row
+
+    def fetchall(self):
+        start = perf_counter()
+        rows = super().fetchall()
+        add_timing("db", perf_counter() - start)
+        if self.query:
+            DB_QUERY_ROWS.inc((self.query,), len(rows))
+        return rows
+
+    def record(self, elapsed: float, rows: int):
+        DB_QUERY_DURATION.observe((self.query,), elapsed)
+        if rows:
+            DB_QUERY_ROWS.inc((self.query,), rows)
+        add_timing("db", elapsed)
+
+class TimedConnection(sqlite3.Connection):
+    """Connection whose statements are timed per query hash (used when metrics are enabled)."""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+def connection_factory():
+    return TimedConnection if ENABLED else sqlite3.Connection
+
+def render() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    lines.append("# HELP db_query_info Normalised SQL text for each query hash.")
+    lines.append("# TYPE db_query_info gauge")
+    for key, text in sorted(_query_texts.items()):
+        lines.append(f"db_query_info{format_labels(('query', 'sql'), (key, text))} 1")
+    return "\n".join(lines) + "\n"
+
+def route_label(scope: dict) -> str:
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    if scope.get("path", "").startswith("/static/"):
+        return "/static"
+    return "unmatched"
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency and emitting Server-Timing."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = perf_counter()
+        timings: Dict[str, float] = {}
+        token = _timings.set(timings)
+        status = [500]
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                entries = [f"{name};dur={value * 1000:.2f}" for name, value in timings.items()]
+                entries.append(f"app;dur={(perf_counter() - start) * 1000:.2f}")
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"server-timing", ", ".join(entries).encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _timings.reset(token)
+            HTTP_REQUEST_DURATION.observe(
+                (scope["method"], route_label(scope), str(status[0])), perf_counter() - start
+            )
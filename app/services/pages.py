@@ -0,0 +1,122 @@
+import logging
+import time
+from pathlib import Path
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from typing import Optional
+from app.routers import items
+from app.services import changes, recommender
+from app.services.assets import static_url
+from app.services.fragments import FragmentCacheExtension
+from app.services.settings import settings
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = "app/templates"
+
+def template_environment() -> Environment:
+    # Compiled templates are kept on disk, so a fresh worker unmarshals them
+    # instead of parsing and compiling every template again.
+    Path(settings.template_cache_dir).mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=True,
+        bytecode_cache=FileSystemBytecodeCache(settings.template_cache_dir),
+        extensions=[FragmentCacheExtension],
+    )
+    env.globals["static_url"] = static_url
+    return env
+
+templates = Jinja2Templates(env=template_environment())
+
+def load_templates(clear: bool = False) -> dict:
+    """Load every template, compiling (and caching) the ones not compiled yet.
+
+    With ``clear`` the bytecode cache is emptied first, so everything is compiled afresh.
+    """
+    start = time.perf_counter()
+    env = templates.env
+    if clear:
+        env.bytecode_cache.clear()
+        env.cache.clear()
+    names = env.list_templates()
+    for name in names:
+        env.get_template(name)
+    seconds = time.perf_counter() - start
+    logger.info("Loaded %d templates in %.3fs", len(names), seconds)
+    return {"templates": len(names), "seconds": round(seconds, 3)}
+
+@changes.cached("watched", "want_to_watch", "blog_posts")
+def home_context() -> dict:
+    watched_list = items.get_watched_list()
+    want_to_watch_list = items.get_want_to_watch_list()
+    watched_ids = [item["id"] for item in watched_list]
+    blog_map = items.get_blog_slug_map(watched_ids)
+    for item in watched_list:
+        item["blog_slug"] = blog_map.get(item["id"])
+    watched_count = len(watched_list)
+    planned_count = len(want_to_watch_list)
+    watched_avg_score = (
+        sum(item.get("score", 0) for item in watched_list) / watched_count
+        if watched_count
+        else 0
+    )
+    planned_avg_excitement = (
+        sum(item.get("excitement", 0) for item in want_to_watch_list) / planned_count
+        if planned_count
+        else 0
+    )
+    return {
+        "watched_list": watched_list,
+        "want_to_watch_list": want_to_watch_list,
+        "watched_count": watched_count,
+        "planned_count": planned_count,
+        "watched_avg_score": round(watched_avg_score, 1),
+        "planned_avg_excitement": round(planned_avg_excitement, 1)
+    }
+
+@changes.cached("watched", "blog_posts")
+def top_context() -> dict:
+    all_top = items.get_top_list()
+    top_ids = [item["id"] for item in all_top]
+    blog_map = items.get_blog_slug_map(top_ids)
+    for item in all_top:
+        item["blog_slug"] = blog_map.get(item["id"])
+    top_movies = [item for item in all_top if item["content_type"] == "Movie"]
+    top_series = [item for item in all_top if item["content_type"] == "TV Series"]
+    return {"top_movies": top_movies, "top_series": top_series}
+
+BLOG_PAGE_SIZE = 12
+
+def blog_url(page: int = 1, month: Optional[str] = None) -> str:
+    """``/blog``, ``/blog/page/2``, ``/blog/2026/01`` or ``/blog/2026/01/page/2``."""
+    base = f"/blog/{month.replace('-', '/')}" if month else "/blog"
+    return base if page == 1 else f"{base}/page/{page}"
+
+@changes.cached("watched", "blog_posts", maxsize=256)
+def blog_context(page: int = 1, month: Optional[str] = None) -> Optional[dict]:
+    """One archive page of post excerpts, optionally limited to a ``YYYY-MM`` month."""
+    total = items.count_blog_posts(month)
+    page_count = max(1, -(-total // BLOG_PAGE_SIZE))
+    if page < 1 or page > page_count or (month and not total):
+        return None
+    return {
+        "posts": items.get_blog_page(BLOG_PAGE_SIZE, (page - 1) * BLOG_PAGE_SIZE, month),
+        "page": page,
+        "page_count": page_count,
+        "month": month,
+        "prev_url": blog_url(page - 1, month) if page > 1 else None,
+        "next_url": blog_url(page + 1, month) if page < page_count else None,
+        "months": [dict(row, url=blog_url(1, row["month"])) for row in items.get_blog_months()],
+    }
+
+@changes.cached("watched", "want_to_watch", "blog_posts", maxsize=256)
+def blog_post_context(slug: str) -> Optional[dict]:
+    post = items.get_blog_post_by_slug(slug)
+    if not post:
+        return None
+    similar = recommender.similar_titles("watched", post["watched_id"], limit=4, only="watched") or []
+    blog_map = items.get_blog_slug_map([item["id"] for item in similar])
+    for item in similar:
+        item["blog_slug"] = blog_map.get(item["id"])
+    return {"post": post, "similar": similar}
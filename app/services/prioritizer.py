@@ -0,0 +1,155 @@
+import itertools
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from app.routers import items
+from app.services import changes
+from app.services.recommender import split_genres
+
+logger = logging.getLogger(__name__)
+
+EXCITEMENT_WEIGHT = 0.45
+RATING_WEIGHT = 0.2
+AFFINITY_WEIGHT = 0.2
+PROXIMITY_WEIGHT = 0.15
+# Genres seen only a few times are pulled towards the overall mean score.
+AFFINITY_SHRINKAGE = 3.0
+PROXIMITY_DAYS = 90.0
+
+# Affinity is cached with the watched version it was computed for. Writers
+# only bump the version (no lock), so they never wait behind a refresh, and an
+# affinity computed from data older than the bump is never reused.
+_affinity: Optional[Tuple[int, Dict[str, float]]] = None
+_watched_versions = itertools.count(1)
+_watched_version = 0
+_lock = threading.Lock()
+# Full refreshes run on one background thread; writes arriving while it works
+# are folded into a single follow-up pass.
+_refresh_wanted = threading.Event()
+_refresher: Optional[threading.Thread] = None
+_refresher_lock = threading.Lock()
+
+def genre_affinity() -> Dict[str, float]:
+    """Per-genre offset of my watched scores from my overall mean, in [-1, 1]."""
+    with items.get_connection() as conn:
+        rows = conn.execute("SELECT score, genres FROM watched").fetchall()
+    if not rows:
+        return {}
+    scores = np.array([row["score"] for row in rows], dtype=np.float64)
+    mean = scores.mean()
+    totals: Dict[str, List[float]] = {}
+    for row in rows:
+        for genre in split_genres(row["genres"]):
+            totals.setdefault(genre, []).append(row["score"] - mean)
+    return {
+        genre: float(np.sum(deltas) / (len(deltas) + AFFINITY_SHRINKAGE) / 10.0)
+        for genre, deltas in totals.items()
+    }
+
+def get_affinity() -> Dict[str, float]:
+    global _affinity
+    if _affinity is None or _affinity[0] != _watched_version:
+        version = _watched_version
+        _affinity = (version, genre_affinity())
+    return _affinity[1]
+
+def forget_affinity_now():
+    global _watched_version
+    _watched_version = next(_watched_versions)
+
+def days_until(value: Optional[str], today: date) -> float:
+    try:
+        return float((date.fromisoformat(value) - today).days)
+    except (TypeError, ValueError):
+        return np.nan
+
+def score_rows(rows: List[dict], affinity: Dict[str, float], today: Optional[date] = None) -> np.ndarray:
+    today = today or date.today()
+    excitement = np.array([row["excitement"] for row in rows], dtype=np.float64) / 10.0
+    rating = np.array(
+        [row["tmdb_rating"] if row["tmdb_rating"] is not None else np.nan for row in rows],
+        dtype=np.float64,
+    ) / 10.0
+    rating = np.where(np.isnan(rating), 0.5, rating)
+    genre_fit = np.array(
+        [
+            np.mean([affinity.get(genre, 0.0) for genre in genres]) if genres else 0.0
+            for genres in (split_genres(row["genres"]) for row in rows)
+        ],
+        dtype=np.float64,
+    )
+    days = np.array([days_until(row["launch_date"], today) for row in rows], dtype=np.float64)
+    proximity = np.where(np.isnan(days), 0.0, np.exp(-np.abs(days) / PROXIMITY_DAYS))
+    priority = (
+        EXCITEMENT_WEIGHT * excitement
+        + RATING_WEIGHT * rating
+        + AFFINITY_WEIGHT * (genre_fit + 0.5)
+        + PROXIMITY_WEIGHT * proximity
+    )
+    return np.round(priority * 100.0, 2)
+
+def refresh_priorities(item_ids: Optional[Iterable[int]] = None) -> int:
+    """Recompute and persist ``priority`` for the given queued ids, or for all of them."""
+    query = "SELECT id, excitement, tmdb_rating, genres, launch_date FROM want_to_watch"
+    params: list = []
+    if item_ids is not None:
+        params = list(item_ids)
+        if not params:
+            return 0
+        query += f" WHERE id IN ({','.join('?' for _ in params)})"
+    with _lock:
+        affinity = get_affinity()
+        with items.get_connection() as conn:
+            rows = [dict(row) for row in conn.execute(query, params).fetchall()]
+            if not rows:
+                return 0
+            priorities = score_rows(rows, affinity)
+            conn.executemany(
+                "UPDATE want_to_watch SET priority = ? WHERE id = ?",
+                [(float(priority), row["id"]) for priority, row in zip(priorities, rows)],
+            )
+            conn.commit()
+    logger.debug("Refreshed priority for %d queued titles", len(rows))
+    return len(rows)
+
+def schedule_refresh():
+    """Refresh every queued title's priority soon, off the caller's thread."""
+    global _refresher
+    _refresh_wanted.set()
+    with _refresher_lock:
+        if _refresher is None or not _refresher.is_alive():
+            _refresher = threading.Thread(target=run_refresher, name="refresh-priorities", daemon=True)
+            _refresher.start()
+
+def seconds_until_midnight(now: Optional[datetime] = None) -> float:
+    now = now or datetime.now()
+    return (datetime.combine(now.date() + timedelta(days=1), datetime.min.time()) - now).total_seconds()
+
+def run_refresher():
+    while True:
+        # Proximity counts days from today, so every score goes stale at
+        # midnight even when nothing is written; the wait times out then.
+        _refresh_wanted.wait(timeout=seconds_until_midnight())
+        _refresh_wanted.clear()
+        try:
+            refresh_priorities()
+        except Exception:
+            logger.exception("Refreshing queue priorities failed")
+
+@changes.on_invalidate
+def forget_affinity(table: str, action: str, item_id: Optional[int]):
+    # Another worker's watched write changes genre affinity here too.
+    if table == "watched":
+        forget_affinity_now()
+
+@items.on_change
+def refresh_on_change(table: str, action: str, item_id: int):
+    if table == "watched":
+        # Affinity is relative to the mean of all scores, so one watched row
+        # can move every queued title; rescoring them all stays out of the request.
+        forget_affinity_now()
+        schedule_refresh()
+    elif table == "want_to_watch" and action != "delete":
+        refresh_priorities([item_id])
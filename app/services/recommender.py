@@ -0,0 +1,201 @@
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.routers import items
+from app.services import changes
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("watched", "want_to_watch")
+CONTENT_TYPES = ("Movie", "TV Series")
+
+# Numeric features are centred on 0 so that a missing value contributes nothing
+# to the cosine, and weighted below the genre block which carries most signal.
+NUMERIC_WEIGHT = 0.5
+NUMERIC_FEATURES = 4
+FIXED_FEATURES = NUMERIC_FEATURES + len(CONTENT_TYPES)
+
+SOURCE_COLUMNS = {
+    "watched": "id, title, score AS rating, tmdb_rating, release_year, runtime, genres, content_type, poster_url, image_url",
+    "want_to_watch": "id, title, excitement AS rating, tmdb_rating, release_year, runtime, genres, content_type, poster_url, image_url",
+}
+
+Key = Tuple[str, int]
+
+def split_genres(genres: Optional[str]) -> List[str]:
+    if not genres:
+        return []
+    return [genre.strip() for genre in genres.split(",") if genre.strip()]
+
+def scaled(value, low: float, high: float) -> float:
+    if value is None:
+        return 0.0
+    return float(min(max((value - low) / (high - low), 0.0), 1.0)) - 0.5
+
+class SimilarityIndex:
+    """Row-normalised feature matrix over watched and want-to-watch titles.
+
+    Rows are appended, overwritten or swapped out in place, so writes cost
+    O(features) and queries are a single matrix-vector product.
+    """
+
+    def __init__(self, capacity: int = 256, genre_capacity: int = 32):
+        self.genre_columns: Dict[str, int] = {}
+        self.matrix = np.zeros((capacity, FIXED_FEATURES + genre_capacity), dtype=np.float32)
+        self.source_codes = np.zeros(capacity, dtype=np.int8)
+        self.keys: List[Key] = []
+        self.rows: Dict[Key, int] = {}
+        self.meta: Dict[Key, dict] = {}
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def genre_column(self, genre: str) -> int:
+        column = self.genre_columns.get(genre)
+        if column is None:
+            column = FIXED_FEATURES + len(self.genre_columns)
+            if column >= self.matrix.shape[1]:
+                grown = np.zeros((self.matrix.shape[0], self.matrix.shape[1] * 2), dtype=np.float32)
+                grown[:, :self.matrix.shape[1]] = self.matrix
+                self.matrix = grown
+            self.genre_columns[genre] = column
+        return column
+
+    def vectorize(self, row: dict) -> np.ndarray:
+        vector = np.zeros(self.matrix.shape[1], dtype=np.float32)
+        vector[0] = scaled(row.get("rating"), 0, 10) * NUMERIC_WEIGHT
+        vector[1] = scaled(row.get("tmdb_rating"), 0, 10) * NUMERIC_WEIGHT
+        vector[2] = scaled(row.get("release_year"), 1950, 2030) * NUMERIC_WEIGHT
+        vector[3] = scaled(row.get("runtime"), 20, 200) * NUMERIC_WEIGHT
+        if row.get("content_type") in CONTENT_TYPES:
+            vector[NUMERIC_FEATURES + CONTENT_TYPES.index(row["content_type"])] = NUMERIC_WEIGHT
+        genres = split_genres(row.get("genres"))
+        columns = [self.genre_column(genre) for genre in genres]
+        if len(vector) < self.matrix.shape[1]:
+            vector = np.pad(vector, (0, self.matrix.shape[1] - len(vector)))
+        for column in columns:
+            vector[column] = 1.0 / np.sqrt(len(columns))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def upsert(self, source: str, row: dict):
+        key = (source, row["id"])
+        with self.lock:
+            vector = self.vectorize(row)
+            position = self.rows.get(key)
+            if position is None:
+                position = len(self.keys)
+                if position >= self.matrix.shape[0]:
+                    grown = np.zeros((self.matrix.shape[0] * 2, self.matrix.shape[1]), dtype=np.float32)
+                    grown[:position] = self.matrix[:position]
+                    self.matrix = grown
+                    self.source_codes = np.resize(self.source_codes, self.matrix.shape[0])
+                self.keys.append(key)
+                self.rows[key] = position
+            self.matrix[position] = vector
+            self.source_codes[position] = SOURCES.index(source)
+            self.meta[key] = {
+                "source": source,
+                "id": row["id"],
+                "title": row.get("title"),
+                "content_type": row.get("content_type"),
+                "release_year": row.get("release_year"),
+                "genres": row.get("genres"),
+                "poster_url": row.get("poster_url") or row.get("image_url"),
+            }
+
+    def remove(self, source: str, item_id: int):
+        key = (source, item_id)
+        with self.lock:
+            position = self.rows.pop(key, None)
+            if position is None:
+                return
+            self.meta.pop(key, None)
+            last = len(self.keys) - 1
+            if position != last:
+                moved = self.keys[last]
+                self.matrix[position] = self.matrix[last]
+                self.source_codes[position] = self.source_codes[last]
+                self.keys[position] = moved
+                self.rows[moved] = position
+            self.matrix[last] = 0
+            self.keys.pop()
+
+    def similar(self, source: str, item_id: int, limit: int = 5, only: Optional[str] = None) -> Optional[List[dict]]:
+        key = (source, item_id)
+        with self.lock:
+            position = self.rows.get(key)
+            if position is None:
+                return None
+            count = len(self.keys)
+            scores = self.matrix[:count] @ self.matrix[position]
+            scores[position] = -np.inf
+            if only is not None:
+                scores[self.source_codes[:count] != SOURCES.index(only)] = -np.inf
+            limit = min(limit, count - 1)
+            if limit <= 0:
+                return []
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            top = top[np.argsort(-scores[top])]
+            results = []
+            for row in top:
+                if not np.isfinite(scores[row]):
+                    continue
+                match = dict(self.meta[self.keys[row]])
+                match["similarity"] = round(float(scores[row]), 4)
+                results.append(match)
+            return results
+
+_index: Optional[SimilarityIndex] = None
+_index_lock = threading.Lock()
+
+def fetch_rows(source: str, item_id: Optional[int] = None) -> List[dict]:
+    query = f"SELECT {SOURCE_COLUMNS[source]} FROM {source}"
+    params: tuple = ()
+    if item_id is not None:
+        query += " WHERE id = ?"
+        params = (item_id,)
+    with items.get_connection() as conn:
+        return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+def get_index() -> SimilarityIndex:
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = SimilarityIndex()
+                for source in SOURCES:
+                    for row in fetch_rows(source):
+                        index.upsert(source, row)
+                logger.info("Built similarity index with %d titles and %d genres", len(index), len(index.genre_columns))
+                _index = index
+    return _index
+
+def similar_titles(source: str, item_id: int, limit: int = 5, only: Optional[str] = None) -> Optional[List[dict]]:
+    """Return the ``limit`` most similar titles, or None if the item is unknown."""
+    changes.sync()
+    return get_index().similar(source, item_id, limit=limit, only=only)
+
+@changes.on_invalidate
+def refresh_item(table: str, action: str, item_id: Optional[int]):
+    global _index
+    if table not in SOURCES:
+        return
+    # Waits for an in-flight build so a write committed mid-build is not lost.
+    with _index_lock:
+        if action == "reset":
+            _index = None
+            return
+        index = _index
+    if index is None:
+        return
+    if action == "delete":
+        index.remove(table, item_id)
+        return
+    rows = fetch_rows(table, item_id)
+    if rows:
+        index.upsert(table, rows[0])
+    else:
+        index.remove(table, item_id)
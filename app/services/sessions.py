@@ -0,0 +1,166 @@
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import time
+from pathlib import Path
+from typing import Optional
+from app.services.settings import settings
+
+logger = logging.getLogger(__name__)
+
+COOKIE_NAME = "crm_session"
+SESSION_TTL = settings.session_ttl
+KEY_PATH = settings.session_key_path
+# Unset means "Secure only when the request came in over https".
+COOKIE_SECURE = settings.session_cookie_secure
+HASH_ALGORITHM = "pbkdf2_sha256"
+HASH_ITERATIONS = 600_000
+
+def b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def load_key() -> bytes:
+    """HMAC key from ``SESSION_SECRET``, or a random key persisted at ``KEY_PATH``.
+
+    Persisting the generated key keeps sessions valid across restarts and
+    shared between worker processes.
+    """
+    secret = settings.session_secret
+    if secret:
+        return hashlib.sha256(secret.encode("utf-8")).digest()
+    path = Path(KEY_PATH)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        key = secrets.token_bytes(32)
+        try:
+            with open(path, "xb") as handle:
+                handle.write(key)
+            os.chmod(path, 0o600)
+            logger.info("Generated session key at %s", path)
+            return key
+        except FileExistsError:
+            # Another worker won the race.
+            return path.read_bytes()
+
+_key: Optional[bytes] = None
+
+def get_key() -> bytes:
+    global _key
+    if _key is None:
+        _key = load_key()
+    return _key
+
+def sign(payload: str) -> str:
+    return b64encode(hmac.new(get_key(), payload.encode("ascii"), hashlib.sha256).digest())
+
+def issue(username: str, ttl: int = SESSION_TTL) -> str:
+    """Return ``<payload>.<signature>`` where payload encodes the username and expiry."""
+    payload = b64encode(f"{int(time.time()) + ttl}:{username}".encode("utf-8"))
+    return f"{payload}.{sign(payload)}"
+
+def verify(token: str) -> Optional[tuple]:
+    """Return ``(username, expires_at)`` for a valid, unexpired token, else ``None``."""
+    payload, _, signature = token.partition(".")
+    if not payload or not signature:
+        return None
+    try:
+        expected = sign(payload)
+    except UnicodeEncodeError:
+        return None
+    if not hmac.compare_digest(expected, signature):
+        return None
+    try:
+        expires, _, username = b64decode(payload).decode("utf-8").partition(":")
+        expires_at = int(expires)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if expires_at <= time.time():
+        return None
+    return username, expires_at
+
+def hash_password(password: str, iterations: int = HASH_ITERATIONS) -> str:
+    """Encode ``password`` as ``pbkdf2_sha256$<iterations>$<salt>$<hash>`` for BASIC_AUTH_PASSWORD_HASH."""
+    salt = secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return f"{HASH_ALGORITHM}${iterations}${b64encode(salt)}${b64encode(digest)}"
+
+class PasswordChecker:
+    """Constant-time check against a plaintext or PBKDF2-hashed password, loaded once.
+
+    Successful checks are remembered by keyed digest so repeated Basic-auth
+    requests skip the key derivation.
+    """
+
+    def __init__(self, password: Optional[str] = None, password_hash: Optional[str] = None):
+        self.password = password
+        self.hash = None
+        if password_hash:
+            algorithm, iterations, salt, digest = password_hash.split("$")
+            if algorithm != HASH_ALGORITHM:
+                raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+            self.hash = (int(iterations), b64decode(salt), b64decode(digest))
+        self.verified = set()
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.password or self.hash)
+
+    def check(self, password: str) -> bool:
+        if self.hash is None:
+            return self.password is not None and hmac.compare_digest(
+                password.encode("utf-8"), self.password.encode("utf-8")
+            )
+        fingerprint = hmac.new(get_key(), password.encode("utf-8"), hashlib.sha256).digest()
+        if fingerprint in self.verified:
+            return True
+        iterations, salt, digest = self.hash
+        candidate = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+        if not hmac.compare_digest(candidate, digest):
+            return False
+        self.verified.add(fingerprint)
+        return True
+
+class SessionCookieMiddleware:
+    """ASGI middleware that sets the session cookie chosen during authentication.
+
+    The auth dependency stores a freshly issued token in ``request.state``;
+    this works for endpoints that return their own ``Response`` too.
+    """
+
+    def __init__(self, app, secure: Optional[bool] = COOKIE_SECURE):
+        self.app = app
+        self.secure = secure
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start":
+                state = scope.get("state") or {}
+                token = state.get("session_token")
+                if token is not None:
+                    secure = self.secure if self.secure is not None else scope.get("scheme") == "https"
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"set-cookie", cookie_header(token, secure).encode("latin-1"))
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+def cookie_header(token: str, secure: bool) -> str:
+    """Set-Cookie value; an empty token clears the cookie."""
+    max_age = SESSION_TTL if token else 0
+    parts = [f"{COOKIE_NAME}={token}", "Path=/", f"Max-Age={max_age}", "HttpOnly", "SameSite=Strict"]
+    if secure:
+        parts.append("Secure")
+    return "; ".join(parts)
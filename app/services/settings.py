@@ -0,0 +1,67 @@
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+from dotenv import find_dotenv, load_dotenv
+
+TRUTHY = {"1", "true", "yes", "on"}
+
+def env_flag(name: str) -> Optional[bool]:
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return None
+    return value in TRUTHY
+
+@dataclass(frozen=True)
+class Settings:
+    """Process configuration, read once from the environment and ``app/.env``."""
+
+    env_file: Optional[str]
+    db_path: str
+    tmdb_api_base: str
+    tmdb_index_path: str
+    site_url: str
+    metrics_enabled: bool
+    log_level: str
+    log_format: Optional[str]
+    session_ttl: int
+    session_key_path: str
+    session_cookie_secure: Optional[bool]
+    maintenance_enabled: bool
+    backup_dir: str
+    text_codec: Optional[str]
+    template_cache_dir: str
+    tmdb_api_key: Optional[str] = field(default=None, repr=False)
+    basic_auth_username: Optional[str] = None
+    basic_auth_password: Optional[str] = field(default=None, repr=False)
+    basic_auth_password_hash: Optional[str] = field(default=None, repr=False)
+    session_secret: Optional[str] = field(default=None, repr=False)
+
+def load_settings() -> Settings:
+    # Real environment variables win over app/.env.
+    env_file = find_dotenv(filename="app/.env", usecwd=True) or None
+    if env_file:
+        load_dotenv(dotenv_path=env_file)
+    return Settings(
+        env_file=env_file,
+        db_path=os.getenv("APP_DB_PATH", "app/data/app.db"),
+        tmdb_api_base=os.getenv("TMDB_API_BASE", "https://api.themoviedb.org/3"),
+        tmdb_index_path=os.getenv("TMDB_INDEX_PATH", "app/data/tmdb_index.db"),
+        site_url=os.getenv("SITE_URL", "http://localhost:8000"),
+        metrics_enabled=bool(env_flag("METRICS_ENABLED")),
+        log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        log_format=os.getenv("LOG_FORMAT", "").lower() or None,
+        session_ttl=int(os.getenv("SESSION_TTL", "3600")),
+        session_key_path=os.getenv("SESSION_KEY_PATH", "app/data/session.key"),
+        session_cookie_secure=env_flag("SESSION_COOKIE_SECURE"),
+        maintenance_enabled=env_flag("MAINTENANCE_ENABLED") is not False,
+        backup_dir=os.getenv("BACKUP_DIR", "app/data/backups"),
+        text_codec=os.getenv("TEXT_CODEC", "").strip().lower() or None,
+        template_cache_dir=os.getenv("TEMPLATE_CACHE_DIR", "app/data/template_cache"),
+        tmdb_api_key=os.getenv("TMDB_API_KEY") or None,
+        basic_auth_username=os.getenv("BASIC_AUTH_USERNAME") or None,
+        basic_auth_password=os.getenv("BASIC_AUTH_PASSWORD") or None,
+        basic_auth_password_hash=os.getenv("BASIC_AUTH_PASSWORD_HASH") or None,
+        session_secret=os.getenv("SESSION_SECRET") or None,
+    )
+
+settings = load_settings()
@@ -0,0 +1,169 @@
+import gzip
+import hashlib
+import json
+import logging
+import shutil
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+from app.routers import items
+from app.services import assets, feeds, pages
+from app.services.pages import templates
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+TEMPLATES_DIR = Path("app/templates")
+STATIC_DIR = Path("app/static")
+MANIFEST_NAME = ".build-manifest.json"
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".xml", ".json", ".svg", ".txt"}
+
+def public_pages(base_url: Optional[str] = None) -> List[Tuple[str, str, Callable[[], Optional[dict]]]]:
+    """Return (url path, template, context builder) for every public page.
+
+    Feeds link their entries under ``base_url`` (default: ``SITE_URL``).
+    """
+    entries = [
+        ("/", "index.html", pages.home_context),
+        ("/top", "top.html", pages.top_context),
+        ("/blog", "blog.html", pages.blog_context),
+    ]
+    blog = pages.blog_context()
+    for page in range(2, blog["page_count"] + 1):
+        entries.append((pages.blog_url(page), "blog.html", lambda page=page: pages.blog_context(page)))
+    for row in items.get_blog_months():
+        month = row["month"]
+        first = pages.blog_context(1, month)
+        for page in range(1, first["page_count"] + 1):
+            entries.append((pages.blog_url(page, month), "blog.html",
+                            lambda page=page, month=month: pages.blog_context(page, month)))
+    for name, kind, slug in feeds.feed_variants():
+        entries.append((feeds.feed_path(name, kind, slug), feeds.FORMATS[name][0],
+                        lambda name=name, kind=kind, slug=slug: feeds.feed_context(name, kind, slug, base_url)))
+    for slug in items.get_blog_slugs():
+        entries.append((f"/blog/{slug}", "blog_post.html", lambda slug=slug: pages.blog_post_context(slug)))
+    return entries
+
+def output_file(out_dir: Path, url_path: str) -> Path:
+    # Feeds are files in their own right; pages become directory indexes.
+    if url_path.endswith(".xml"):
+        return out_dir / url_path.strip("/")
+    return out_dir / url_path.strip("/") / "index.html"
+
+def content_hash(template_name: str, context: dict, assets_digest: str = "") -> str:
+    digest = hashlib.sha256()
+    digest.update((TEMPLATES_DIR / template_name).read_bytes())
+    # Pages link stylesheets and scripts by fingerprint, so a changed asset changes the page.
+    digest.update(assets_digest.encode("ascii"))
+    digest.update(json.dumps(context, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+def write_compressed(path: Path, data: bytes):
+    path.write_bytes(data)
+    with open(f"{path}.gz", "wb") as raw:
+        with gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=9, mtime=0) as gz:
+            gz.write(data)
+    if brotli is not None:
+        Path(f"{path}.br").write_bytes(brotli.compress(data))
+
+def remove_output(path: Path):
+    for candidate in (path, Path(f"{path}.gz"), Path(f"{path}.br")):
+        candidate.unlink(missing_ok=True)
+    parent = path.parent
+    if parent.exists() and not any(parent.iterdir()):
+        parent.rmdir()
+
+def load_manifest(out_dir: Path) -> Dict[str, dict]:
+    manifest_path = out_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    try:
+        return json.loads(manifest_path.read_text())
+    except ValueError:
+        logger.warning("Ignoring unreadable build manifest at %s", manifest_path)
+        return {}
+
+def copy_static(out_dir: Path) -> int:
+    copied = 0
+    for source in STATIC_DIR.rglob("*"):
+        if not source.is_file():
+            continue
+        target = out_dir / "static" / source.relative_to(STATIC_DIR)
+        source_stat = source.stat()
+        if target.exists():
+            target_stat = target.stat()
+            if target_stat.st_size == source_stat.st_size and target_stat.st_mtime >= source_stat.st_mtime:
+                continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+        if source.suffix in COMPRESSIBLE_SUFFIXES:
+            write_compressed(target, source.read_bytes())
+        copied += 1
+    return copied
+
+def render_sitemap(manifest: Dict[str, dict], base_url: str) -> bytes:
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for url_path in sorted(manifest):
+        if url_path.endswith(".xml"):
+            continue
+        entry = manifest[url_path]
+        lines.append("  <url>")
+        lines.append(f"    <loc>{escape(base_url.rstrip('/') + url_path)}</loc>")
+        lines.append(f"    <lastmod>{entry['lastmod']}</lastmod>")
+        lines.append("  </url>")
+    lines.append("</urlset>")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+def build_static(out_dir: str, base_url: str = "", force: bool = False, include_static: bool = True) -> dict:
+    """Render the public pages into ``out_dir``, skipping pages whose data is unchanged."""
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    previous = {} if force else load_manifest(out_path)
+    manifest: Dict[str, dict] = {}
+    rendered: List[str] = []
+    today = date.today().isoformat()
+    assets_digest = assets.assets_digest()
+
+    for url_path, template_name, build_context in public_pages(base_url or None):
+        context = build_context()
+        if context is None:
+            continue
+        digest = content_hash(template_name, context, assets_digest)
+        target = output_file(out_path, url_path)
+        old_entry = previous.get(url_path)
+        if old_entry and old_entry["hash"] == digest and target.exists():
+            manifest[url_path] = old_entry
+            continue
+        html = templates.get_template(template_name).render(context)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_compressed(target, html.encode("utf-8"))
+        manifest[url_path] = {"hash": digest, "lastmod": today}
+        rendered.append(url_path)
+
+    removed = [url_path for url_path in previous if url_path not in manifest]
+    for url_path in removed:
+        remove_output(output_file(out_path, url_path))
+
+    if rendered or removed or not (out_path / "sitemap.xml").exists():
+        write_compressed(out_path / "sitemap.xml", render_sitemap(manifest, base_url))
+    (out_path / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    copied = copy_static(out_path) if include_static else 0
+    logger.info(
+        "Static build finished: %d rendered, %d unchanged, %d removed, %d static files copied",
+        len(rendered), len(manifest) - len(rendered), len(removed), copied,
+    )
+    return {
+        "rendered": rendered,
+        "unchanged": len(manifest) - len(rendered),
+        "removed": removed,
+        "static_copied": copied,
+    }
@@ -0,0 +1,44 @@
+import sqlite3
+import zlib
+from typing import Optional, Tuple
+from app.services.settings import settings
+
+try:
+    # Standard library from Python 3.14.
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+CODECS = {"raw", "zlib"} | ({"zstd"} if zstd is not None else set())
+# TEXT_CODEC=zlib keeps a database readable by Python versions without zstd.
+CODEC = settings.text_codec if settings.text_codec in CODECS else ("zstd" if zstd is not None else "zlib")
+ZLIB_LEVEL = 6
+# Shorter texts are stored as they are; compression would barely cover its own header.
+MIN_COMPRESS_BYTES = 256
+
+def pack(text: str, codec: str = CODEC) -> Tuple[str, bytes]:
+    """Encode ``text`` for a side table; returns the codec actually used and the bytes."""
+    raw = text.encode("utf-8")
+    if codec == "raw" or len(raw) < MIN_COMPRESS_BYTES:
+        return "raw", raw
+    data = zstd.compress(raw) if codec == "zstd" else zlib.compress(raw, ZLIB_LEVEL)
+    if len(data) >= len(raw):
+        return "raw", raw
+    return codec, data
+
+def unpack(codec: Optional[str], data: Optional[bytes]) -> Optional[str]:
+    if data is None:
+        return None
+    if codec == "zlib":
+        data = zlib.decompress(data)
+    elif codec == "zstd":
+        if zstd is None:
+            raise ValueError("Text was stored with zstd, which needs Python 3.14 or newer")
+        data = zstd.decompress(data)
+    elif codec != "raw":
+        raise ValueError(f"Unknown text codec {codec!r}")
+    return data.decode("utf-8")
+
+def register(conn: sqlite3.Connection):
+    """Make ``unpack_text(codec, data)`` available to SQL on ``conn``."""
+    conn.create_function("unpack_text", 2, unpack, deterministic=True)
@@ -0,0 +1,290 @@
+import gzip
+import json
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional
+from app.services import metrics
+from app.services.settings import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = settings.tmdb_index_path
+INDEX_SCHEMA_VERSION = 2
+MEDIA_TYPES = {"movie", "tv"}
+BATCH_SIZE = 10000
+CANDIDATES = 200
+# A query TMDB answered this recently is replayed from the index instead of asked again.
+SEARCH_TTL = 24 * 60 * 60
+
+# FTS5 walks matches in rowid order, so ids double as a static ranking:
+# titles seen in TMDB responses get negative ids (most recent first) and
+# export rows are inserted by descending popularity.  A query can then stop
+# after CANDIDATES matches instead of scoring every document.
+
+def get_connection():
+    conn = sqlite3.connect(INDEX_PATH, factory=metrics.connection_factory())
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def init_index():
+    Path(INDEX_PATH).parent.mkdir(parents=True, exist_ok=True)
+    with get_connection() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] == INDEX_SCHEMA_VERSION:
+            return
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS titles (
+                id INTEGER PRIMARY KEY,
+                tmdb_id INTEGER NOT NULL,
+                media_type TEXT NOT NULL,
+                title TEXT NOT NULL,
+                release_date TEXT,
+                year INTEGER,
+                overview TEXT,
+                poster_url TEXT,
+                rating REAL,
+                popularity REAL NOT NULL DEFAULT 0,
+                UNIQUE (media_type, tmdb_id)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS titles_fts USING fts5(
+                title,
+                content='titles',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='1 2 3 4',
+                detail=none
+            )
+            """
+        )
+        conn.executescript(
+            """
+            CREATE TRIGGER IF NOT EXISTS titles_ai AFTER INSERT ON titles BEGIN
+                INSERT INTO titles_fts(rowid, title) VALUES (new.id, new.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS titles_ad AFTER DELETE ON titles BEGIN
+                INSERT INTO titles_fts(titles_fts, rowid, title) VALUES ('delete', old.id, old.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS titles_au AFTER UPDATE OF title ON titles BEGIN
+                INSERT INTO titles_fts(titles_fts, rowid, title) VALUES ('delete', old.id, old.title);
+                INSERT INTO titles_fts(rowid, title) VALUES (new.id, new.title);
+            END;
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS searches (
+                query TEXT PRIMARY KEY,
+                results TEXT NOT NULL,
+                searched_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        conn.commit()
+
+def match_expression(query: str, prefix: bool = True) -> Optional[str]:
+    """Whole-word match on every token except the last, which is a prefix."""
+    tokens = re.findall(r"\w+", query.lower())
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    if prefix:
+        terms[-1] += "*"
+    return " AND ".join(terms)
+
+def normalize_query(query: str) -> str:
+    return " ".join(re.findall(r"\w+", query.lower()))
+
+def as_result(row) -> dict:
+    return {
+        "id": row["tmdb_id"],
+        "media_type": row["media_type"],
+        "title": row["title"],
+        "release_date": row["release_date"],
+        "year": row["year"],
+        "overview": row["overview"],
+        "poster_url": row["poster_url"],
+        "rating": row["rating"],
+    }
+
+def cached_search(query: str, media_type: Optional[str] = None, ttl: float = SEARCH_TTL) -> Optional[List[dict]]:
+    """The results TMDB gave for ``query`` within the last ``ttl`` seconds, in its order; None on a miss."""
+    try:
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT results, searched_at FROM searches WHERE query = ?", (normalize_query(query),)
+            ).fetchone()
+            if row is None or time.time() - row["searched_at"] > ttl:
+                return None
+            keys = [tuple(key) for key in json.loads(row["results"])]
+            rows = {
+                (title["media_type"], title["tmdb_id"]): title
+                for key in keys
+                for title in conn.execute(
+                    "SELECT tmdb_id, media_type, title, release_date, year, overview, poster_url, rating "
+                    "FROM titles WHERE media_type = ? AND tmdb_id = ?",
+                    key,
+                )
+            }
+    except sqlite3.OperationalError as exc:
+        logger.warning("Local title index unavailable: %s", exc)
+        return None
+    if len(rows) < len(keys):
+        return None
+    return [as_result(rows[key]) for key in keys if not media_type or key[0] == media_type]
+
+def record_search(query: str, results: Iterable[dict]):
+    """Remember which titles (already passed to ``record_results``) TMDB returned for ``query``."""
+    keys = [[result["media_type"], result["id"]] for result in results
+            if result.get("id") and result.get("title") and result.get("media_type") in MEDIA_TYPES]
+    try:
+        with get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO searches (query, results, searched_at) VALUES (?, ?, ?)",
+                (normalize_query(query), json.dumps(keys), time.time()),
+            )
+            conn.commit()
+    except sqlite3.Error as exc:
+        logger.warning("Could not record TMDB search in local index: %s", exc)
+
+def search(query: str, media_type: Optional[str] = None, limit: int = 20) -> List[dict]:
+    """Ranked autocomplete over the local title index."""
+    if match_expression(query) is None:
+        return []
+    sql = """
+        SELECT t.id, t.tmdb_id, t.media_type, t.title, t.release_date, t.year, t.overview,
+               t.poster_url, t.rating, t.popularity
+        FROM titles_fts
+        CROSS JOIN titles t ON t.id = titles_fts.rowid
+        WHERE titles_fts MATCH ?
+    """
+    sql += " LIMIT ?"
+    try:
+        with get_connection() as conn:
+            # Whole-word matches stream lazily; a prefix over a long token has to
+            # merge every matching term first, so only run it when still short.
+            rows = conn.execute(sql, (match_expression(query, prefix=False), CANDIDATES)).fetchall()
+            if len(rows) < CANDIDATES:
+                seen = {row["id"] for row in rows}
+                rows += [
+                    row for row in conn.execute(sql, (match_expression(query), CANDIDATES)).fetchall()
+                    if row["id"] not in seen
+                ][:CANDIDATES - len(rows)]
+    except sqlite3.OperationalError as exc:
+        logger.warning("Local title index unavailable: %s", exc)
+        return []
+
+    needle = normalize_query(query)
+
+    def rank(row) -> tuple:
+        title = normalize_query(row["title"])
+        return (
+            title != needle,
+            not title.startswith(needle),
+            row["id"] > 0,
+            -(row["popularity"] or 0),
+        )
+
+    if media_type:
+        rows = [row for row in rows if row["media_type"] == media_type]
+    return [as_result(row) for row in sorted(rows, key=rank)[:limit]]
+
+def record_results(results: Iterable[dict]):
+    """Store titles returned by TMDB search/detail responses (already normalised)."""
+    results = [
+        result for result in results
+        if result.get("id") and result.get("title") and result.get("media_type") in MEDIA_TYPES
+    ]
+    if not results:
+        return
+    try:
+        with get_connection() as conn:
+            # Take the write lock up front so concurrent searches cannot both miss
+            # the same title and then collide on the unique key.
+            conn.execute("BEGIN IMMEDIATE")
+            next_id = conn.execute("SELECT MIN(0, COALESCE(MIN(id), 0)) - 1 FROM titles").fetchone()[0]
+            for result in results:
+                key = (result["media_type"], result["id"])
+                existing = conn.execute(
+                    "SELECT id, release_date, year, overview, poster_url, rating, popularity "
+                    "FROM titles WHERE media_type = ? AND tmdb_id = ?",
+                    key,
+                ).fetchone()
+                merged = {
+                    field: result.get(field) if result.get(field) is not None else (existing[field] if existing else None)
+                    for field in ("release_date", "year", "overview", "poster_url", "rating")
+                }
+                popularity = max(result.get("popularity") or 0, existing["popularity"] if existing else 0)
+                if existing:
+                    conn.execute("DELETE FROM titles WHERE id = ?", (existing["id"],))
+                conn.execute(
+                    """
+                    INSERT INTO titles (id, tmdb_id, media_type, title, release_date, year, overview, poster_url, rating, popularity)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        next_id, result["id"], result["media_type"], result["title"],
+                        merged["release_date"], merged["year"], merged["overview"],
+                        merged["poster_url"], merged["rating"], popularity,
+                    ),
+                )
+                next_id -= 1
+            conn.commit()
+    except sqlite3.Error as exc:
+        logger.warning("Could not record TMDB results in local index: %s", exc)
+
+def read_export(path: str):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def load_export(path: str, media_type: str) -> int:
+    """Load a TMDB daily ID export (``movie_ids_*.json.gz`` / ``tv_series_ids_*.json.gz``).
+
+    Export rows only carry the original title and popularity, so titles already
+    seen in API responses keep their title and metadata.
+    """
+    if media_type not in MEDIA_TYPES:
+        raise ValueError(f"Unsupported media type: {media_type}")
+    init_index()
+    records = []
+    for record in read_export(path):
+        title = record.get("original_title") or record.get("original_name")
+        if record.get("adult") or not record.get("id") or not title:
+            continue
+        records.append((record["id"], media_type, title, record.get("popularity") or 0))
+    records.sort(key=lambda record: record[3], reverse=True)
+
+    with get_connection() as conn:
+        # Explicit positive ids keep export rows behind seen titles in rowid order.
+        next_id = conn.execute("SELECT MAX(0, COALESCE(MAX(id), 0)) + 1 FROM titles").fetchone()[0]
+        for start in range(0, len(records), BATCH_SIZE):
+            conn.executemany(
+                """
+                INSERT INTO titles (id, tmdb_id, media_type, title, popularity)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (media_type, tmdb_id) DO UPDATE SET
+                    title = CASE WHEN id < 0 THEN title ELSE excluded.title END,
+                    popularity = excluded.popularity
+                """,
+                [
+                    (next_id + offset, *record)
+                    for offset, record in enumerate(records[start:start + BATCH_SIZE], start=start)
+                ],
+            )
+            conn.commit()
+        conn.execute("INSERT INTO titles_fts(titles_fts) VALUES ('optimize')")
+        conn.commit()
+    logger.info("Loaded %d %s titles from %s", len(records), media_type, path)
+    return len(records)
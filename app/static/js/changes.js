@@ -0,0 +1,49 @@
+// Live updates for the CRM pages from /api/changes/stream.
+//
+// connectChangeFeed({ apply, reload }) calls reload() once the stream is open
+// (so nothing committed in between is missed), apply(change) for every change
+// after that, and reload() again whenever the server says the page fell too
+// far behind. Without EventSource, or if the stream never opens, it falls back
+// to a single reload() and feed.live stays false.
+function connectChangeFeed({ apply, reload }) {
+    const feed = { live: false, loaded: false };
+    const loadOnce = () => {
+        if (!feed.loaded) {
+            feed.loaded = true;
+            reload();
+        }
+    };
+    if (!window.EventSource) {
+        loadOnce();
+        return feed;
+    }
+    const source = new EventSource('/api/changes/stream', { withCredentials: true });
+    source.addEventListener('ready', () => {
+        feed.live = true;
+        loadOnce();
+    });
+    source.addEventListener('change', event => apply(JSON.parse(event.data)));
+    source.addEventListener('reset', () => reload());
+    source.addEventListener('error', () => {
+        // The browser reconnects on its own and resumes from the last event id.
+        feed.live = false;
+        loadOnce();
+    });
+    return feed;
+}
+
+// Insert, replace or drop one row in a list kept in server order.
+function spliceById(list, id, item, compare) {
+    const rest = list.filter(existing => existing.id !== id);
+    if (item) {
+        rest.push(item);
+        if (compare) {
+            rest.sort(compare);
+        }
+    }
+    return rest;
+}
+
+function descendingBy(field) {
+    return (a, b) => String(b[field] || '').localeCompare(String(a[field] || ''));
+}
@@ -0,0 +1,241 @@
+log('🚀 Blog CRM JavaScript started loading...');
+log('📍 Current URL: ' + window.location.href);
+
+// Get DOM elements
+const blogForm = document.getElementById('add-blog-form');
+const blogWatchedSelect = document.getElementById('blog-watched-id');
+const blogTitle = document.getElementById('blog-title');
+const blogSlug = document.getElementById('blog-slug');
+const blogBody = document.getElementById('blog-body');
+const blogPreview = document.getElementById('blog-preview');
+const blogList = document.getElementById('blog-list');
+
+log('🔍 Checking DOM elements...');
+log('   add-blog-form: ' + (blogForm ? 'FOUND' : 'NOT FOUND'));
+log('   blog-watched-id: ' + (blogWatchedSelect ? 'FOUND' : 'NOT FOUND'));
+log('   blog-list: ' + (blogList ? 'FOUND' : 'NOT FOUND'));
+
+let watchedItems = [];
+let blogPosts = [];
+const byWatchDate = descendingBy('watch_date');
+const byCreatedAt = descendingBy('created_at');
+
+// Load watched items for dropdown (including Top 25)
+function loadWatchedItems() {
+    log('📋 Loading watched items for dropdown...');
+    Promise.all([
+        fetch('/api/watched', { credentials: 'same-origin' }).then(r => r.json()),
+        fetch('/api/top', { credentials: 'same-origin' }).then(r => r.json())
+    ])
+    .then(([watched, top]) => {
+        watchedItems = [...watched, ...top];
+        // Sort by date desc
+        watchedItems.sort(byWatchDate);
+        log(`   Received ${watchedItems.length} items total (${watched.length} watched, ${top.length} top)`);
+        drawWatchedSelect();
+    })
+    .catch(err => {
+        log('   ❌ Error loading items: ' + err.message);
+        blogWatchedSelect.innerHTML = '<option value="">Error loading items</option>';
+    });
+}
+
+function drawWatchedSelect() {
+    const selected = blogWatchedSelect.value;
+    blogWatchedSelect.innerHTML = '';
+    if (watchedItems.length === 0) {
+        blogWatchedSelect.innerHTML = '<option value="">No watched items available</option>';
+        log('   ⚠️  No items found!');
+    } else {
+        blogWatchedSelect.innerHTML = '<option value="">Select a watched item...</option>';
+        watchedItems.forEach(item => {
+            const option = document.createElement('option');
+            option.value = item.id;
+            const prefix = item.top_rank ? `[Top #${item.top_rank}] ` : '';
+            option.textContent = `${prefix}${item.title} (${item.watch_date})`;
+            blogWatchedSelect.appendChild(option);
+        });
+        // Keep the user's choice when another tab changes the list.
+        blogWatchedSelect.value = selected;
+        log('   ✓ Dropdown populated');
+    }
+}
+
+// Load existing blog posts
+function loadBlogPosts() {
+    log('📋 Loading existing blog posts...');
+    fetch('/api/blog', { credentials: 'same-origin' })
+        .then(response => {
+            log('   Response status: ' + response.status);
+            return response.json();
+        })
+        .then(data => {
+            log('   Received ' + data.length + ' blog posts');
+            blogPosts = data;
+            drawBlogPosts();
+        })
+        .catch(err => {
+            log('   ❌ Error loading blog posts: ' + err.message);
+            blogList.innerHTML = '<div class="empty-state">Error loading blog posts</div>';
+        });
+}
+
+function drawBlogPosts() {
+    const data = blogPosts;
+    blogList.innerHTML = '';
+    if (data.length === 0) {
+        blogList.innerHTML = '<div class="empty-state">No blog posts yet. Create one above!</div>';
+    } else {
+        data.forEach(post => {
+            const div = document.createElement('div');
+            div.className = 'blog-card';
+            div.innerHTML = `
+                <h3>${post.title}</h3>
+                <p><strong>Slug:</strong> /${post.slug}</p>
+                <p><strong>Watched ID:</strong> ${post.watched_id}</p>
+                <p><strong>Created:</strong> ${new Date(post.created_at).toLocaleString()}</p>
+                <details>
+                    <summary>View body (${post.body.length} chars)</summary>
+                    <div class="markdown-preview">${renderMarkdown(post.body)}</div>
+                </details>
+                <div class="blog-actions">
+                    <button class="button button--ghost" onclick="editBlog(${post.id})">Edit</button>
+                    <button class="button button--danger" onclick="deleteBlog(${post.id})">Delete</button>
+                </div>
+            `;
+            blogList.appendChild(div);
+        });
+        log('   ✓ Blog posts rendered');
+    }
+}
+
+function reloadAll() {
+    loadWatchedItems();
+    loadBlogPosts();
+}
+
+function applyChange(change) {
+    log(`🔄 ${change.action} ${change.table} #${change.item_id}`);
+    if (change.table === 'watched') {
+        watchedItems = spliceById(watchedItems, change.item_id, change.item, byWatchDate);
+        drawWatchedSelect();
+    } else if (change.table === 'blog_posts') {
+        blogPosts = spliceById(blogPosts, change.item_id, change.item, byCreatedAt);
+        drawBlogPosts();
+    }
+}
+
+// Delete blog post
+window.deleteBlog = function(id) {
+    if (!confirm('Are you sure you want to delete this blog post?')) {
+        return;
+    }
+    log('🗑️  Deleting blog post ID: ' + id);
+    fetch(`/api/blog/${id}`, {
+        method: 'DELETE',
+        credentials: 'same-origin'
+    })
+    .then(response => {
+        log('   Response: ' + response.status);
+        if (!response.ok) {
+            throw new Error('Delete failed');
+        }
+        return response.json();
+    })
+    .then(() => {
+        log('   ✅ Blog post deleted');
+        alert('✅ Blog post deleted!');
+        if (!changeFeed.live) loadBlogPosts();
+    })
+    .catch(err => {
+        log('   ❌ Error: ' + err.message);
+        alert('❌ Error deleting post: ' + err.message);
+    });
+};
+
+// Edit blog post (simplified - just shows alert for now)
+window.editBlog = function(id) {
+    alert('Edit functionality - coming soon!\n\nFor now, delete and recreate the post.');
+    log('ℹ️  Edit clicked for post ID: ' + id);
+};
+
+// Auto-slugify title
+if (blogTitle && blogSlug) {
+    blogTitle.addEventListener('input', function() {
+        if (!blogSlug.dataset.locked) {
+            blogSlug.value = slugify(blogTitle.value);
+        }
+    });
+    blogSlug.addEventListener('input', function() {
+        if (blogSlug.value.trim().length > 0) {
+            blogSlug.dataset.locked = 'true';
+        } else {
+            delete blogSlug.dataset.locked;
+        }
+    });
+    log('✓ Auto-slugify enabled');
+}
+
+// Live preview
+if (blogBody && blogPreview) {
+    blogBody.addEventListener('input', function() {
+        blogPreview.innerHTML = renderMarkdown(blogBody.value) || 'Start writing to see preview...';
+    });
+    log('✓ Live preview enabled');
+}
+
+// Attach blog form handler
+log('🔗 Attaching event listener to blog form...');
+if (blogForm) {
+    blogForm.addEventListener('submit', function(event) {
+        log('📝 BLOG FORM SUBMITTED!');
+        event.preventDefault();
+        log('   ✓ Default prevented');
+
+        const formData = new FormData(this);
+        log('   📦 FormData created');
+        log('      Watched ID: ' + formData.get('watched_id'));
+        log('      Title: ' + formData.get('title'));
+        log('      Slug: ' + formData.get('slug'));
+        log('      Body length: ' + formData.get('body').length);
+
+        log('   🚀 Sending POST to /api/blog...');
+        fetch('/api/blog', {
+            method: 'POST',
+            body: formData,
+            credentials: 'same-origin'
+        })
+        .then(response => {
+            log('   📥 Response: ' + response.status + ' ' + response.statusText);
+            if (!response.ok) {
+                return response.json().then(data => {
+                    throw new Error(data.detail || 'Request failed');
+                });
+            }
+            return response.json();
+        })
+        .then(data => {
+            log('   ✅ SUCCESS! Blog post created with ID: ' + data.id);
+            alert('✅ Blog post published!\n\nSlug: /' + data.slug);
+            blogForm.reset();
+            blogPreview.innerHTML = 'Start writing to see preview...';
+            delete blogSlug.dataset.locked;
+            if (!changeFeed.live) reloadAll();
+        })
+        .catch(error => {
+            log('   ❌ ERROR: ' + error.message);
+            alert('❌ Error: ' + error.message);
+        });
+    });
+    log('   ✓ Blog form handler attached');
+} else {
+    log('   ❌ Blog form not found!');
+}
+
+// Initial load; afterwards the change feed keeps both lists current
+log('🎬 Loading initial data...');
+const changeFeed = connectChangeFeed({ apply: applyChange, reload: reloadAll });
+
+log('═══════════════════════════════════════════════');
+log('✅ BLOG CRM LOADED SUCCESSFULLY!');
+log('═══════════════════════════════════════════════');
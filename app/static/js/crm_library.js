@@ -0,0 +1,695 @@
+console.log('🚀 SCRIPT STARTED - CRM JavaScript is loading...');
+console.log('📍 Current URL:', window.location.href);
+console.log('📄 Document ready state:', document.readyState);
+
+const watchedListDiv = document.getElementById('watched-list');
+const wantToWatchListDiv = document.getElementById('want-to-watch-list');
+const blogListDiv = document.getElementById('blog-list');
+const blogWatchedSelect = document.getElementById('blog-watched-id');
+
+console.log('🔍 DOM Elements:', {
+    watchedListDiv: !!watchedListDiv,
+    wantToWatchListDiv: !!wantToWatchListDiv,
+    blogListDiv: !!blogListDiv,
+    blogWatchedSelect: !!blogWatchedSelect
+});
+
+const lists = { watched: [], wantToWatch: [], blog: [] };
+const byWatchDate = descendingBy('watch_date');
+const byLaunchDate = descendingBy('launch_date');
+const byCreatedAt = descendingBy('created_at');
+
+function renderLists() {
+    fetch('/api/watched', { credentials: 'same-origin' })
+        .then(response => response.json())
+        .then(data => {
+            lists.watched = data;
+            drawWatched();
+        });
+
+    fetch('/api/want-to-watch', { credentials: 'same-origin' })
+        .then(response => response.json())
+        .then(data => {
+            lists.wantToWatch = data;
+            drawWantToWatch();
+        });
+
+    fetch('/api/blog', { credentials: 'same-origin' })
+        .then(response => response.json())
+        .then(data => {
+            lists.blog = data;
+            drawBlog();
+        });
+}
+
+function applyChange(change) {
+    if (change.table === 'watched') {
+        // Ranked titles live on the Top page, not in this list.
+        const item = change.item && change.item.top_rank === null ? change.item : null;
+        lists.watched = spliceById(lists.watched, change.item_id, item, byWatchDate);
+        drawWatched();
+    } else if (change.table === 'want_to_watch') {
+        lists.wantToWatch = spliceById(lists.wantToWatch, change.item_id, change.item, byLaunchDate);
+        drawWantToWatch();
+    } else if (change.table === 'blog_posts') {
+        lists.blog = spliceById(lists.blog, change.item_id, change.item, byCreatedAt);
+        drawBlog();
+    }
+}
+
+const changeFeed = connectChangeFeed({ apply: applyChange, reload: renderLists });
+
+// With the feed connected our own writes come back as changes too.
+function refreshLists() {
+    if (!changeFeed.live) {
+        renderLists();
+    }
+}
+
+function drawWatched() {
+    const data = lists.watched;
+    watchedListDiv.innerHTML = '';
+    blogWatchedSelect.innerHTML = '';
+    if (data.length === 0) {
+        const option = document.createElement('option');
+        option.value = '';
+        option.textContent = 'Add a watched item first';
+        blogWatchedSelect.appendChild(option);
+    }
+    data.forEach(item => {
+        const div = document.createElement('div');
+        div.className = 'list-card';
+        div.dataset.item = JSON.stringify(item);
+        div.innerHTML = `
+            <div class="list-card__header">
+                <h3>${item.title}</h3>
+                <span class="score">${item.score}/10</span>
+            </div>
+            <p class="list-card__text">${item.comment}</p>
+            <p class="list-card__meta">${formatTypeMeta(item)} · Watched on ${item.watch_date}</p>
+            <div class="list-card__actions">
+                <button class="button button--ghost js-edit" data-list="watched">Edit</button>
+                <button onclick="deleteItem('watched', ${item.id})" class="button button--danger">Remove</button>
+            </div>
+        `;
+        watchedListDiv.appendChild(div);
+        const option = document.createElement('option');
+        option.value = item.id;
+        option.textContent = `${item.title} (${item.watch_date})`;
+        blogWatchedSelect.appendChild(option);
+    });
+    attachEditHandlers();
+}
+
+function drawWantToWatch() {
+    const data = lists.wantToWatch;
+    wantToWatchListDiv.innerHTML = '';
+    data.forEach(item => {
+        const div = document.createElement('div');
+        div.className = 'list-card';
+        div.dataset.item = JSON.stringify(item);
+        div.innerHTML = `
+            <div class="list-card__header">
+                <h3>${item.title}</h3>
+                <span class="badge">Planned</span>
+            </div>
+            <p class="list-card__text">Excitement ${item.excitement}/10</p>
+            <p class="list-card__meta">${formatTypeMeta(item)} · Launch date ${item.launch_date}</p>
+            <div class="list-card__actions">
+                <button class="button button--ghost js-edit" data-list="want-to-watch">Edit</button>
+                <button onclick="deleteItem('want-to-watch', ${item.id})" class="button button--danger">Remove</button>
+            </div>
+        `;
+        wantToWatchListDiv.appendChild(div);
+    });
+    attachEditHandlers();
+}
+
+function drawBlog() {
+    const data = lists.blog;
+    blogListDiv.innerHTML = '';
+    if (data.length === 0) {
+        blogListDiv.innerHTML = '<div class="empty-state">No blog entries yet.</div>';
+        return;
+    }
+    data.forEach(post => {
+        const div = document.createElement('div');
+        div.className = 'list-card';
+        div.dataset.post = JSON.stringify(post);
+        div.innerHTML = `
+            <div class="list-card__header">
+                <h3>${post.title}</h3>
+                <span class="badge">Blog</span>
+            </div>
+            <div class="list-card__text markdown-preview js-blog-preview"></div>
+            <p class="list-card__meta">Slug: /${post.slug}</p>
+            <div class="list-card__actions">
+                <button class="button button--ghost js-edit-blog">Edit</button>
+                <button onclick="deleteBlog(${post.id})" class="button button--danger">Remove</button>
+            </div>
+        `;
+        const preview = div.querySelector('.js-blog-preview');
+        preview.dataset.markdown = post.body || '';
+        blogListDiv.appendChild(div);
+    });
+    attachBlogEditHandlers();
+    renderBlogPreviews();
+}
+
+function deleteItem(list, id) {
+    fetch(`/api/${list}/${id}`, { method: 'DELETE', credentials: 'same-origin' })
+        .then(() => refreshLists());
+}
+
+function attachEditHandlers() {
+    document.querySelectorAll('.js-edit').forEach(button => {
+        button.removeEventListener('click', handleEditClick);
+        button.addEventListener('click', handleEditClick);
+    });
+}
+
+function handleEditClick(event) {
+    const button = event.currentTarget;
+    const card = button.closest('.list-card');
+    const item = JSON.parse(card.dataset.item);
+    const list = button.dataset.list;
+    editItem(list, item);
+}
+
+function getNumberInput(label, currentValue) {
+    const input = prompt(label, currentValue);
+    if (input === null || input.trim() === '') {
+        return currentValue;
+    }
+    const parsed = Number(input);
+    return Number.isNaN(parsed) ? currentValue : parsed;
+}
+
+function formatTypeMeta(item) {
+    if (item.content_type === 'TV Series' && item.season) {
+        return `${item.content_type} · Season ${item.season}`;
+    }
+    return item.content_type;
+}
+
+function editItem(list, item) {
+    if (list === 'watched') {
+        const title = prompt('Title', item.title) || item.title;
+        const score = getNumberInput('Score (0-10)', item.score);
+        const contentType = prompt('Type (Movie or TV Series)', item.content_type) || item.content_type;
+        const season = contentType === 'TV Series' ? getNumberInput('Season', item.season || 1) : null;
+        const comment = prompt('Comment', item.comment) || item.comment;
+        const watchDate = prompt('Watch date (YYYY-MM-DD)', item.watch_date) || item.watch_date;
+        const imageUrl = prompt('Image URL', item.image_url) || item.image_url;
+        const payload = { ...item, title, score, content_type: contentType, season, comment, watch_date: watchDate, image_url: imageUrl };
+        updateItem('watched', item.id, payload);
+        return;
+    }
+
+    const title = prompt('Title', item.title) || item.title;
+    const launchDate = prompt('Launch date (YYYY-MM-DD)', item.launch_date) || item.launch_date;
+    const excitement = getNumberInput('Excitement (1-10)', item.excitement);
+    const contentType = prompt('Type (Movie or TV Series)', item.content_type) || item.content_type;
+    const season = contentType === 'TV Series' ? getNumberInput('Season', item.season || 1) : null;
+    const imageUrl = prompt('Image URL', item.image_url) || item.image_url;
+    const payload = { ...item, title, launch_date: launchDate, excitement, content_type: contentType, season, image_url: imageUrl };
+    updateItem('want-to-watch', item.id, payload);
+}
+
+function updateItem(list, id, payload) {
+    fetch(`/api/${list}/${id}`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        credentials: 'same-origin',
+        body: JSON.stringify(payload)
+    })
+        .then(response => {
+            if (response.status === 409) {
+                return response.json().then(data => {
+                    throw new Error(data.detail);
+                });
+            }
+            if (!response.ok) {
+                throw new Error('Could not update item. Check the fields and try again.');
+            }
+            return response.json();
+        })
+        .then(() => refreshLists())
+        .catch(error => alert(error.message));
+}
+
+function setupTmdbSearch(form, mediaTypeFilter) {
+    const queryInput = form.querySelector('.tmdb-query');
+    const searchButton = form.querySelector('.tmdb-search-btn');
+    const resultsContainer = form.querySelector('.tmdb-results');
+    const preview = form.querySelector('.tmdb-preview');
+    const previewImage = form.querySelector('.tmdb-preview__image');
+    const previewTitle = form.querySelector('.tmdb-preview__title');
+    const previewMeta = form.querySelector('.tmdb-preview__meta');
+    const previewSynopsis = form.querySelector('.tmdb-preview__synopsis');
+
+    const titleInput = form.querySelector('input[name="title"]');
+    const contentSelect = form.querySelector('select[name="content_type"]');
+    const imageInput = form.querySelector('input[name="image_url"]');
+    const launchDateInput = form.querySelector('input[name="launch_date"]');
+
+    const setHidden = (name, value) => {
+        const input = form.querySelector(`input[name="${name}"]`);
+        if (input) {
+            input.value = value ?? '';
+        }
+    };
+
+    const renderResults = (results) => {
+        resultsContainer.innerHTML = '';
+        if (!results.length) {
+            resultsContainer.textContent = 'No results found.';
+            return;
+        }
+        results.forEach(result => {
+            const button = document.createElement('button');
+            button.type = 'button';
+            button.className = 'tmdb-result';
+            const year = result.year ? ` (${result.year})` : '';
+            const imageHtml = result.poster_url
+                ? `<img class="tmdb-result__image" src="${result.poster_url}" alt="${encodeHtml(result.title)} poster">`
+                : `<div class="tmdb-result__placeholder">No poster</div>`;
+            button.innerHTML = `
+                ${imageHtml}
+                <div class="tmdb-result__content">
+                    <p class="tmdb-result__title">${result.title}${year}</p>
+                    <p class="tmdb-result__meta">${result.media_type === 'movie' ? 'Movie' : 'TV Series'}</p>
+                </div>
+            `;
+            button.addEventListener('click', () => selectResult(result));
+            resultsContainer.appendChild(button);
+        });
+    };
+
+    const selectResult = (result) => {
+        console.log('Fetching TMDB details for:', result);
+        fetch(`/api/tmdb/details/${result.media_type}/${result.id}`, { credentials: 'same-origin' })
+            .then(response => {
+                console.log('TMDB details response status:', response.status);
+                if (!response.ok) {
+                    return response.json().then(data => {
+                        console.error('TMDB details failed:', data);
+                        throw new Error(data.detail || 'Details failed');
+                    });
+                }
+                return response.json();
+            })
+            .then(details => {
+                console.log('TMDB details received:', details);
+                titleInput.value = details.title || titleInput.value;
+                if (contentSelect) {
+                    contentSelect.value = details.content_type || contentSelect.value;
+                    contentSelect.dispatchEvent(new Event('change'));
+                }
+                if (details.poster_url && imageInput) {
+                    imageInput.value = details.poster_url;
+                }
+                if (launchDateInput && details.release_date) {
+                    launchDateInput.value = details.release_date;
+                }
+                setHidden('synopsis', details.synopsis);
+                setHidden('release_year', details.release_year);
+                setHidden('runtime', details.runtime);
+                setHidden('genres', details.genres);
+                setHidden('tmdb_id', details.tmdb_id);
+                setHidden('tmdb_rating', details.tmdb_rating);
+                setHidden('poster_url', details.poster_url);
+
+                preview.classList.remove('is-hidden');
+                if (details.poster_url) {
+                    previewImage.src = details.poster_url;
+                    previewImage.alt = details.title || 'Poster';
+                    previewImage.classList.remove('is-hidden');
+                } else {
+                    previewImage.classList.add('is-hidden');
+                }
+                previewTitle.textContent = details.title || '';
+                previewMeta.textContent = [
+                    details.release_year,
+                    details.runtime ? `${details.runtime} min` : '',
+                    details.genres,
+                    details.tmdb_rating ? `TMDB ${details.tmdb_rating.toFixed(1)}` : ''
+                ].filter(Boolean).join(' · ');
+                previewSynopsis.textContent = details.synopsis || '';
+            })
+            .catch((error) => {
+                console.error('TMDB details error:', error);
+                alert('Could not fetch TMDB details: ' + error.message + '. Check the console and API key.');
+            });
+    };
+
+    const doSearch = () => {
+        const query = queryInput.value.trim();
+        if (!query) {
+            resultsContainer.textContent = 'Enter a title to search.';
+            return;
+        }
+        const params = new URLSearchParams({ query });
+        if (mediaTypeFilter) {
+            params.set('media_type', mediaTypeFilter);
+        }
+        console.log('TMDB search:', query, mediaTypeFilter);
+        resultsContainer.textContent = 'Searching...';
+        fetch(`/api/tmdb/search?${params.toString()}`, { credentials: 'same-origin' })
+            .then(response => {
+                console.log('TMDB search response status:', response.status);
+                if (!response.ok) {
+                    return response.json().then(data => {
+                        console.error('TMDB search failed:', data);
+                        throw new Error(data.detail || 'Search failed');
+                    });
+                }
+                return response.json();
+            })
+            .then(results => {
+                console.log('TMDB search results:', results);
+                renderResults(results);
+            })
+            .catch((error) => {
+                console.error('TMDB search error:', error);
+                resultsContainer.textContent = 'Search failed: ' + error.message + '. Check console for details.';
+            });
+    };
+
+    searchButton.addEventListener('click', doSearch);
+    queryInput.addEventListener('keydown', (event) => {
+        if (event.key === 'Enter') {
+            event.preventDefault();
+            doSearch();
+        }
+    });
+}
+
+function renderBlogPreviews() {
+    document.querySelectorAll('.js-blog-preview').forEach(preview => {
+        const raw = preview.dataset.markdown || '';
+        const snippet = raw.length > 320 ? `${raw.slice(0, 320)}...` : raw;
+        preview.innerHTML = renderMarkdown(snippet);
+    });
+}
+
+function attachBlogEditHandlers() {
+    document.querySelectorAll('.js-edit-blog').forEach(button => {
+        button.removeEventListener('click', handleBlogEditClick);
+        button.addEventListener('click', handleBlogEditClick);
+    });
+}
+
+function handleBlogEditClick(event) {
+    const card = event.currentTarget.closest('.list-card');
+    const post = JSON.parse(card.dataset.post);
+    editBlogInline(card, post);
+}
+
+function editBlogInline(card, post) {
+    card.innerHTML = `
+        <div class="inline-editor">
+            <label>
+                <span>Title</span>
+                <input type="text" value="${encodeHtml(post.title)}" data-field="title">
+            </label>
+            <label>
+                <span>Slug</span>
+                <input type="text" value="${encodeHtml(post.slug)}" data-field="slug">
+            </label>
+            <label>
+                <span>Watched ID</span>
+                <input type="number" value="${post.watched_id}" data-field="watched_id">
+            </label>
+            <label>
+                <span>Body</span>
+                <textarea data-field="body">${encodeHtml(post.body)}</textarea>
+            </label>
+            <div class="markdown-preview js-inline-preview"></div>
+            <div class="list-card__actions">
+                <button class="button js-save-blog">Save</button>
+                <button class="button button--ghost js-cancel-blog">Cancel</button>
+            </div>
+        </div>
+    `;
+
+    const bodyField = card.querySelector('[data-field="body"]');
+    const preview = card.querySelector('.js-inline-preview');
+    const renderInline = () => {
+        preview.innerHTML = renderMarkdown(bodyField.value);
+    };
+    renderInline();
+    bodyField.addEventListener('input', renderInline);
+
+    card.querySelector('.js-cancel-blog').addEventListener('click', () => drawBlog());
+    card.querySelector('.js-save-blog').addEventListener('click', () => {
+        const title = card.querySelector('[data-field="title"]').value.trim() || post.title;
+        const slug = card.querySelector('[data-field="slug"]').value.trim() || post.slug;
+        const watchedIdField = card.querySelector('[data-field="watched_id"]');
+        const watchedIdValue = Number(watchedIdField.value);
+        const watchedId = Number.isNaN(watchedIdValue) ? post.watched_id : watchedIdValue;
+        const body = bodyField.value.trim() || post.body;
+        const payload = { ...post, title, slug, watched_id: watchedId, body };
+        updateBlog(post.id, payload);
+    });
+}
+
+function updateBlog(id, payload) {
+    fetch(`/api/blog/${id}`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        credentials: 'same-origin',
+        body: JSON.stringify(payload)
+    })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Update failed');
+            }
+            return response.json();
+        })
+        .then(() => refreshLists())
+        .catch(() => alert('Could not update blog post. Check the fields and try again.'));
+}
+
+function deleteBlog(id) {
+    fetch(`/api/blog/${id}`, { method: 'DELETE', credentials: 'same-origin' })
+        .then(() => refreshLists());
+}
+
+console.log('🔗 Attaching event listener to add-watched-form...');
+const watchedFormElement = document.getElementById('add-watched-form');
+console.log('   Form element:', watchedFormElement);
+
+watchedFormElement.addEventListener('submit', function(event) {
+    console.log('🎬 Watched form submission intercepted');
+    event.preventDefault();
+    console.log('✓ Default form submission prevented');
+
+    const formData = new FormData(this);
+    console.log('📋 FormData created with fields:', Array.from(formData.keys()));
+
+    const imageUrl = (formData.get('image_url') || '').toString().trim();
+    const imageFile = formData.get('image_file');
+    console.log('🖼️ Image URL:', imageUrl);
+    console.log('📁 Image File:', imageFile?.name || 'none');
+
+    if (!imageUrl && (!imageFile || imageFile.size === 0)) {
+        alert('Add an image URL or upload a file.');
+        return;
+    }
+
+    console.log('🚀 Sending POST to /api/watched');
+    fetch('/api/watched', { method: 'POST', body: formData, credentials: 'same-origin' })
+        .then(response => {
+            console.log('📥 Response status:', response.status, response.statusText);
+            if (!response.ok) {
+                return response.json().then(data => {
+                    console.error('❌ Create failed:', data);
+                    throw new Error(data.detail || 'Create failed');
+                }).catch(err => {
+                    if (err.message) throw err;
+                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                });
+            }
+            return response.json();
+        })
+        .then((data) => {
+            console.log('✅ Watched item created:', data);
+            this.reset();
+            refreshLists();
+        })
+        .catch((error) => {
+            console.error('❌ Error:', error);
+            alert('Could not add item. Error: ' + error.message);
+        });
+});
+
+console.log('🔗 Attaching event listener to add-want-to-watch-form...');
+const wantToWatchFormElement = document.getElementById('add-want-to-watch-form');
+console.log('   Form element:', wantToWatchFormElement);
+
+wantToWatchFormElement.addEventListener('submit', function(event) {
+    console.log('📺 Want-to-watch form submission intercepted');
+    event.preventDefault();
+    console.log('✓ Default form submission prevented');
+
+    const formData = new FormData(this);
+    console.log('📋 FormData created with fields:', Array.from(formData.keys()));
+
+    const imageUrl = (formData.get('image_url') || '').toString().trim();
+    const imageFile = formData.get('image_file');
+    console.log('🖼️ Image URL:', imageUrl);
+    console.log('📁 Image File:', imageFile?.name || 'none');
+
+    if (!imageUrl && (!imageFile || imageFile.size === 0)) {
+        alert('Add an image URL or upload a file.');
+        return;
+    }
+
+    console.log('🚀 Sending POST to /api/want-to-watch');
+    fetch('/api/want-to-watch', { method: 'POST', body: formData, credentials: 'same-origin' })
+        .then(response => {
+            console.log('📥 Response status:', response.status, response.statusText);
+            if (!response.ok) {
+                return response.json().then(data => {
+                    console.error('❌ Create failed:', data);
+                    throw new Error(data.detail || 'Create failed');
+                }).catch(err => {
+                    if (err.message) throw err;
+                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                });
+            }
+            return response.json();
+        })
+        .then((data) => {
+            console.log('✅ Want-to-watch item created:', data);
+            this.reset();
+            refreshLists();
+        })
+        .catch((error) => {
+            console.error('❌ Error:', error);
+            alert('Could not add item. Error: ' + error.message);
+        });
+});
+
+console.log('🔗 Attaching event listener to add-blog-form...');
+const blogFormElement = document.getElementById('add-blog-form');
+console.log('   Form element:', blogFormElement);
+
+blogFormElement.addEventListener('submit', function(event) {
+    console.log('📝 Blog form submission intercepted');
+    event.preventDefault();
+    console.log('✓ Default form submission prevented');
+
+    const formData = new FormData(this);
+    console.log('Submitting blog post:', {
+        watched_id: formData.get('watched_id'),
+        title: formData.get('title'),
+        slug: formData.get('slug'),
+        body_length: formData.get('body')?.length
+    });
+    fetch('/api/blog', { method: 'POST', body: formData, credentials: 'same-origin' })
+        .then(response => {
+            console.log('Blog post response status:', response.status);
+            if (!response.ok) {
+                return response.json().then(data => {
+                    console.error('Blog post creation failed:', data);
+                    throw new Error(data.detail || 'Create failed');
+                }).catch(err => {
+                    console.error('Blog post error:', err);
+                    throw err;
+                });
+            }
+            return response.json();
+        })
+        .then((data) => {
+            console.log('Blog post created successfully:', data);
+            this.reset();
+            refreshLists();
+        })
+        .catch((error) => {
+            console.error('Blog post submission error:', error);
+            alert('Could not add blog post. Check the console and fields and try again. Error: ' + error.message);
+        });
+});
+
+const blogBodyInput = document.querySelector('#add-blog-form textarea[name="body"]');
+const blogTitleInput = document.querySelector('#add-blog-form input[name="title"]');
+const blogSlugInput = document.querySelector('#add-blog-form input[name="slug"]');
+const blogPreview = document.getElementById('blog-preview');
+
+if (blogBodyInput) {
+    blogBodyInput.addEventListener('input', () => {
+        blogPreview.innerHTML = renderMarkdown(blogBodyInput.value);
+    });
+}
+
+if (blogTitleInput && blogSlugInput) {
+    blogTitleInput.addEventListener('input', () => {
+        if (!blogSlugInput.dataset.locked) {
+            blogSlugInput.value = slugify(blogTitleInput.value);
+        }
+    });
+    blogSlugInput.addEventListener('input', () => {
+        if (blogSlugInput.value.trim().length > 0) {
+            blogSlugInput.dataset.locked = 'true';
+        } else {
+            delete blogSlugInput.dataset.locked;
+        }
+    });
+}
+
+document.querySelectorAll('form').forEach(form => {
+    const select = form.querySelector('select[name="content_type"]');
+    if (!select) {
+        return;
+    }
+    const seasonField = form.querySelector('.js-season-field');
+    if (!seasonField) {
+        return;
+    }
+    const toggleSeason = () => {
+        if (select.value === 'TV Series') {
+            seasonField.classList.remove('is-hidden');
+            const input = seasonField.querySelector('input');
+            if (input) {
+                input.disabled = false;
+            }
+        } else {
+            seasonField.classList.add('is-hidden');
+            const input = seasonField.querySelector('input');
+            if (input) {
+                input.value = '';
+                input.disabled = true;
+            }
+        }
+    };
+    select.addEventListener('change', toggleSeason);
+    toggleSeason();
+});
+
+const watchedForm = document.getElementById('add-watched-form');
+const plannedForm = document.getElementById('add-want-to-watch-form');
+const blogForm = document.getElementById('add-blog-form');
+
+console.log('🎬 Initializing CRM page...');
+console.log('✓ Watched form found:', !!watchedForm);
+console.log('✓ Want-to-watch form found:', !!plannedForm);
+console.log('✓ Blog form found:', !!blogForm);
+
+if (watchedForm) {
+    setupTmdbSearch(watchedForm);
+    console.log('✓ TMDB search setup for watched form');
+}
+if (plannedForm) {
+    setupTmdbSearch(plannedForm);
+    console.log('✓ TMDB search setup for want-to-watch form');
+}
+
+console.log('✅ CRM page initialization complete');
+console.log('📝 Form submission handlers are attached');
+
+console.log('═══════════════════════════════════════════════════════');
+console.log('🎉 ALL JAVASCRIPT LOADED SUCCESSFULLY');
+console.log('✅ You can now submit forms and they will be logged here');
+console.log('═══════════════════════════════════════════════════════');
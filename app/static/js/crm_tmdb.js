@@ -0,0 +1,418 @@
+// Debug logging
+
+log('🚀 TMDB CRM JavaScript started loading...');
+
+// DOM elements
+const tmdbQuery = document.getElementById('tmdb-query');
+const tmdbSearchBtn = document.getElementById('tmdb-search-btn');
+const tmdbResults = document.getElementById('tmdb-results');
+const tmdbPreview = document.getElementById('tmdb-preview');
+const previewPoster = document.getElementById('preview-poster');
+const previewTitle = document.getElementById('preview-title');
+const previewMeta = document.getElementById('preview-meta');
+const previewSynopsis = document.getElementById('preview-synopsis');
+const addToWatchedBtn = document.getElementById('add-to-watched-btn');
+const addToTopBtn = document.getElementById('add-to-top-btn');
+const addToPlannedBtn = document.getElementById('add-to-planned-btn');
+const recentList = document.getElementById('recent-list');
+
+log('✓ All DOM elements found');
+
+// Store selected movie data
+let selectedMovie = null;
+
+// Search TMDB
+function searchTMDB() {
+    const query = tmdbQuery.value.trim();
+    if (!query) {
+        alert('Please enter a search query');
+        return;
+    }
+
+    log(`🔍 Searching TMDB for: "${query}"`);
+    tmdbResults.innerHTML = '<p>Searching...</p>';
+
+    fetch(`/api/tmdb/search?query=${encodeURIComponent(query)}`, {
+        credentials: 'same-origin'
+    })
+    .then(response => {
+        log(`   Response: ${response.status}`);
+        if (!response.ok) {
+            throw new Error('Search failed');
+        }
+        return response.json();
+    })
+    .then(results => {
+        log(`   ✓ Found ${results.length} results`);
+        displayResults(results);
+    })
+    .catch(error => {
+        log(`   ❌ Error: ${error.message}`);
+        tmdbResults.innerHTML = `<p style="color: red;">Search failed: ${error.message}</p>`;
+    });
+}
+
+// Display search results
+function displayResults(results) {
+    tmdbResults.innerHTML = '';
+    if (results.length === 0) {
+        tmdbResults.innerHTML = '<p>No results found. Try another search.</p>';
+        return;
+    }
+
+    results.forEach((result, index) => {
+        const div = document.createElement('div');
+        div.className = 'tmdb-result';
+        div.innerHTML = `
+            ${result.poster_url ?
+                `<img src="${result.poster_url}" alt="${result.title}">` :
+                `<div style="background: #ddd; height: 300px; display: flex; align-items: center; justify-content: center;">No Poster</div>`
+            }
+            <div class="tmdb-result__info">
+                <p class="tmdb-result__title">${result.title}</p>
+                <p class="tmdb-result__meta">${result.media_type === 'movie' ? 'Movie' : 'TV Series'}${result.year ? ` (${result.year})` : ''}</p>
+            </div>
+        `;
+        div.addEventListener('click', () => {
+            log(`📝 Selected: ${result.title}`);
+            selectMovie(result);
+        });
+        tmdbResults.appendChild(div);
+    });
+}
+
+// Autocomplete from the local title index (no TMDB round trip)
+let autocompleteTimer = null;
+let autocompleteController = null;
+
+function autocompleteTMDB() {
+    const query = tmdbQuery.value.trim();
+    if (query.length < 2) {
+        return;
+    }
+    if (autocompleteController) {
+        autocompleteController.abort();
+    }
+    autocompleteController = new AbortController();
+
+    fetch(`/api/tmdb/autocomplete?query=${encodeURIComponent(query)}&limit=8`, {
+        credentials: 'same-origin',
+        signal: autocompleteController.signal
+    })
+    .then(response => response.ok ? response.json() : [])
+    .then(results => {
+        if (results.length > 0 && tmdbQuery.value.trim() === query) {
+            displayResults(results);
+        }
+    })
+    .catch(error => {
+        if (error.name !== 'AbortError') {
+            log(`   ⚠️ Autocomplete failed: ${error.message}`);
+        }
+    });
+}
+
+// Select a movie and fetch full details
+function selectMovie(result) {
+    log(`🎬 Fetching full details for: ${result.title} (${result.media_type}/${result.id})`);
+
+    fetch(`/api/tmdb/details/${result.media_type}/${result.id}`, {
+        credentials: 'same-origin'
+    })
+    .then(response => {
+        log(`   Response: ${response.status}`);
+        if (!response.ok) {
+            throw new Error('Failed to fetch details');
+        }
+        return response.json();
+    })
+    .then(details => {
+        log(`   ✓ Details loaded`);
+        selectedMovie = details;
+        showPreview(details);
+    })
+    .catch(error => {
+        log(`   ❌ Error: ${error.message}`);
+        alert('Error loading details: ' + error.message);
+    });
+}
+
+// Show preview of selected movie
+function showPreview(details) {
+    tmdbPreview.classList.add('active');
+
+    if (details.poster_url) {
+        previewPoster.src = details.poster_url;
+        previewPoster.alt = details.title;
+    }
+
+    previewTitle.textContent = details.title;
+
+    const metaParts = [];
+    if (details.content_type) metaParts.push(details.content_type);
+    if (details.release_year) metaParts.push(details.release_year);
+    if (details.runtime) metaParts.push(`${details.runtime} min`);
+    if (details.genres) metaParts.push(details.genres);
+    if (details.tmdb_rating) metaParts.push(`⭐ ${details.tmdb_rating.toFixed(1)}`);
+    previewMeta.textContent = metaParts.join(' • ');
+
+    previewSynopsis.textContent = details.synopsis || 'No synopsis available.';
+
+    log('✓ Preview displayed');
+}
+
+// Add to watched
+addToWatchedBtn.addEventListener('click', function() {
+    if (!selectedMovie) {
+        alert('Please select a movie first');
+        return;
+    }
+
+    const score = prompt('Score (0-10):', '8');
+    if (!score) return;
+
+    const comment = prompt('Comment:', 'Great movie!');
+    if (!comment) return;
+
+    const watchDate = prompt('Watch date (YYYY-MM-DD):', new Date().toISOString().split('T')[0]);
+    if (!watchDate) return;
+
+    log(`➕ Adding to watched: ${selectedMovie.title}`);
+
+    const formData = new FormData();
+    formData.append('title', selectedMovie.title);
+    formData.append('score', score);
+    formData.append('comment', comment);
+    formData.append('watch_date', watchDate);
+    formData.append('content_type', selectedMovie.content_type);
+    formData.append('image_url', selectedMovie.poster_url || '');
+    formData.append('synopsis', selectedMovie.synopsis || '');
+    formData.append('release_year', selectedMovie.release_year || '');
+    formData.append('release_date', selectedMovie.release_date || '');
+    formData.append('runtime', selectedMovie.runtime || '');
+    formData.append('genres', selectedMovie.genres || '');
+    formData.append('tmdb_id', selectedMovie.tmdb_id || '');
+    formData.append('tmdb_rating', selectedMovie.tmdb_rating || '');
+    formData.append('poster_url', selectedMovie.poster_url || '');
+
+    fetch('/api/watched', {
+        method: 'POST',
+        body: formData,
+        credentials: 'same-origin'
+    })
+    .then(response => {
+        log(`   Response: ${response.status}`);
+        if (!response.ok) {
+            return response.json().then(data => {
+                throw new Error(data.detail || 'Failed to add');
+            });
+        }
+        return response.json();
+    })
+    .then(data => {
+        log(`   ✅ Added to watched! ID: ${data.id}`);
+        alert(`✅ Added "${selectedMovie.title}" to watched!`);
+        tmdbPreview.classList.remove('active');
+        selectedMovie = null;
+        tmdbQuery.value = '';
+        tmdbResults.innerHTML = '';
+        loadRecent();
+    })
+    .catch(error => {
+        log(`   ❌ Error: ${error.message}`);
+        alert('Error: ' + error.message);
+    });
+});
+
+// Add to want to watch
+addToPlannedBtn.addEventListener('click', function() {
+    if (!selectedMovie) {
+        alert('Please select a movie first');
+        return;
+    }
+
+    const excitement = prompt('Excitement (1-10):', '7');
+    if (!excitement) return;
+
+    const defaultDate = selectedMovie.release_date || new Date().toISOString().split('T')[0];
+    const launchDate = prompt('Launch date (YYYY-MM-DD):', defaultDate);
+    if (!launchDate) return;
+
+    log(`➕ Adding to want-to-watch: ${selectedMovie.title}`);
+
+    const formData = new FormData();
+    formData.append('title', selectedMovie.title);
+    formData.append('excitement', excitement);
+    formData.append('launch_date', launchDate);
+    formData.append('content_type', selectedMovie.content_type);
+    formData.append('image_url', selectedMovie.poster_url || '');
+    formData.append('synopsis', selectedMovie.synopsis || '');
+    formData.append('release_year', selectedMovie.release_year || '');
+    formData.append('runtime', selectedMovie.runtime || '');
+    formData.append('genres', selectedMovie.genres || '');
+    formData.append('tmdb_id', selectedMovie.tmdb_id || '');
+    formData.append('tmdb_rating', selectedMovie.tmdb_rating || '');
+    formData.append('poster_url', selectedMovie.poster_url || '');
+
+    fetch('/api/want-to-watch', {
+        method: 'POST',
+        body: formData,
+        credentials: 'same-origin'
+    })
+    .then(response => {
+        log(`   Response: ${response.status}`);
+        if (!response.ok) {
+            return response.json().then(data => {
+                throw new Error(data.detail || 'Failed to add');
+            });
+        }
+        return response.json();
+    })
+    .then(data => {
+        log(`   ✅ Added to want-to-watch! ID: ${data.id}`);
+        alert(`✅ Added "${selectedMovie.title}" to want-to-watch!`);
+        tmdbPreview.classList.remove('active');
+        selectedMovie = null;
+        tmdbQuery.value = '';
+        tmdbResults.innerHTML = '';
+        loadRecent();
+    })
+    .catch(error => {
+        log(`   ❌ Error: ${error.message}`);
+        alert('Error: ' + error.message);
+    });
+});
+
+// Add to Top 25
+addToTopBtn.addEventListener('click', function() {
+    if (!selectedMovie) {
+        alert('Please select a movie first');
+        return;
+    }
+
+    const rank = prompt('Top 25 Rank (1-25):', '1');
+    if (!rank) return;
+
+    const score = prompt('Score (0-10):', '10');
+    if (!score) return;
+
+    const comment = prompt('Comment:', 'Masterpiece!');
+    if (!comment) return;
+
+    const watchDate = prompt('Watch date (YYYY-MM-DD):', new Date().toISOString().split('T')[0]);
+    if (!watchDate) return;
+
+    log(`➕ Adding to Top 25: ${selectedMovie.title} at rank ${rank}`);
+
+    const formData = new FormData();
+    formData.append('title', selectedMovie.title);
+    formData.append('score', score);
+    formData.append('comment', comment);
+    formData.append('watch_date', watchDate);
+    formData.append('content_type', selectedMovie.content_type);
+    formData.append('image_url', selectedMovie.poster_url || '');
+    formData.append('synopsis', selectedMovie.synopsis || '');
+    formData.append('release_year', selectedMovie.release_year || '');
+    formData.append('release_date', selectedMovie.release_date || '');
+    formData.append('runtime', selectedMovie.runtime || '');
+    formData.append('genres', selectedMovie.genres || '');
+    formData.append('tmdb_id', selectedMovie.tmdb_id || '');
+    formData.append('tmdb_rating', selectedMovie.tmdb_rating || '');
+    formData.append('poster_url', selectedMovie.poster_url || '');
+    formData.append('top_rank', rank);
+
+    fetch('/api/watched', {
+        method: 'POST',
+        body: formData,
+        credentials: 'same-origin'
+    })
+    .then(response => {
+        log(`   Response: ${response.status}`);
+        if (!response.ok) {
+            return response.json().then(data => {
+                throw new Error(data.detail || 'Failed to add');
+            });
+        }
+        return response.json();
+    })
+    .then(data => {
+        log(`   ✅ Added to Top 25! ID: ${data.id}`);
+        alert(`✅ Added "${selectedMovie.title}" to Top 25 (Rank #${rank})!`);
+        tmdbPreview.classList.remove('active');
+        selectedMovie = null;
+        tmdbQuery.value = '';
+        tmdbResults.innerHTML = '';
+        loadRecent();
+    })
+    .catch(error => {
+        log(`   ❌ Error: ${error.message}`);
+        alert('Error: ' + error.message);
+    });
+});
+
+// Load recent additions
+function loadRecent() {
+    log('📋 Loading recent additions...');
+
+    Promise.all([
+        fetch('/api/watched', { credentials: 'same-origin' }).then(r => r.json()),
+        fetch('/api/want-to-watch', { credentials: 'same-origin' }).then(r => r.json())
+    ])
+    .then(([watched, planned]) => {
+        log(`   Watched: ${watched.length}, Planned: ${planned.length}`);
+
+        const recent = [...watched.slice(0, 3), ...planned.slice(0, 3)]
+            .sort((a, b) => {
+                const dateA = new Date(a.watch_date || a.launch_date);
+                const dateB = new Date(b.watch_date || b.launch_date);
+                return dateB - dateA;
+            })
+            .slice(0, 6);
+
+        recentList.innerHTML = '';
+        if (recent.length === 0) {
+            recentList.innerHTML = '<div class="empty-state">No items yet. Search and add above!</div>';
+        } else {
+            recent.forEach(item => {
+                const div = document.createElement('div');
+                div.className = 'list-card';
+                div.innerHTML = `
+                    <div class="list-card__header">
+                        <h3>${item.title}</h3>
+                        ${item.score ? `<span class="score">${item.score}/10</span>` : `<span class="badge">Planned</span>`}
+                    </div>
+                    <p class="list-card__text">${item.comment || 'Excitement ' + item.excitement + '/10'}</p>
+                    <p class="list-card__meta">${item.content_type}${item.genres ? ' • ' + item.genres : ''}</p>
+                `;
+                recentList.appendChild(div);
+            });
+        }
+        log('   ✓ Recent list rendered');
+    })
+    .catch(error => {
+        log(`   ❌ Error: ${error.message}`);
+        recentList.innerHTML = '<div class="empty-state">Error loading items</div>';
+    });
+}
+
+// Event listeners
+tmdbSearchBtn.addEventListener('click', searchTMDB);
+tmdbQuery.addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        clearTimeout(autocompleteTimer);
+        searchTMDB();
+    }
+});
+tmdbQuery.addEventListener('input', function() {
+    clearTimeout(autocompleteTimer);
+    autocompleteTimer = setTimeout(autocompleteTMDB, 150);
+});
+
+log('✓ Event listeners attached');
+
+// Initial load
+loadRecent();
+
+log('═══════════════════════════════════════════════');
+log('✅ TMDB CRM LOADED SUCCESSFULLY!');
+log('═══════════════════════════════════════════════');
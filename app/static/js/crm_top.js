@@ -0,0 +1,225 @@
+// --- TMDB Search Logic ---
+const tmdbQuery = document.getElementById('tmdb-query');
+const tmdbSearchBtn = document.getElementById('tmdb-search-btn');
+const tmdbResults = document.getElementById('tmdb-results');
+const tmdbPreview = document.getElementById('tmdb-preview');
+const previewPoster = document.getElementById('preview-poster');
+const previewTitle = document.getElementById('preview-title');
+const previewMeta = document.getElementById('preview-meta');
+const previewSynopsis = document.getElementById('preview-synopsis');
+const addToTopBtn = document.getElementById('add-to-top-btn');
+
+let selectedMovie = null;
+
+function searchTMDB() {
+    const query = tmdbQuery.value.trim();
+    if (!query) return;
+
+    tmdbResults.innerHTML = '<p>Searching...</p>';
+    fetch(`/api/tmdb/search?query=${encodeURIComponent(query)}`, { credentials: 'same-origin' })
+        .then(r => r.json())
+        .then(results => {
+            tmdbResults.innerHTML = '';
+            if (results.length === 0) {
+                tmdbResults.innerHTML = '<p>No results found.</p>';
+                return;
+            }
+            results.forEach(result => {
+                const div = document.createElement('div');
+                div.className = 'tmdb-result';
+                div.innerHTML = `
+                    ${result.poster_url ? `<img src="${result.poster_url}" alt="${result.title}">` : '<div style="height:300px;background:#eee;display:flex;align-items:center;justify-content:center;">No Poster</div>'}
+                    <div class="tmdb-result__info">
+                        <p class="tmdb-result__title">${result.title}</p>
+                        <p class="tmdb-result__meta">${result.media_type === 'movie' ? 'Movie' : 'TV Series'} (${result.year || 'N/A'})</p>
+                    </div>
+                `;
+                div.addEventListener('click', () => selectMovie(result));
+                tmdbResults.appendChild(div);
+            });
+        })
+        .catch(e => tmdbResults.innerHTML = `<p style="color:red">Error: ${e.message}</p>`);
+}
+
+function selectMovie(result) {
+    fetch(`/api/tmdb/details/${result.media_type}/${result.id}`, { credentials: 'same-origin' })
+        .then(r => r.json())
+        .then(details => {
+            selectedMovie = details;
+            showPreview(details);
+        });
+}
+
+function showPreview(details) {
+    tmdbPreview.classList.add('active');
+    previewPoster.src = details.poster_url || '';
+    previewTitle.textContent = details.title;
+    const parts = [
+        details.content_type,
+        details.release_year,
+        details.runtime ? `${details.runtime} min` : '',
+        details.genres
+    ].filter(Boolean);
+    previewMeta.textContent = parts.join(' • ');
+    previewSynopsis.textContent = details.synopsis || 'No synopsis.';
+}
+
+addToTopBtn.addEventListener('click', () => {
+    if (!selectedMovie) return;
+
+    const rank = prompt('Top 25 Rank (1-25):', '1');
+    if (!rank) return;
+
+    // Simplified: we just need rank for Top 25 items generally, but DB requires others.
+    // We'll prompt for basics or default them.
+    const score = prompt('Score (0-10):', '10');
+    if (!score) return;
+    const comment = prompt('Comment:', 'Masterpiece!');
+    if (!comment) return;
+
+    // Default watch date to today if not provided? Or prompt.
+    const watchDate = prompt('Watch date (YYYY-MM-DD):', new Date().toISOString().split('T')[0]);
+    if (!watchDate) return;
+
+    const formData = new FormData();
+    formData.append('title', selectedMovie.title);
+    formData.append('score', score);
+    formData.append('comment', comment);
+    formData.append('watch_date', watchDate);
+    formData.append('content_type', selectedMovie.content_type);
+    formData.append('image_url', selectedMovie.poster_url || '');
+    formData.append('synopsis', selectedMovie.synopsis || '');
+    formData.append('release_year', selectedMovie.release_year || '');
+    formData.append('release_date', selectedMovie.release_date || '');
+    formData.append('runtime', selectedMovie.runtime || '');
+    formData.append('genres', selectedMovie.genres || '');
+    formData.append('tmdb_id', selectedMovie.tmdb_id || '');
+    formData.append('tmdb_rating', selectedMovie.tmdb_rating || '');
+    formData.append('poster_url', selectedMovie.poster_url || '');
+    formData.append('top_rank', rank);
+
+    fetch('/api/watched', { method: 'POST', body: formData, credentials: 'same-origin' })
+        .then(r => {
+            if (r.ok) return r.json();
+            throw new Error('Failed to add');
+        })
+        .then(data => {
+            alert(`Added "${selectedMovie.title}" to Top 25 (Rank #${rank})!`);
+            tmdbPreview.classList.remove('active');
+            tmdbQuery.value = '';
+            tmdbResults.innerHTML = '';
+            selectedMovie = null;
+            refreshLists(); // Refresh the lists below
+        })
+        .catch(e => alert(e.message));
+});
+
+tmdbSearchBtn.addEventListener('click', searchTMDB);
+tmdbQuery.addEventListener('keypress', (e) => { if (e.key === 'Enter') searchTMDB(); });
+
+
+// --- List Management Logic ---
+let topItems = [];
+const byRank = (a, b) => a.top_rank - b.top_rank;
+
+function renderLists() {
+    fetch('/api/top', { credentials: 'same-origin' })
+        .then(r => r.json())
+        .then(data => {
+            topItems = data;
+            drawLists();
+        });
+}
+
+function drawLists() {
+    const movies = topItems.filter(i => i.content_type === 'Movie');
+    const series = topItems.filter(i => i.content_type === 'TV Series');
+
+    renderSection('top-movies-list', movies);
+    renderSection('top-series-list', series);
+}
+
+function applyChange(change) {
+    if (change.table !== 'watched') return;
+    const item = change.item && change.item.top_rank !== null ? change.item : null;
+    topItems = spliceById(topItems, change.item_id, item, byRank);
+    drawLists();
+}
+
+const changeFeed = connectChangeFeed({ apply: applyChange, reload: renderLists });
+
+function refreshLists() {
+    if (!changeFeed.live) renderLists();
+}
+
+function findItem(id) {
+    return topItems.find(i => i.id === id);
+}
+
+function renderSection(elementId, items) {
+    const container = document.getElementById(elementId);
+    container.innerHTML = '';
+    if (items.length === 0) {
+        container.innerHTML = '<div class="empty-state">No items in this list.</div>';
+        return;
+    }
+    items.forEach(item => {
+        const div = document.createElement('div');
+        div.className = 'list-card';
+        div.innerHTML = `
+            <div class="list-card__header">
+                <h3>#${item.top_rank} ${item.title}</h3>
+                <span class="badge">${item.content_type}</span>
+            </div>
+            <p class="list-card__text">${item.comment}</p>
+            <div class="list-card__actions">
+                <button class="button button--ghost" onclick="updateRank(${item.id}, ${item.top_rank})">Update Rank</button>
+                <button class="button button--ghost" onclick="updateComment(${item.id}, '${item.comment.replace(/'/g, "\\'")}')">Update Comment</button>
+                <button class="button button--danger" onclick="removeFromTop(${item.id})">Remove from List</button>
+            </div>
+        `;
+        container.appendChild(div);
+    });
+}
+
+function updateRank(id, currentRank) {
+    const newRank = prompt('New Rank:', currentRank);
+    if (!newRank) return;
+
+    const item = findItem(id);
+    if (item) {
+        saveItem(id, { ...item, top_rank: Number(newRank) });
+    }
+}
+
+function updateComment(id, currentComment) {
+    const newComment = prompt('New Comment:', currentComment);
+    if (newComment === null) return; // User cancelled
+
+    const item = findItem(id);
+    if (item) {
+        saveItem(id, { ...item, comment: newComment });
+    }
+}
+
+function removeFromTop(id) {
+    if (!confirm('Remove from Top 25? (Item will remain in Watched list)')) return;
+
+    const item = findItem(id);
+    if (item) {
+        saveItem(id, { ...item, top_rank: null });
+    }
+}
+
+function saveItem(id, payload) {
+    fetch(`/api/watched/${id}`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        credentials: 'same-origin',
+        body: JSON.stringify(payload)
+    })
+    .then(r => {
+        if(r.ok) refreshLists();
+        else alert('Failed to update');
+    });
+}
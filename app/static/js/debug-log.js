@@ -0,0 +1,8 @@
+// Appends a timestamped line to the page's #debug-log panel and the console.
+function log(message) {
+    const debugLog = document.getElementById('debug-log');
+    const timestamp = new Date().toLocaleTimeString();
+    debugLog.innerHTML += `\n[${timestamp}] ${message}`;
+    debugLog.scrollTop = debugLog.scrollHeight;
+    console.log(message);
+}
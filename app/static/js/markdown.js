@@ -0,0 +1,47 @@
+// Markdown rendering shared by the blog pages and the CRM editors, so a
+// preview looks exactly like the published post. Input is HTML-escaped first;
+// only the markup produced here reaches the page.
+function encodeHtml(value) {
+    const div = document.createElement('div');
+    div.textContent = value;
+    return div.innerHTML;
+}
+
+function renderMarkdown(text) {
+    if (!text) {
+        return '';
+    }
+    const escaped = encodeHtml(text);
+    const parts = escaped.split('```');
+    const rendered = parts.map((part, index) => {
+        if (index % 2 === 1) {
+            return `<pre><code>${part}</code></pre>`;
+        }
+        let output = part;
+        output = output.replace(/^### (.*)$/gm, '<h3>$1</h3>');
+        output = output.replace(/^## (.*)$/gm, '<h2>$1</h2>');
+        output = output.replace(/^# (.*)$/gm, '<h1>$1</h1>');
+        output = output.replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>');
+        output = output.replace(/\*(.*?)\*/g, '<em>$1</em>');
+        output = output.replace(/\[(.*?)\]\((.*?)\)/g, '<a href="$2" target="_blank" rel="noopener">$1</a>');
+        output = output.replace(/^\s*[-*] (.*)$/gm, '<li>$1</li>');
+        output = output.replace(/(<li>.*<\/li>)/g, '<ul>$1</ul>');
+        output = output.replace(/\n{2,}/g, '</p><p>');
+        output = `<p>${output}</p>`;
+        output = output.replace(/<p><\/p>/g, '');
+        output = output.replace(/<p>(<h[1-3]>)/g, '$1');
+        output = output.replace(/(<\/h[1-3]>)<\/p>/g, '$1');
+        return output;
+    });
+    return rendered.join('');
+}
+
+function slugify(value) {
+    return value
+        .toLowerCase()
+        .trim()
+        .replace(/\s+/g, '-')
+        .replace(/[^a-z0-9-]/g, '')
+        .replace(/-+/g, '-')
+        .replace(/^-|-$/g, '');
+}
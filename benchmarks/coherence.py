@@ -0,0 +1,122 @@
+"""
+Cross-process cache coherence check.
+
+Starts the app with several uvicorn workers, warms every worker's page and
+similarity caches, writes through one worker and then reads through fresh
+connections (spread across workers by the kernel) to confirm that none of them
+serves stale data.
+
+Usage:
+    python -m benchmarks.coherence --workers 4 --probes 40
+"""
+import argparse
+import base64
+import http.client
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+from benchmarks import load, seed, tmdb_stub
+
+USERNAME = "coherence"
+PASSWORD = "coherence-check"
+
+def request(port: int, method: str, path: str, body: bytes = None, headers: dict = None):
+    # A new connection per call so requests land on different workers.
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, response.read().decode("utf-8", "replace")
+    finally:
+        conn.close()
+
+def auth_headers(extra: dict = None) -> dict:
+    token = base64.b64encode(f"{USERNAME}:{PASSWORD}".encode()).decode()
+    return {"Authorization": f"Basic {token}", **(extra or {})}
+
+def probe(port: int, probes: int, check) -> int:
+    """Return how many of ``probes`` fresh reads failed ``check``."""
+    return sum(0 if check(port) else 1 for _ in range(probes))
+
+def run(workers: int = 4, probes: int = 40, size: int = 300) -> dict:
+    stub = tmdb_stub.start()
+    port = load.free_port()
+    with tempfile.TemporaryDirectory() as scratch, open(Path(scratch) / "server.log", "w+") as log:
+        db_path = str(Path(scratch) / "app.db")
+        seed.seed(db_path, size)
+        watched_id = size  # seeded blog posts cover the first half of the watched rows
+        slug = f"coherence-{int(time.time())}"
+        server = load.start_server(
+            db_path, str(Path(scratch) / "tmdb_index.db"), stub.server_port, port, workers, log,
+            extra_env={"BASIC_AUTH_USERNAME": USERNAME, "BASIC_AUTH_PASSWORD": PASSWORD,
+                       "SESSION_KEY_PATH": str(Path(scratch) / "session.key")},
+        )
+        try:
+            load.wait_for(port)
+            # Warm the caches in every worker.
+            for _ in range(probes):
+                request(port, "GET", "/blog")
+                request(port, "GET", f"/api/watched/{watched_id}/similar")
+
+            results = {}
+            status, _ = request(
+                port, "POST", "/api/blog",
+                body=urlencode({"watched_id": watched_id, "title": "Coherence", "slug": slug, "body": "Checking."}).encode(),
+                headers=auth_headers({"Content-Type": "application/x-www-form-urlencoded"}),
+            )
+            assert status == 200, f"blog insert failed with {status}"
+            results["blog_insert_stale"] = probe(port, probes, lambda p: slug in request(p, "GET", "/blog")[1])
+            results["blog_detail_stale"] = probe(port, probes, lambda p: request(p, "GET", f"/blog/{slug}")[0] == 200)
+
+            status, body = request(
+                port, "POST", "/api/want-to-watch",
+                body=urlencode({
+                    "title": "Coherence Title", "launch_date": "2030-01-01", "excitement": 7,
+                    "content_type": "Movie", "genres": "Drama", "image_url": "https://example.com/p.jpg",
+                }).encode(),
+                headers=auth_headers({"Content-Type": "application/x-www-form-urlencoded"}),
+            )
+            assert status == 200, f"want-to-watch insert failed with {status}"
+            queued_id = json.loads(body)["id"]
+            results["similar_insert_stale"] = probe(
+                port, probes, lambda p: request(p, "GET", f"/api/want-to-watch/{queued_id}/similar")[0] == 200
+            )
+            status, _ = request(port, "DELETE", f"/api/want-to-watch/{queued_id}", headers=auth_headers())
+            assert status == 200, f"want-to-watch delete failed with {status}"
+            results["similar_delete_stale"] = probe(
+                port, probes, lambda p: request(p, "GET", f"/api/want-to-watch/{queued_id}/similar")[0] == 404
+            )
+
+            posts = json.loads(request(port, "GET", "/api/blog")[1])
+            post_id = next(post["id"] for post in posts if post["slug"] == slug)
+            status, _ = request(port, "DELETE", f"/api/blog/{post_id}", headers=auth_headers())
+            assert status == 200, f"blog delete failed with {status}"
+            results["blog_delete_stale"] = probe(port, probes, lambda p: slug not in request(p, "GET", "/blog")[1])
+            results["blog_detail_delete_stale"] = probe(port, probes, lambda p: request(p, "GET", f"/blog/{slug}")[0] == 404)
+            return results
+        except Exception:
+            log.seek(0)
+            print(log.read()[-4000:], file=sys.stderr)
+            raise
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+            stub.shutdown()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check cache coherence across uvicorn workers")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--probes", type=int, default=40, help="Fresh-connection reads per check")
+    args = parser.parse_args(argv)
+    results = run(args.workers, args.probes)
+    for name, stale in results.items():
+        print(f"  {name:<26} {'ok' if not stale else f'{stale} stale read(s)'}")
+    if any(results.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Cold-start benchmark: time ``import main`` and the startup hook in fresh interpreters.
+
+Usage:
+    python -m benchmarks.cold_start --db benchmarks/data/app_10k.db --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# Runs in the child interpreter; prints import and startup time in ms as JSON.
+PROBE = """
+import json, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.items.init_db()
+main.title_index.init_index()
+ready = time.perf_counter()
+print(json.dumps({"import_ms": (imported - start) * 1000, "startup_ms": (ready - imported) * 1000}))
+"""
+
+def child_env(db_path: Optional[str], index_path: Optional[str]) -> dict:
+    env = dict(os.environ, LOG_LEVEL="WARNING")
+    if db_path:
+        env["APP_DB_PATH"] = db_path
+    if index_path:
+        env["TMDB_INDEX_PATH"] = index_path
+    return env
+
+def slowest_imports(env: dict, count: int = 15) -> List[dict]:
+    """Top modules by cumulative import time from ``python -X importtime``."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stderr
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|").split("|")]
+        modules.append({"module": name.strip(), "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    modules.sort(key=lambda module: module["cumulative_ms"], reverse=True)
+    return modules[:count]
+
+def run(db_path: Optional[str] = None, runs: int = 5, index_path: Optional[str] = None) -> Dict[str, dict]:
+    env = child_env(db_path, index_path)
+    # The first run migrates a fresh database; later runs show the warm-schema path.
+    subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, check=True)
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True)
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    results = {}
+    for key in ("import_ms", "startup_ms"):
+        values = sorted(sample[key] for sample in samples)
+        results[key[:-3]] = {
+            "runs": runs,
+            "p50_ms": round(statistics.median(values), 3),
+            "max_ms": round(values[-1], 3),
+        }
+    results["total"] = {
+        "runs": runs,
+        "p50_ms": round(statistics.median(sample["import_ms"] + sample["startup_ms"] for sample in samples), 3),
+    }
+    print(
+        f"  import main      p50 {results['import']['p50_ms']:>8.1f} ms\n"
+        f"  startup hooks    p50 {results['startup']['p50_ms']:>8.1f} ms"
+    )
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold start of the app")
+    parser.add_argument("--db", help="Database to start against (default: APP_DB_PATH / app/data/app.db)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Fail when import + startup p50 exceeds this")
+    parser.add_argument("--profile", action="store_true", help="Also list the slowest imports")
+    args = parser.parse_args(argv)
+
+    results = run(args.db, args.runs)
+    if args.profile:
+        for module in slowest_imports(child_env(args.db, None)):
+            print(f"  {module['cumulative_ms']:>8.1f} ms  {module['module']}")
+    print(json.dumps(results, indent=2))
+    if results["total"]["p50_ms"] > args.budget_ms:
+        print(f"Cold start {results['total']['p50_ms']:.0f} ms exceeds budget of {args.budget_ms:.0f} ms", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+HTTP load test against a real uvicorn process.
+
+The app runs in a subprocess pointed at a seeded database, a throwaway title
+index and the local TMDB stub, so results are reproducible and offline.
+
+Usage:
+    python -m benchmarks.load --db benchmarks/data/app_10k.db --concurrency 8 --duration 10
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks import tmdb_stub
+
+ENDPOINTS = {
+    "home": "/",
+    "top": "/top",
+    "blog": "/blog",
+    "api_watched": "/api/watched",
+    "tmdb_search": "/api/tmdb/search?query={word}",
+}
+SEARCH_WORDS = "night city river ghost shadow fire moon king dragon blade alien winter".split()
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_for(port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/api/top")
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not start within {timeout}s")
+
+def start_server(db_path: str, index_path: str, stub_port: int, port: int, workers: int = 1, log=None,
+                 extra_env: Optional[dict] = None) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        **(extra_env or {}),
+        APP_DB_PATH=db_path,
+        TMDB_INDEX_PATH=index_path,
+        TMDB_API_BASE=f"http://127.0.0.1:{stub_port}/3",
+        TMDB_API_KEY=os.getenv("TMDB_API_KEY", "benchmark"),
+    )
+    command = [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+    ]
+    return subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT if log else None)
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+def hammer(port: int, path: str, concurrency: int, duration: float) -> Dict[str, float]:
+    """Issue keep-alive GETs from ``concurrency`` threads for ``duration`` seconds."""
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(worker_id: int):
+        rng = random.Random(worker_id)
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        local: List[float] = []
+        failed = 0
+        while time.perf_counter() < deadline:
+            target = path.format(word=rng.choice(SEARCH_WORDS))
+            start = time.perf_counter()
+            try:
+                conn.request("GET", target)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 400:
+                    failed += 1
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                continue
+            local.append((time.perf_counter() - start) * 1000)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p90_ms": round(percentile(latencies, 0.90), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+def run(db_path: str, concurrency: int = 8, duration: float = 10.0, warmup: float = 1.0,
+        workers: int = 1, endpoints: Dict[str, str] = ENDPOINTS) -> Dict[str, dict]:
+    stub = tmdb_stub.start()
+    port = free_port()
+    with tempfile.TemporaryDirectory() as scratch, open(Path(scratch) / "server.log", "w+") as log:
+        server = start_server(
+            str(Path(db_path).resolve()), str(Path(scratch) / "tmdb_index.db"),
+            stub.server_port, port, workers, log,
+        )
+        try:
+            try:
+                wait_for(port)
+            except RuntimeError:
+                log.seek(0)
+                print(log.read()[-4000:], file=sys.stderr)
+                raise
+            results = {}
+            for name, path in endpoints.items():
+                if warmup:
+                    hammer(port, path, concurrency, warmup)
+                results[name] = hammer(port, path, concurrency, duration)
+                result = results[name]
+                print(
+                    f"  {name:<12} {result['rps']:>8.1f} req/s   p50 {result['p50_ms']:>8.2f} ms   "
+                    f"p99 {result['p99_ms']:>8.2f} ms   errors {result['errors']}"
+                )
+            return results
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+            stub.shutdown()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the app with a synthetic database")
+    parser.add_argument("--db", required=True, help="Database created by benchmarks.seed")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per endpoint")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Warm-up seconds per endpoint")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.db, args.concurrency, args.duration, args.warmup, args.workers), indent=2))
+
+if __name__ == "__main__":
+    main()
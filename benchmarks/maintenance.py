@@ -0,0 +1,99 @@
+"""
+Request latency with and without database maintenance running.
+
+Copies a seeded database to a scratch directory, load tests `/` and
+`/api/watched` once idle and once while a backup and every maintenance task
+run back to back in this process, then prints both so spikes stand out.
+
+Usage:
+    python -m benchmarks.maintenance --db benchmarks/data/app_10k.db --duration 10
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks import load, tmdb_stub
+
+ENDPOINTS = {"home": "/", "api_watched": "/api/watched"}
+
+def maintenance_loop(stop: threading.Event, backup_path: str, timings: dict):
+    from app.services import maintenance
+
+    while not stop.is_set():
+        start = time.perf_counter()
+        maintenance.backup(backup_path)
+        timings.setdefault("backup", []).append(time.perf_counter() - start)
+        for name in maintenance.TASKS:
+            if stop.is_set():
+                return
+            result = maintenance.run_task(name)
+            timings.setdefault(name, []).append(result["seconds"])
+
+def run(db_path: str, concurrency: int = 8, duration: float = 10.0, workers: int = 1) -> dict:
+    with tempfile.TemporaryDirectory() as scratch:
+        db_copy = str(Path(scratch) / "app.db")
+        shutil.copyfile(db_path, db_copy)
+        # The maintenance module reads its settings at import time.
+        os.environ["APP_DB_PATH"] = db_copy
+        stub = tmdb_stub.start()
+        port = load.free_port()
+        with open(Path(scratch) / "server.log", "w+") as log:
+            server = load.start_server(
+                db_copy, str(Path(scratch) / "tmdb_index.db"), stub.server_port, port, workers, log,
+                extra_env={"MAINTENANCE_ENABLED": "0"},
+            )
+            try:
+                load.wait_for(port)
+                results = {"idle": {}, "maintenance": {}}
+                for name, path in ENDPOINTS.items():
+                    load.hammer(port, path, concurrency, 1.0)
+                    results["idle"][name] = load.hammer(port, path, concurrency, duration)
+
+                stop = threading.Event()
+                timings: dict = {}
+                thread = threading.Thread(
+                    target=maintenance_loop, args=(stop, str(Path(scratch) / "backup.db"), timings), daemon=True
+                )
+                thread.start()
+                for name, path in ENDPOINTS.items():
+                    results["maintenance"][name] = load.hammer(port, path, concurrency, duration)
+                stop.set()
+                thread.join()
+                results["tasks"] = {
+                    name: {"runs": len(values), "max_ms": round(max(values) * 1000, 3)}
+                    for name, values in timings.items()
+                }
+            except RuntimeError:
+                log.seek(0)
+                print(log.read()[-4000:], file=sys.stderr)
+                raise
+            finally:
+                server.terminate()
+                server.wait(timeout=10)
+                stub.shutdown()
+    for name in ENDPOINTS:
+        idle, busy = results["idle"][name], results["maintenance"][name]
+        print(
+            f"  {name:<12} p50 {idle['p50_ms']:>7.2f} -> {busy['p50_ms']:>7.2f} ms   "
+            f"p99 {idle['p99_ms']:>7.2f} -> {busy['p99_ms']:>7.2f} ms   "
+            f"max {idle['max_ms']:>7.2f} -> {busy['max_ms']:>7.2f} ms"
+        )
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure request latency while maintenance runs")
+    parser.add_argument("--db", required=True, help="Database created by benchmarks.seed")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per endpoint and phase")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.db, args.concurrency, args.duration, args.workers), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Microbenchmarks for the data helpers, template rendering and image processing.
+
+Usage:
+    python -m benchmarks.micro --db benchmarks/data/app_10k.db
+"""
+import argparse
+import io
+import json
+import statistics
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Callable, Dict
+
+def measure(func: Callable[[], object], min_time: float = 1.0, min_runs: int = 5, max_runs: int = 10_000) -> Dict[str, float]:
+    func()
+    samples = []
+    started = perf_counter()
+    while len(samples) < max_runs and (len(samples) < min_runs or perf_counter() - started < min_time):
+        start = perf_counter()
+        func()
+        samples.append((perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p50_ms": round(samples[len(samples) // 2], 4),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 4),
+    }
+
+def jpeg_upload(width: int = 1600, height: int = 1000) -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (120, 80, 40)).save(buffer, "JPEG", quality=85)
+    return buffer.getvalue()
+
+def run(db_path: str, min_time: float = 1.0) -> Dict[str, dict]:
+    from app.routers import items
+    from app.services import analytics, feeds, pages
+
+    items.DB_PATH = db_path
+    watched_ids = [item["id"] for item in items.get_watched_list()]
+    home = pages.home_context()
+    top = pages.top_context()
+    blog = pages.blog_context()
+    index_template = pages.templates.get_template("index.html")
+    top_template = pages.templates.get_template("top.html")
+    blog_template = pages.templates.get_template("blog.html")
+    upload = jpeg_upload()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        output = str(Path(scratch) / "poster.jpg")
+
+        def resize():
+            items.save_and_resize_image(SimpleNamespace(file=io.BytesIO(upload)), output)
+
+        cases = {
+            "get_watched_list": items.get_watched_list,
+            "get_want_to_watch_list": items.get_want_to_watch_list,
+            "get_blog_slug_map": lambda: items.get_blog_slug_map(watched_ids),
+            "get_blog_posts": items.get_blog_posts,
+            "get_blog_page": lambda: items.get_blog_page(pages.BLOG_PAGE_SIZE),
+            # Uncached build cost; requests normally hit the change-journal cache.
+            "home_context": pages.home_context.__wrapped__,
+            "home_context_cached": pages.home_context,
+            # Cards come from the fragment cache after the first render.
+            "render_index": lambda: index_template.render(home),
+            "render_index_uncached": lambda: (pages.templates.env.fragment_cache.clear(), index_template.render(home)),
+            "render_top": lambda: top_template.render(top),
+            "render_blog": lambda: blog_template.render(blog),
+            "render_feed": lambda: feeds.render_feed.__wrapped__("rss.xml"),
+            "analytics_summary": analytics.summary,
+            "analytics_year_in_review": lambda: analytics.year_in_review(2024),
+            "save_and_resize_image": resize,
+        }
+        results = {}
+        for name, func in cases.items():
+            results[name] = measure(func, min_time=min_time)
+            print(f"  {name:<24} mean {results[name]['mean_ms']:>9.3f} ms   p99 {results[name]['p99_ms']:>9.3f} ms")
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run microbenchmarks against a seeded database")
+    parser.add_argument("--db", required=True, help="Database created by benchmarks.seed")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds to spend per case")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.db, args.min_time), indent=2))
+
+if __name__ == "__main__":
+    main()
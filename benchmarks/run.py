@@ -0,0 +1,113 @@
+"""
+Run the benchmark suite and record results for comparison between commits.
+
+Usage:
+    python -m benchmarks.run --sizes 1k 10k
+    python -m benchmarks.run --sizes 10k --skip-load --compare benchmarks/results/<previous>.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks import cold_start, load, micro, seed
+
+RESULTS_DIR = Path("benchmarks/results")
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def flatten(results: dict) -> Dict[str, float]:
+    """Map ``size/kind/case/metric`` to a number for every latency metric."""
+    flat = {}
+    for size, kinds in results["sizes"].items():
+        for kind, cases in kinds.items():
+            for case, metrics in cases.items():
+                for metric, value in metrics.items():
+                    if metric.endswith("_ms") or metric == "rps":
+                        flat[f"{size}/{kind}/{case}/{metric}"] = value
+    return flat
+
+def compare(previous: dict, current: dict, threshold: float) -> List[str]:
+    """Print per-metric changes and return the keys that regressed past ``threshold`` percent."""
+    before, after = flatten(previous), flatten(current)
+    regressions = []
+    print(f"\nCompared with {previous.get('revision', '?')} ({previous.get('timestamp', '?')}):")
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        if not old:
+            continue
+        change = (new - old) / old * 100
+        # Throughput regresses when it drops; latencies when they grow.
+        worse = -change if key.endswith("/rps") else change
+        marker = "  REGRESSION" if worse > threshold else ""
+        if marker:
+            regressions.append(key)
+        print(f"  {key:<52} {old:>10.3f} -> {new:>10.3f}  {change:+7.1f}%{marker}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed, benchmark and load test the app")
+    parser.add_argument("--sizes", nargs="+", choices=sorted(seed.SIZES), default=["1k", "10k"])
+    parser.add_argument("--images", type=int, default=20, help="Poster images to generate when seeding")
+    parser.add_argument("--reseed", action="store_true", help="Recreate seeded databases")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds per microbenchmark case")
+    parser.add_argument("--skip-load", action="store_true", help="Only run microbenchmarks")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per load-tested endpoint")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="Previous results file to diff against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    results = {
+        "timestamp": timestamp,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "min_time": args.min_time,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "workers": args.workers,
+        },
+        "sizes": {},
+    }
+    for size in args.sizes:
+        db_path = f"benchmarks/data/app_{size}.db"
+        if args.reseed or not Path(db_path).exists():
+            print(f"Seeding {size}...")
+            seed.seed(db_path, seed.SIZES[size], images=args.images)
+        print(f"[{size}] cold start")
+        results["sizes"][size] = {"cold_start": cold_start.run(db_path)}
+        print(f"[{size}] microbenchmarks")
+        results["sizes"][size]["micro"] = micro.run(db_path, args.min_time)
+        if not args.skip_load:
+            print(f"[{size}] load test")
+            results["sizes"][size]["load"] = load.run(
+                db_path, args.concurrency, args.duration, workers=args.workers
+            )
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{timestamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text())
+        if compare(previous, results, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Synthetic data generator for benchmarks.
+
+Usage:
+    python -m benchmarks.seed --size 10k --db benchmarks/data/app_10k.db --images 50
+"""
+import argparse
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+BENCH_IMAGES_DIR = Path("app/static/images/bench")
+GENRES = [
+    "Action", "Adventure", "Animation", "Comedy", "Crime", "Documentary", "Drama", "Family",
+    "Fantasy", "History", "Horror", "Music", "Mystery", "Romance", "Science Fiction", "Thriller",
+    "War", "Western", "Sci-Fi & Fantasy", "Action & Adventure",
+]
+WORDS = (
+    "night city river ghost shadow fire moon sun king house dragon blade runner alien home "
+    "lost return dark star love story war game heart road last first winter summer glass iron"
+).split()
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+def paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(sentence(rng, rng.randint(6, 14)) for _ in range(sentences))
+
+def markdown_body(rng: random.Random) -> str:
+    sections = []
+    for _ in range(rng.randint(2, 4)):
+        sections.append(f"## {sentence(rng, 3)[:-1]}")
+        sections.append(paragraph(rng, rng.randint(3, 6)))
+        sections.append(f"- **{rng.choice(WORDS)}** {sentence(rng, 5)}\n- *{rng.choice(WORDS)}* {sentence(rng, 5)}")
+    return "\n\n".join(sections)
+
+def make_images(count: int, rng: random.Random) -> List[str]:
+    if count <= 0:
+        return []
+    from PIL import Image
+
+    BENCH_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    urls = []
+    for index in range(count):
+        path = BENCH_IMAGES_DIR / f"poster_{index:04d}.jpg"
+        if not path.exists():
+            color = tuple(rng.randint(0, 255) for _ in range(3))
+            Image.new("RGB", (600, 900), color).save(path, "JPEG", quality=80)
+        urls.append(f"/static/images/bench/{path.name}")
+    return urls
+
+def random_date(rng: random.Random, start: date, days: int) -> str:
+    return (start + timedelta(days=rng.randint(0, days))).isoformat()
+
+def seed(db_path: str, size: int, images: int = 0, random_seed: int = 2026) -> dict:
+    """Create (or replace) a database at ``db_path`` with synthetic rows."""
+    from app.routers import items
+
+    rng = random.Random(random_seed)
+    path = Path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    previous_path = items.DB_PATH
+    items.DB_PATH = db_path
+    try:
+        items.init_db()
+    finally:
+        items.DB_PATH = previous_path
+
+    image_urls = make_images(images, rng) or ["https://image.tmdb.org/t/p/w500/placeholder.jpg"]
+    watched_rows = []
+    for index in range(size):
+        content_type = "TV Series" if rng.random() < 0.35 else "Movie"
+        release_year = rng.randint(1960, 2026)
+        poster = rng.choice(image_urls)
+        top_rank = index // 2 + 1 if index < 50 else None
+        watched_rows.append((
+            f"{sentence(rng, rng.randint(1, 4))[:-1]} {index}",
+            paragraph(rng, rng.randint(1, 3)),
+            rng.randint(0, 10),
+            poster,
+            random_date(rng, date(2015, 1, 1), 4000),
+            content_type,
+            rng.randint(1, 8) if content_type == "TV Series" else None,
+            paragraph(rng, rng.randint(2, 4)),
+            release_year,
+            f"{release_year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            rng.randint(22, 60) if content_type == "TV Series" else rng.randint(80, 190),
+            ", ".join(rng.sample(GENRES, rng.randint(1, 3))),
+            100_000 + index,
+            round(rng.uniform(4.0, 9.5), 1),
+            poster,
+            top_rank,
+        ))
+
+    queue_rows = []
+    for index in range(max(size // 4, 1)):
+        content_type = "TV Series" if rng.random() < 0.35 else "Movie"
+        poster = rng.choice(image_urls)
+        queue_rows.append((
+            f"{sentence(rng, rng.randint(1, 4))[:-1]} upcoming {index}",
+            poster,
+            random_date(rng, date(2025, 1, 1), 1000),
+            rng.randint(1, 10),
+            content_type,
+            rng.randint(1, 5) if content_type == "TV Series" else None,
+            paragraph(rng, 2),
+            rng.randint(2024, 2028),
+            rng.randint(80, 180),
+            ", ".join(rng.sample(GENRES, rng.randint(1, 3))),
+            500_000 + index,
+            round(rng.uniform(4.0, 9.5), 1),
+            poster,
+        ))
+
+    created = datetime(2020, 1, 1)
+    blog_rows = [
+        (
+            watched_id,
+            f"Notes on {sentence(rng, 3)[:-1]}",
+            f"bench-post-{watched_id}",
+            markdown_body(rng),
+            (created + timedelta(minutes=watched_id * 37)).isoformat(),
+        )
+        for watched_id in range(1, max(size // 2, 1) + 1)
+    ]
+
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            """
+            INSERT INTO watched (
+                title, comment, score, image_url, watch_date, content_type, season, synopsis,
+                release_year, release_date, runtime, genres, tmdb_id, tmdb_rating, poster_url, top_rank, title_key
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [(*row, items.normalize_title(row[0])) for row in watched_rows],
+        )
+        conn.executemany(
+            """
+            INSERT INTO want_to_watch (
+                title, image_url, launch_date, excitement, content_type, season,
+                synopsis, release_year, runtime, genres, tmdb_id, tmdb_rating, poster_url, title_key
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [(*row, items.normalize_title(row[0])) for row in queue_rows],
+        )
+        for watched_id, title, slug, body, created_at in blog_rows:
+            cursor = conn.execute(
+                "INSERT INTO blog_posts (watched_id, title, slug, excerpt, created_at) VALUES (?, ?, ?, ?, ?)",
+                (watched_id, title, slug, items.blog_excerpt(body), created_at),
+            )
+            items.save_blog_body(conn, cursor.lastrowid, body)
+        conn.commit()
+
+    return {
+        "db": db_path,
+        "watched": len(watched_rows),
+        "want_to_watch": len(queue_rows),
+        "blog_posts": len(blog_rows),
+        "images": len(image_urls) if images else 0,
+        "bytes": path.stat().st_size,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed a database with synthetic benchmark data")
+    parser.add_argument("--size", choices=sorted(SIZES), default="1k", help="Number of watched rows")
+    parser.add_argument("--db", help="Target database (default: benchmarks/data/app_<size>.db)")
+    parser.add_argument("--images", type=int, default=20, help="Poster images to generate")
+    parser.add_argument("--seed", type=int, default=2026, help="Random seed")
+    args = parser.parse_args(argv)
+    db_path = args.db or f"benchmarks/data/app_{args.size}.db"
+    result = seed(db_path, SIZES[args.size], images=args.images, random_seed=args.seed)
+    print(
+        f"Seeded {result['db']}: {result['watched']} watched, {result['want_to_watch']} queued, "
+        f"{result['blog_posts']} blog posts, {result['bytes'] / 1024:.0f} KiB"
+    )
+
+if __name__ == "__main__":
+    main()
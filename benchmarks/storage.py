@@ -0,0 +1,154 @@
+"""
+Database size and blog query times with bodies inline versus in ``blog_bodies``.
+
+Rebuilds the pre-migration layout (bodies as plain text in ``blog_posts``) from
+a seeded database, migrates a copy of it with ``init_db`` the way a deployed
+app would on startup, compacts both and compares file sizes and the queries
+behind the blog listing, archive, feeds and post pages.
+
+Usage:
+    python -m benchmarks.storage --db benchmarks/data/app_10k.db
+"""
+import argparse
+import json
+import shutil
+import sqlite3
+import tempfile
+from contextlib import closing
+from pathlib import Path
+
+from benchmarks.micro import measure
+
+COLUMNS = """
+    b.id, b.watched_id, b.title, b.slug, {excerpt} AS excerpt, b.created_at,
+    w.poster_url, w.image_url, w.score, w.release_year, w.genres, w.tmdb_rating, w.content_type
+"""
+# The queries behind each blog view, as written for either layout.
+QUERIES = {
+    "blog_page": """
+        SELECT {columns} FROM blog_posts b JOIN watched w ON b.watched_id = w.id
+        ORDER BY b.created_at DESC LIMIT 12
+    """,
+    "blog_page_genre": """
+        SELECT {columns} FROM blog_posts b JOIN watched w ON b.watched_id = w.id
+        WHERE (',' || replace(w.genres, ', ', ',') || ',') LIKE '%,Western,%'
+        ORDER BY b.created_at DESC LIMIT 20
+    """,
+    "blog_scan": """
+        SELECT {columns} FROM blog_posts b JOIN watched w ON b.watched_id = w.id
+        ORDER BY b.created_at DESC
+    """,
+    "blog_months": """
+        SELECT substr(b.created_at, 1, 7) AS month, COUNT(*) AS posts
+        FROM blog_posts b JOIN watched w ON b.watched_id = w.id
+        GROUP BY month ORDER BY month DESC
+    """,
+    "post_by_slug": """
+        SELECT b.id, b.title, b.slug, {body} AS body, b.created_at, w.title AS movie_title, w.synopsis
+        FROM blog_posts b JOIN watched w ON b.watched_id = w.id {join} WHERE b.slug = ?
+    """,
+}
+LAYOUTS = {
+    "inline": {"columns": COLUMNS.format(excerpt="substr(b.body, 1, 480)"), "body": "b.body", "join": ""},
+    "tiered": {
+        "columns": COLUMNS.format(excerpt="b.excerpt"),
+        "body": "unpack_text(t.codec, t.data)",
+        "join": "LEFT JOIN blog_bodies t ON t.post_id = b.id",
+    },
+}
+
+def inline_layout(source: str, target: str):
+    """Write ``target`` as a schema-4 database with every body back in ``blog_posts``."""
+    from app.services import textstore
+
+    with closing(sqlite3.connect(source)) as conn:
+        conn.execute("VACUUM INTO ?", (target,))
+    with closing(sqlite3.connect(target, isolation_level=None)) as conn:
+        textstore.register(conn)
+        conn.execute("BEGIN")
+        for action in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER IF EXISTS blog_posts_journal_{action}")
+        conn.execute("DROP TRIGGER blog_posts_drop_body")
+        conn.execute("ALTER TABLE blog_posts ADD COLUMN body TEXT NOT NULL DEFAULT ''")
+        conn.execute(
+            """
+            UPDATE blog_posts SET body = (
+                SELECT unpack_text(codec, data) FROM blog_bodies WHERE post_id = blog_posts.id
+            )
+            """
+        )
+        conn.execute("DROP TABLE blog_bodies")
+        conn.execute("ALTER TABLE blog_posts DROP COLUMN excerpt")
+        conn.execute("PRAGMA user_version = 4")
+        conn.execute("COMMIT")
+        conn.execute("VACUUM")
+
+def timed_query(path: str, sql: str, params: tuple = ()):
+    from app.services import textstore
+
+    def query():
+        # A fresh connection per call, like the app, so SQLite's page cache starts empty.
+        with closing(sqlite3.connect(path)) as conn:
+            textstore.register(conn)
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(sql, params)]
+    return query
+
+def compact(path: str) -> int:
+    with closing(sqlite3.connect(path, isolation_level=None)) as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+    return Path(path).stat().st_size
+
+def run(db_path: str, min_time: float = 1.0) -> dict:
+    from app.routers import items
+
+    with tempfile.TemporaryDirectory() as scratch:
+        inline = str(Path(scratch) / "inline.db")
+        tiered = str(Path(scratch) / "tiered.db")
+        inline_layout(db_path, inline)
+        shutil.copyfile(inline, tiered)
+        items.DB_PATH = tiered
+        items.init_db()
+        with closing(sqlite3.connect(inline)) as conn:
+            slug = conn.execute("SELECT slug FROM blog_posts ORDER BY created_at DESC LIMIT 1").fetchone()[0]
+            posts, inline_bodies = conn.execute(
+                "SELECT COUNT(*), SUM(length(CAST(body AS BLOB))) FROM blog_posts"
+            ).fetchone()
+        with closing(sqlite3.connect(tiered)) as conn:
+            stored_bodies = conn.execute("SELECT SUM(length(data)) FROM blog_bodies").fetchone()[0]
+
+        # Compacted first, as `manage.py maintenance compact` would after the migration.
+        sizes = {"inline": compact(inline), "tiered": compact(tiered)}
+        paths = {"inline": inline, "tiered": tiered}
+        queries = {
+            name: {
+                layout: measure(
+                    timed_query(paths[layout], sql.format(**LAYOUTS[layout]), (slug,) if "?" in sql else ()),
+                    min_time,
+                )
+                for layout in LAYOUTS
+            }
+            for name, sql in QUERIES.items()
+        }
+
+    print(f"  {posts} posts: {sizes['inline'] / 1024:.0f} KiB -> {sizes['tiered'] / 1024:.0f} KiB "
+          f"(bodies {inline_bodies / 1024:.0f} KiB -> {stored_bodies / 1024:.0f} KiB)")
+    for name, result in queries.items():
+        print(f"  {name:<16} p50 {result['inline']['p50_ms']:>8.3f} -> {result['tiered']['p50_ms']:>8.3f} ms")
+    return {
+        "posts": posts,
+        "bytes": sizes,
+        "body_bytes": {"inline": inline_bodies, "tiered": stored_bodies},
+        "queries": queries,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare inline and compressed blog body storage")
+    parser.add_argument("--db", required=True, help="Database created by benchmarks.seed")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds to spend on each case")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.db, args.min_time), indent=2))
+
+if __name__ == "__main__":
+    main()
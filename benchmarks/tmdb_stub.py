@@ -0,0 +1,62 @@
+"""
+Minimal stand-in for the TMDB API so load tests never touch the network.
+
+Serves /search/multi and /movie|tv/{id} with canned payloads after a fixed delay.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+class StubHandler(BaseHTTPRequestHandler):
+    delay = 0.02
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        time.sleep(self.delay)
+        if parsed.path.endswith("/search/multi"):
+            query = parse_qs(parsed.query).get("query", [""])[0]
+            payload = {
+                "results": [
+                    {
+                        "id": 900_000 + index,
+                        "media_type": "movie" if index % 3 else "tv",
+                        "title": f"{query.title()} {index}",
+                        "name": f"{query.title()} {index}",
+                        "release_date": f"{2000 + index}-05-01",
+                        "overview": "A synthetic result served by the benchmark stub.",
+                        "poster_path": f"/stub{index}.jpg",
+                        "vote_average": 7.1,
+                    }
+                    for index in range(20)
+                ]
+            }
+        else:
+            tmdb_id = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+            payload = {
+                "id": int(tmdb_id) if tmdb_id.isdigit() else 0,
+                "title": "Stub Title",
+                "release_date": "2020-01-01",
+                "overview": "Stub overview.",
+                "genres": [{"name": "Drama"}],
+                "runtime": 120,
+                "vote_average": 7.4,
+                "poster_path": "/stub.jpg",
+            }
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start(port: int = 0, delay: float = 0.02) -> ThreadingHTTPServer:
+    """Start the stub in a daemon thread and return the server (``server.server_port``)."""
+    StubHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
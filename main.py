@@ -1,68 +1,99 @@
 from fastapi import FastAPI, Depends, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import PlainTextResponse, Response
 from app.routers.auth import get_current_username
-from app.routers import items
+from app.routers import analytics, auth, dedupe, feed, items, recommendations
+from app.services import changes, feeds, maintenance, metrics, pages, prioritizer, sessions, title_index
+from app.services.assets import StaticAssets
+from app.services.pages import templates
+from app.services.settings import settings
 
 app = FastAPI()
+app.add_middleware(sessions.SessionCookieMiddleware)
 
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
-templates = Jinja2Templates(directory="app/templates")
+if metrics.ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
 
+    @app.get("/metrics", include_in_schema=False)
+    def metrics_endpoint():
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+app.mount("/static", StaticAssets(directory="app/static"), name="static")
+
+app.include_router(auth.router, prefix="/api", tags=["auth"])
 app.include_router(items.router, prefix="/api", tags=["items"])
+app.include_router(recommendations.router, prefix="/api", tags=["recommendations"])
+app.include_router(feed.router, prefix="/api", tags=["changes"])
+app.include_router(analytics.router, prefix="/api", tags=["analytics"])
+app.include_router(dedupe.router, prefix="/api", tags=["dedupe"])
 
 @app.on_event("startup")
 def startup():
     items.init_db()
+    changes.prune()
+    title_index.init_index()
+    pages.load_templates()
+    # Proximity depends on today's date; refreshing off the startup path lets
+    # the first request in without waiting for it.
+    prioritizer.schedule_refresh()
+    if settings.maintenance_enabled:
+        maintenance.scheduler.start()
+
+@app.on_event("shutdown")
+def shutdown():
+    maintenance.scheduler.stop()
 
 @app.get("/")
 def read_root(request: Request):
-    watched_list = items.get_watched_list()
-    want_to_watch_list = items.get_want_to_watch_list()
-    watched_ids = [item["id"] for item in watched_list]
-    blog_map = items.get_blog_slug_map(watched_ids)
-    for item in watched_list:
-        item["blog_slug"] = blog_map.get(item["id"])
-    watched_count = len(watched_list)
-    planned_count = len(want_to_watch_list)
-    watched_avg_score = (
-        sum(item.get("score", 0) for item in watched_list) / watched_count
-        if watched_count
-        else 0
-    )
-    planned_avg_excitement = (
-        sum(item.get("excitement", 0) for item in want_to_watch_list) / planned_count
-        if planned_count
-        else 0
-    )
-    return templates.TemplateResponse(
-        request,
-        "index.html",
-        {
-            "watched_list": watched_list,
-            "want_to_watch_list": want_to_watch_list,
-            "watched_count": watched_count,
-            "planned_count": planned_count,
-            "watched_avg_score": round(watched_avg_score, 1),
-            "planned_avg_excitement": round(planned_avg_excitement, 1)
-        }
-    )
+    return templates.TemplateResponse(request, "index.html", pages.home_context())
 
 @app.get("/blog")
 def blog(request: Request):
-    posts = items.get_blog_posts()
-    return templates.TemplateResponse(request, "blog.html", {"posts": posts})
+    return blog_page(request, pages.blog_context())
+
+@app.get("/blog/page/{page:int}")
+def blog_archive_page(request: Request, page: int):
+    return blog_page(request, pages.blog_context(page))
+
+@app.get("/blog/{year:int}/{month:int}")
+def blog_month(request: Request, year: int, month: int):
+    return blog_page(request, pages.blog_context(1, f"{year:04d}-{month:02d}"))
+
+@app.get("/blog/{year:int}/{month:int}/page/{page:int}")
+def blog_month_page(request: Request, year: int, month: int, page: int):
+    return blog_page(request, pages.blog_context(page, f"{year:04d}-{month:02d}"))
+
+def blog_page(request: Request, context):
+    if context is None:
+        return templates.TemplateResponse(request, "blog.html", {"posts": []}, status_code=404)
+    return templates.TemplateResponse(request, "blog.html", context)
+
+# Feed routes are registered before /blog/{slug} so "rss.xml" is never taken for a slug.
+@app.get("/blog/rss.xml")
+def blog_rss(request: Request):
+    return feed_response(request, "rss.xml")
+
+@app.get("/blog/atom.xml")
+def blog_atom(request: Request):
+    return feed_response(request, "atom.xml")
+
+@app.get("/blog/{kind}/{slug}/{name}")
+def blog_tag_feed(request: Request, kind: str, slug: str, name: str):
+    if kind not in ("type", "genre"):
+        return PlainTextResponse("Not found", status_code=404)
+    return feed_response(request, name, kind, slug)
+
+def feed_response(request: Request, name: str, kind=None, slug=None):
+    feed = feeds.render_feed(name, kind, slug)
+    if feed is None:
+        return PlainTextResponse("Feed not found", status_code=404)
+    headers = {"ETag": feed["etag"], "Last-Modified": feed["last_modified"], "Cache-Control": "public, max-age=300"}
+    if feeds.not_modified(request.headers, feed):
+        return Response(status_code=304, headers=headers)
+    return Response(feed["body"], media_type=feed["media_type"], headers=headers)
 
 @app.get("/top")
 def top_list(request: Request):
-    all_top = items.get_top_list()
-    top_ids = [item["id"] for item in all_top]
-    blog_map = items.get_blog_slug_map(top_ids)
-    for item in all_top:
-        item["blog_slug"] = blog_map.get(item["id"])
-    top_movies = [item for item in all_top if item["content_type"] == "Movie"]
-    top_series = [item for item in all_top if item["content_type"] == "TV Series"]
-    return templates.TemplateResponse(request, "top.html", {"top_movies": top_movies, "top_series": top_series})
+    return templates.TemplateResponse(request, "top.html", pages.top_context())
 
 @app.get("/secure")
 def read_secure(username: str = Depends(get_current_username)):
@@ -94,7 +125,7 @@ def crm_top(request: Request):
 
 @app.get("/blog/{slug}")
 def blog_post(request: Request, slug: str):
-    post = items.get_blog_post_by_slug(slug)
-    if not post:
+    context = pages.blog_post_context(slug)
+    if not context:
         return templates.TemplateResponse(request, "blog_post.html", {"post": None}, status_code=404)
-    return templates.TemplateResponse(request, "blog_post.html", {"post": post})
+    return templates.TemplateResponse(request, "blog_post.html", context)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Management commands for Movie Ranker.
+
+Usage:
+    python manage.py build-static --out dist --base-url https://example.com
+    python manage.py load-tmdb-export movie_ids_01_31_2026.json.gz --media-type movie
+    python manage.py hash-password
+    python manage.py serve --workers auto
+    python manage.py backup --keep 7
+    python manage.py maintenance run
+    python manage.py compile-templates
+"""
+import argparse
+import getpass
+import os
+import sys
+
+def build_static(args: argparse.Namespace) -> int:
+    from app.routers import items
+    from app.services.static_site import build_static as run_build
+
+    items.init_db()
+    from app.services.settings import settings
+
+    base_url = args.base_url or settings.site_url
+    result = run_build(args.out, base_url=base_url, force=args.force, include_static=not args.no_static)
+    print(f"Rendered {len(result['rendered'])} page(s), {result['unchanged']} unchanged, "
+          f"{len(result['removed'])} removed, {result['static_copied']} static file(s) copied")
+    for url_path in result["rendered"]:
+        print(f"   + {url_path}")
+    for url_path in result["removed"]:
+        print(f"   - {url_path}")
+    return 0
+
+def load_tmdb_export(args: argparse.Namespace) -> int:
+    from app.services import title_index
+
+    loaded = title_index.load_export(args.path, args.media_type)
+    print(f"Loaded {loaded} {args.media_type} title(s) into {title_index.INDEX_PATH}")
+    return 0
+
+def hash_password(args: argparse.Namespace) -> int:
+    from app.services.sessions import hash_password as make_hash
+
+    password = getpass.getpass("Password: ")
+    if not password or password != getpass.getpass("Repeat password: "):
+        print("Passwords are empty or do not match", file=sys.stderr)
+        return 1
+    print(f"BASIC_AUTH_PASSWORD_HASH={make_hash(password)}")
+    return 0
+
+def available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def serve(args: argparse.Namespace) -> int:
+    import uvicorn
+    from app.routers import items
+    from app.services import pages, title_index
+
+    workers = available_cores() if args.workers == "auto" else int(args.workers)
+    # Migrate once here so the workers all find the schema current and skip DDL,
+    # and compile the templates so they only load them from the bytecode cache.
+    items.init_db()
+    title_index.init_index()
+    pages.load_templates()
+    print(f"Serving on http://{args.host}:{args.port} with {workers} worker(s)")
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        access_log=args.access_log,
+        proxy_headers=True,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+    )
+    return 0
+
+def backup(args: argparse.Namespace) -> int:
+    from app.services import maintenance
+
+    result = maintenance.backup(args.out, keep=args.keep, pages=args.pages, pause=args.pause)
+    print(f"Backed up {result['pages']} page(s) to {result['path']} ({result['bytes']} bytes, "
+          f"{result['steps']} step(s), {result['restarts']} restart(s))")
+    for path in result["removed"]:
+        print(f"   - {path}")
+    return 0
+
+def run_maintenance(args: argparse.Namespace) -> int:
+    from app.routers import items
+    from app.services import maintenance
+
+    items.init_db()
+    if args.action == "report":
+        report = maintenance.report()
+        for name, value in report["database"].items():
+            print(f"{name:>16}: {value}")
+        for task in report["tasks"]:
+            print(f"{task['task']:>16}: {task['last_status'] or 'never run'} "
+                  f"{(task['last_seconds'] or 0) * 1000:.1f} ms at {task['last_started_at'] or '-'}")
+        return 0
+    if args.action == "compact":
+        result = maintenance.compact()
+        print(f"Compacted {result['pages_before']} -> {result['pages_after']} page(s)")
+        return 0
+    unknown = [name for name in args.tasks if name not in maintenance.TASKS]
+    if unknown:
+        print(f"Unknown task(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    failed = 0
+    for name in args.tasks or maintenance.TASKS:
+        result = maintenance.run_task(name, thorough=args.thorough)
+        detail = ", ".join(f"{key}={value}" for key, value in result.items() if key not in ("task", "status", "seconds"))
+        print(f"{name:>16}: {result['status']:<6} {result['seconds'] * 1000:8.1f} ms  {detail}")
+        failed += result["status"] != "ok"
+    return 1 if failed else 0
+
+def run_analytics(args: argparse.Namespace) -> int:
+    from app.routers import items
+    from app.services import analytics
+
+    items.init_db()
+    if args.action == "rebuild":
+        print(f"Rebuilt {analytics.rebuild()} rollup row(s)")
+        return 0
+    drift = analytics.check()
+    for key, stored, expected in drift[:20]:
+        print(f"  {' / '.join(map(str, key))}: stored {stored}, expected {expected}")
+    print(f"{len(drift)} rollup row(s) out of date" if drift else "Rollups match watched")
+    return 1 if drift else 0
+
+def find_duplicates(args: argparse.Namespace) -> int:
+    from app.routers import items
+    from app.services import dedupe
+
+    items.init_db()
+    result = dedupe.scan(args.threshold)
+    for cluster in result["clusters"][:args.limit]:
+        print(", ".join(f"{reason} {value:g}" for reason, value in cluster["reasons"].items()))
+        for index, item in enumerate(cluster["items"]):
+            season = f" S{item['season']}" if item["season"] else ""
+            year = f" ({item['release_year']})" if item["release_year"] else ""
+            print(f"  {'*' if index == 0 else ' '} {item['table']} #{item['id']}: {item['title']}{season}{year}")
+    print(f"{len(result['clusters'])} cluster(s) among {result['titles']} titles "
+          f"({result['candidates']} LSH candidates, {result['seconds']:.3f}s); * = suggested keep")
+    return 1 if result["clusters"] else 0
+
+def compile_templates(args: argparse.Namespace) -> int:
+    from app.services import pages
+    from app.services.settings import settings
+
+    result = pages.load_templates(clear=args.clear)
+    print(f"Compiled {result['templates']} template(s) into {settings.template_cache_dir} in {result['seconds']:.3f}s")
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="manage.py", description="Movie Ranker management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    static_parser = subparsers.add_parser("build-static", help="Render the public pages to static HTML")
+    static_parser.add_argument("--out", default="dist", help="Output directory (default: dist)")
+    static_parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Absolute site URL used in sitemap.xml (default: $SITE_URL)",
+    )
+    static_parser.add_argument("--force", action="store_true", help="Re-render every page")
+    static_parser.add_argument("--no-static", action="store_true", help="Skip copying app/static")
+    static_parser.set_defaults(handler=build_static)
+
+    export_parser = subparsers.add_parser(
+        "load-tmdb-export", help="Load a TMDB daily ID export into the local title index"
+    )
+    export_parser.add_argument("path", help="Path to movie_ids_*.json.gz / tv_series_ids_*.json.gz (or plain JSON lines)")
+    export_parser.add_argument("--media-type", choices=["movie", "tv"], required=True)
+    export_parser.set_defaults(handler=load_tmdb_export)
+
+    hash_parser = subparsers.add_parser(
+        "hash-password", help="Print a BASIC_AUTH_PASSWORD_HASH value for app/.env"
+    )
+    hash_parser.set_defaults(handler=hash_password)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the app with one worker process per core")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument(
+        "--workers", default="auto", help="Worker processes, or 'auto' for one per available core (default)"
+    )
+    serve_parser.add_argument("--access-log", action="store_true", help="Enable uvicorn's access log")
+    serve_parser.add_argument(
+        "--forwarded-allow-ips", default="127.0.0.1", help="Proxies trusted for X-Forwarded-* headers"
+    )
+    serve_parser.set_defaults(handler=serve)
+
+    backup_parser = subparsers.add_parser("backup", help="Copy the live database with SQLite's online backup API")
+    backup_parser.add_argument("--out", default=None, help="Destination file (default: a timestamped file in $BACKUP_DIR)")
+    backup_parser.add_argument("--keep", type=int, default=None, help="Keep only the newest N timestamped backups")
+    backup_parser.add_argument("--pages", type=int, default=256, help="Pages copied per step (default: 256)")
+    backup_parser.add_argument("--pause", type=float, default=0.05, help="Seconds to pause between steps (default: 0.05)")
+    backup_parser.set_defaults(handler=backup)
+
+    maintenance_parser = subparsers.add_parser(
+        "maintenance", help="Run database maintenance now, show the last runs, or compact the file"
+    )
+    maintenance_parser.add_argument("action", choices=["run", "report", "compact"])
+    maintenance_parser.add_argument(
+        "tasks", nargs="*", help="Tasks for 'run': checkpoint, prune-changes, vacuum, optimize, integrity (default: all)"
+    )
+    maintenance_parser.add_argument(
+        "--thorough", action="store_true",
+        help="Full integrity_check, full ANALYZE, TRUNCATE checkpoint and unbounded vacuum",
+    )
+    maintenance_parser.set_defaults(handler=run_maintenance)
+
+    analytics_parser = subparsers.add_parser(
+        "analytics", help="Rebuild the watch-history rollups, or check them against a full recompute"
+    )
+    analytics_parser.add_argument("action", choices=["rebuild", "check"])
+    analytics_parser.set_defaults(handler=run_analytics)
+
+    dedupe_parser = subparsers.add_parser(
+        "dedupe", help="List clusters of duplicate titles across watched and want to watch"
+    )
+    dedupe_parser.add_argument("--threshold", type=float, default=0.8, help="Trigram similarity for near matches")
+    dedupe_parser.add_argument("--limit", type=int, default=None, help="Print at most this many clusters")
+    dedupe_parser.set_defaults(handler=find_duplicates)
+
+    compile_parser = subparsers.add_parser(
+        "compile-templates", help="Compile every template into the bytecode cache workers load at startup"
+    )
+    compile_parser.add_argument("--clear", action="store_true", help="Empty the cache and recompile everything")
+    compile_parser.set_defaults(handler=compile_templates)
+
+    args = parser.parse_args(argv)
+    from app.services.logs import configure_logging
+    from app.services.settings import settings
+
+    configure_logging(fmt=settings.log_format or "text")
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+import unittest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.services.assets import IMMUTABLE, StaticAssets, fingerprint
+
+app = FastAPI()
+app.mount("/static", StaticAssets(directory="app/static"), name="static")
+
+class StaticAssetsTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_current_version_is_immutable(self):
+        response = self.client.get(f"/static/js/markdown.js?v={fingerprint('js/markdown.js')}")
+        self.assertEqual(response.headers.get("cache-control"), IMMUTABLE)
+
+    def test_other_versions_revalidate(self):
+        for url in ("/static/js/markdown.js?v=000000000000", "/static/js/markdown.js?v=", "/static/js/markdown.js"):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.headers.get("cache-control"), IMMUTABLE)
+            self.assertIn("etag", response.headers)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+from app.routers import items
+
+class BlogExcerptTest(unittest.TestCase):
+    def test_markup_across_the_limit_is_not_left_open(self):
+        lead = "word " * 93
+        body = (
+            f"{lead}see [the **director's** cut](https://example.com/cut) and `make run`.\n\n"
+            "```python\nprint('never in an excerpt')\n```\n"
+        )
+        self.assertLess(len(lead), items.BLOG_EXCERPT_CHARS)
+        self.assertGreater(body.index("(https"), items.BLOG_EXCERPT_CHARS)
+
+        excerpt = items.blog_excerpt(body)
+
+        self.assertLessEqual(len(excerpt), items.BLOG_EXCERPT_CHARS)
+        self.assertEqual(excerpt, lead + "see the…")
+        for markup in ("[", "]", "(", "*", "`"):
+            self.assertNotIn(markup, excerpt)
+
+    def test_cut_prefers_a_paragraph_break(self):
+        body = "# Verdict\n\n" + "A " * 150 + "\n\n" + "_B_ " * 100
+        excerpt = items.blog_excerpt(body)
+        self.assertEqual(excerpt, "Verdict\n\n" + ("A " * 150).strip() + "…")
+
+    def test_short_body_is_kept_whole(self):
+        self.assertEqual(items.blog_excerpt("> A *great* film.\n"), "A great film.")
+
+    def test_init_db_rebuilds_raw_excerpts(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.addCleanup(setattr, items, "DB_PATH", items.DB_PATH)
+        items.DB_PATH = str(Path(scratch.name) / "app.db")
+        items.init_db()
+        with items.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO watched (title, comment, score, image_url, watch_date, content_type)
+                VALUES ('Heat', '', 9, '', '2024-01-01', 'Movie')
+                """
+            )
+            conn.execute(
+                "INSERT INTO blog_posts (watched_id, title, slug, excerpt, created_at) VALUES (1, 'Heat', 'heat', '**Heat', '2024-01-01')"
+            )
+            items.save_blog_body(conn, 1, "**Heat** holds up.")
+            conn.execute("PRAGMA user_version = 8")
+            conn.commit()
+        items.init_db()
+        with items.get_connection() as conn:
+            self.assertEqual(conn.execute("SELECT excerpt FROM blog_posts").fetchone()[0], "Heat holds up.")
+
+if __name__ == "__main__":
+    unittest.main()
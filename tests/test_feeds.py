@@ -0,0 +1,43 @@
+import tempfile
+import time
+import unittest
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from app.routers import items
+from app.services import feeds
+
+class FeedLastModifiedTest(unittest.TestCase):
+    def setUp(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.addCleanup(setattr, items, "DB_PATH", items.DB_PATH)
+        items.DB_PATH = str(Path(scratch.name) / "app.db")
+        items.init_db()
+        with items.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO watched (title, comment, score, image_url, watch_date, content_type)
+                VALUES ('Dune', '', 8, '', '2024-03-01', 'Movie')
+                """
+            )
+            for slug in ("old", "new"):
+                conn.execute(
+                    "INSERT INTO blog_posts (watched_id, title, slug, excerpt, created_at) VALUES (1, ?, ?, '', ?)",
+                    (slug, slug, "2024-03-02T10:00:00"),
+                )
+            conn.commit()
+
+    def test_deleting_a_post_moves_last_modified(self):
+        before = feeds.render_feed.__wrapped__("rss.xml")
+        time.sleep(1.1)
+        with items.get_connection() as conn:
+            conn.execute("DELETE FROM blog_posts WHERE slug = 'old'")
+            conn.commit()
+        after = feeds.render_feed.__wrapped__("rss.xml")
+        self.assertGreater(
+            parsedate_to_datetime(after["last_modified"]), parsedate_to_datetime(before["last_modified"])
+        )
+        self.assertFalse(feeds.not_modified({"if-modified-since": before["last_modified"]}, after))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from fastapi import HTTPException
+from app.models.models import Watched
+from app.routers import items
+
+def watched(**fields) -> Watched:
+    row = dict(
+        id=0, title="Arrival", comment="", score=8, image_url="", watch_date="2024-01-01",
+        content_type="Movie", tmdb_id=329865,
+    )
+    row.update(fields)
+    return Watched(**row)
+
+class UpdateWatchedTest(unittest.TestCase):
+    def setUp(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.addCleanup(setattr, items, "DB_PATH", items.DB_PATH)
+        items.DB_PATH = str(Path(scratch.name) / "app.db")
+        items.init_db()
+        with items.get_connection() as conn:
+            for title, tmdb_id in (("Arrival", 329865), ("Dune", 438631)):
+                conn.execute(
+                    """
+                    INSERT INTO watched (title, comment, score, image_url, watch_date, content_type, tmdb_id)
+                    VALUES (?, '', 8, '', '2024-01-01', 'Movie', ?)
+                    """,
+                    (title, tmdb_id),
+                )
+            conn.commit()
+
+    def test_season_is_dropped_for_anything_but_a_series(self):
+        items.update_watched_item(1, watched(season=2))
+        with items.get_connection() as conn:
+            self.assertIsNone(conn.execute("SELECT season FROM watched WHERE id = 1").fetchone()[0])
+
+    def test_unique_index_conflict_is_a_409(self):
+        # A concurrent write can land between the duplicate check and the UPDATE.
+        with mock.patch.object(items, "reject_duplicate"):
+            with self.assertRaises(HTTPException) as raised:
+                items.update_watched_item(2, watched(title="Dune"))
+        self.assertEqual(raised.exception.status_code, 409)
+
+if __name__ == "__main__":
+    unittest.main()
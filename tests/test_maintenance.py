@@ -0,0 +1,56 @@
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+from app.routers import items
+from app.services import maintenance
+
+class IncrementalVacuumTest(unittest.TestCase):
+    def setUp(self):
+        self.scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(self.scratch.cleanup)
+        self.db_path = str(Path(self.scratch.name) / "app.db")
+        self.addCleanup(setattr, items, "DB_PATH", items.DB_PATH)
+        items.DB_PATH = self.db_path
+        with closing(sqlite3.connect(self.db_path, isolation_level=None)) as conn:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("CREATE TABLE filler (data BLOB)")
+            conn.executemany("INSERT INTO filler VALUES (?)", ((b"x" * 4000,) for _ in range(500)))
+            conn.execute("DELETE FROM filler")
+
+    def free_pages(self) -> int:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            return conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def test_one_step_releases_a_full_batch(self):
+        free = self.free_pages()
+        self.assertGreater(free, 128)
+        result = maintenance.incremental_vacuum(pages=128, pause=0, max_steps=1)
+        self.assertEqual(result["steps"], 1)
+        self.assertEqual(result["released_pages"], min(128, free))
+        self.assertEqual(self.free_pages(), free - min(128, free))
+
+    def test_last_step_releases_what_is_left(self):
+        free = self.free_pages()
+        result = maintenance.incremental_vacuum(pages=free + 10, pause=0, max_steps=1)
+        self.assertEqual(result["released_pages"], free)
+        self.assertEqual(self.free_pages(), 0)
+
+class IntegrityCheckTest(unittest.TestCase):
+    def test_orphans_are_reported_but_not_a_failure(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.addCleanup(setattr, items, "DB_PATH", items.DB_PATH)
+        items.DB_PATH = str(Path(scratch.name) / "app.db")
+        with closing(sqlite3.connect(items.DB_PATH)) as conn:
+            conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+            conn.execute("CREATE TABLE child (id INTEGER PRIMARY KEY, parent_id INTEGER REFERENCES parent(id))")
+            conn.execute("INSERT INTO child (parent_id) VALUES (42)")
+            conn.commit()
+        result = maintenance.integrity_check()
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["foreign_key_violations"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
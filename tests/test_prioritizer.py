@@ -0,0 +1,71 @@
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+from app.routers import items
+from app.services import prioritizer
+
+class RefreshOnChangeTest(unittest.TestCase):
+    def setUp(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.addCleanup(setattr, items, "DB_PATH", items.DB_PATH)
+        items.DB_PATH = str(Path(scratch.name) / "app.db")
+        items.init_db()
+        with items.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO want_to_watch (title, image_url, launch_date, excitement, content_type, genres)
+                VALUES ('Arrival', '', '2030-01-01', 5, 'Movie', 'Drama, Science Fiction')
+                """
+            )
+            conn.commit()
+        prioritizer.refresh_priorities()
+
+    def priority(self) -> float:
+        with items.get_connection() as conn:
+            return conn.execute("SELECT priority FROM want_to_watch").fetchone()[0]
+
+    def test_watched_writes_rescore_the_queue_in_the_background(self):
+        before = self.priority()
+        with items.get_connection() as conn:
+            for score in (10, 2):
+                conn.execute(
+                    """
+                    INSERT INTO watched (title, comment, score, image_url, watch_date, content_type, genres)
+                    VALUES ('x', '', ?, '', '2024-01-01', 'Movie', ?)
+                    """,
+                    (score, "Science Fiction" if score == 10 else "Comedy"),
+                )
+            conn.commit()
+        callers = []
+        original = prioritizer.refresh_priorities
+
+        def recording_refresh(*args):
+            callers.append(threading.current_thread().name)
+            return original(*args)
+
+        prioritizer.refresh_priorities = recording_refresh
+        self.addCleanup(setattr, prioritizer, "refresh_priorities", original)
+        prioritizer.refresh_on_change("watched", "insert", 1)
+        deadline = time.monotonic() + 5
+        while self.priority() == before and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertGreater(self.priority(), before)
+        self.assertTrue(callers)
+        self.assertNotIn(threading.current_thread().name, callers)
+
+class DailyRescoreTest(unittest.TestCase):
+    def test_same_row_scores_differently_on_a_later_day(self):
+        row = {"excitement": 7, "tmdb_rating": 7.5, "genres": "Drama", "launch_date": "2030-03-01"}
+        early = prioritizer.score_rows([row], {}, today=date(2030, 1, 1))[0]
+        later = prioritizer.score_rows([row], {}, today=date(2030, 2, 20))[0]
+        self.assertGreater(later, early)
+
+    def test_refresher_wakes_at_midnight(self):
+        self.assertEqual(prioritizer.seconds_until_midnight(datetime(2030, 1, 1, 23, 0)), 3600.0)
+
+if __name__ == "__main__":
+    unittest.main()
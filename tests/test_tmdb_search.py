@@ -0,0 +1,57 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+from app.routers import items
+from app.services import title_index
+
+DUNE = {"id": 438631, "media_type": "movie", "title": "Dune", "release_date": "2021-09-15"}
+DUNE_PART_TWO = {"id": 693134, "media_type": "movie", "title": "Dune: Part Two", "release_date": "2024-02-27"}
+DUNE_SERIES = {"id": 90228, "media_type": "tv", "name": "Dune: Prophecy", "first_air_date": "2024-11-17"}
+
+def tmdb_response(*results):
+    return {"results": list(results)}
+
+class TmdbSearchTest(unittest.TestCase):
+    def setUp(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.addCleanup(setattr, title_index, "INDEX_PATH", title_index.INDEX_PATH)
+        title_index.INDEX_PATH = str(Path(scratch.name) / "tmdb_index.db")
+        title_index.init_index()
+
+    def search(self, query, response, media_type=None):
+        with mock.patch.object(items, "tmdb_request", return_value=response) as remote:
+            results = items.tmdb_search(query, media_type)
+        return [result["title"] for result in results], remote.call_count
+
+    def test_seen_titles_do_not_hide_other_matches(self):
+        self.search("Dune: Part Two", tmdb_response(DUNE_PART_TWO))
+        titles, calls = self.search("Dune", tmdb_response(DUNE, DUNE_PART_TWO))
+        self.assertEqual(calls, 1)
+        self.assertEqual(titles, ["Dune", "Dune: Part Two"])
+
+    def test_recent_query_is_replayed_locally(self):
+        self.search("Dune", tmdb_response(DUNE, DUNE_PART_TWO, DUNE_SERIES))
+        titles, calls = self.search("  dune ", tmdb_response())
+        self.assertEqual(calls, 0)
+        self.assertEqual(titles, ["Dune", "Dune: Part Two", "Dune: Prophecy"])
+        titles, calls = self.search("Dune", tmdb_response(), media_type="tv")
+        self.assertEqual((titles, calls), (["Dune: Prophecy"], 0))
+
+    def test_expired_query_asks_tmdb_again(self):
+        self.search("Dune", tmdb_response(DUNE))
+        with mock.patch.object(title_index.time, "time", return_value=time.time() + title_index.SEARCH_TTL + 1):
+            titles, calls = self.search("Dune", tmdb_response(DUNE, DUNE_PART_TWO))
+        self.assertEqual(calls, 1)
+        self.assertEqual(titles, ["Dune", "Dune: Part Two"])
+
+    def test_offline_falls_back_to_the_index(self):
+        self.search("Dune: Part Two", tmdb_response(DUNE_PART_TWO))
+        with mock.patch.object(items, "tmdb_request", side_effect=OSError("offline")):
+            results = items.tmdb_search("Dune")
+        self.assertEqual([result["title"] for result in results], ["Dune: Part Two"])
+
+if __name__ == "__main__":
+    unittest.main()